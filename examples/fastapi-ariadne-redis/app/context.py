@@ -0,0 +1,30 @@
+"""Per-request GraphQL context."""
+
+from dataclasses import dataclass, field
+
+from aiodataloader import DataLoader
+from starlette.requests import Request
+
+from app.loaders import batch_load_posts_by_author, batch_load_users
+from cacheql import CacheService
+
+
+@dataclass(slots=True)
+class RequestContext:
+    """
+    Context passed to every resolver as ``info.context``.
+
+    A slotted dataclass instead of a dict: resolvers read attributes
+    directly, and building one per request is cheaper than a dict.
+    Loaders are created fresh for each request because they memoize results.
+    """
+
+    request: Request
+    cache_service: CacheService
+    current_user_id: str | None = None
+    user_loader: DataLoader = field(
+        default_factory=lambda: DataLoader(batch_load_users)
+    )
+    user_posts_loader: DataLoader = field(
+        default_factory=lambda: DataLoader(batch_load_posts_by_author)
+    )
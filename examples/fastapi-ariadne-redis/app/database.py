@@ -24,73 +24,100 @@ def reset_call_count() -> None:
         call_count[key] = 0
 
 
-async def get_db() -> aiosqlite.Connection:
-    """Get database connection."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    db = await aiosqlite.connect(DB_PATH)
-    db.row_factory = aiosqlite.Row
-    return db
+def call_stats() -> dict[str, int]:
+    """Return the call counters using the GraphQL `DbStats` field names."""
+    return {
+        "getUsersCalls": call_count["get_users"],
+        "getUserCalls": call_count["get_user"],
+        "getPostsCalls": call_count["get_posts"],
+        "getPostCalls": call_count["get_post"],
+        "getUserPostsCalls": call_count["get_user_posts"],
+    }
+
+
+# Shared connection, opened once by init_db() and reused by every query
+_conn: aiosqlite.Connection | None = None
+
+
+def get_db() -> aiosqlite.Connection:
+    """Get the shared database connection."""
+    if _conn is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _conn
 
 
 async def init_db() -> None:
-    """Initialize the database with tables and sample data."""
-    db = await get_db()
-    try:
-        # Create tables
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                secret_note TEXT,
-                is_public_profile INTEGER NOT NULL DEFAULT 1,
-                created_at TEXT NOT NULL
-            )
-        """)
-
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS posts (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                author_id TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (author_id) REFERENCES users(id)
-            )
-        """)
-
-        # Check if we need to seed data
-        cursor = await db.execute("SELECT COUNT(*) FROM users")
-        count = (await cursor.fetchone())[0]
-
-        if count == 0:
-            # Seed users
-            users = [
-                ("1", "Alice", "alice@example.com", "Alice's secret note", 1, "2024-01-15T10:00:00Z"),
-                ("2", "Bob", "bob@example.com", "Bob's private thoughts", 0, "2024-02-20T14:30:00Z"),
-                ("3", "Charlie", "charlie@example.com", None, 1, "2024-03-10T09:15:00Z"),
-            ]
-            await db.executemany(
-                "INSERT INTO users (id, name, email, secret_note, is_public_profile, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-                users
-            )
-
-            # Seed posts
-            posts = [
-                ("101", "Introduction to GraphQL Caching", "GraphQL caching is essential for performance...", "1", "2024-03-01T12:00:00Z"),
-                ("102", "Apollo Cache Control Explained", "The @cacheControl directive allows fine-grained control...", "1", "2024-03-05T15:30:00Z"),
-                ("103", "Redis as a Cache Backend", "Redis provides excellent performance for distributed caching...", "2", "2024-03-10T09:00:00Z"),
-                ("104", "Best Practices for API Caching", "When implementing caching, consider TTL, invalidation...", "3", "2024-03-15T11:45:00Z"),
-            ]
-            await db.executemany(
-                "INSERT INTO posts (id, title, content, author_id, created_at) VALUES (?, ?, ?, ?, ?)",
-                posts
-            )
-
-            await db.commit()
-            print("[DB] Database initialized with sample data")
-    finally:
-        await db.close()
+    """Open the shared connection and seed tables with sample data."""
+    global _conn
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit mode; WAL lets reads proceed while a write is in progress
+    _conn = await aiosqlite.connect(DB_PATH, isolation_level=None)
+    _conn.row_factory = aiosqlite.Row
+    await _conn.execute("PRAGMA journal_mode=WAL")
+    await _conn.execute("PRAGMA synchronous=NORMAL")
+
+    db = _conn
+    # Create tables
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            secret_note TEXT,
+            is_public_profile INTEGER NOT NULL DEFAULT 1,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS posts (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            author_id TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (author_id) REFERENCES users(id)
+        )
+    """)
+
+    # Check if we need to seed data
+    cursor = await db.execute("SELECT COUNT(*) FROM users")
+    count = (await cursor.fetchone())[0]
+
+    if count == 0:
+        # Seed users
+        users = [
+            ("1", "Alice", "alice@example.com", "Alice's secret note", 1, "2024-01-15T10:00:00Z"),
+            ("2", "Bob", "bob@example.com", "Bob's private thoughts", 0, "2024-02-20T14:30:00Z"),
+            ("3", "Charlie", "charlie@example.com", None, 1, "2024-03-10T09:15:00Z"),
+        ]
+        await db.executemany(
+            "INSERT INTO users (id, name, email, secret_note, is_public_profile, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            users
+        )
+
+        # Seed posts
+        posts = [
+            ("101", "Introduction to GraphQL Caching", "GraphQL caching is essential for performance...", "1", "2024-03-01T12:00:00Z"),
+            ("102", "Apollo Cache Control Explained", "The @cacheControl directive allows fine-grained control...", "1", "2024-03-05T15:30:00Z"),
+            ("103", "Redis as a Cache Backend", "Redis provides excellent performance for distributed caching...", "2", "2024-03-10T09:00:00Z"),
+            ("104", "Best Practices for API Caching", "When implementing caching, consider TTL, invalidation...", "3", "2024-03-15T11:45:00Z"),
+        ]
+        await db.executemany(
+            "INSERT INTO posts (id, title, content, author_id, created_at) VALUES (?, ?, ?, ?, ?)",
+            posts
+        )
+
+        await db.commit()
+        print("[DB] Database initialized with sample data")
+
+
+async def close_db() -> None:
+    """Close the shared connection."""
+    global _conn
+    if _conn is not None:
+        await _conn.close()
+        _conn = None
 
 
 def _row_to_user(row: aiosqlite.Row) -> dict:
@@ -127,13 +154,10 @@ async def get_users() -> list[dict]:
     print(f"[DB] get_users called (total: {call_count['get_users']})")
     await simulate_latency(50)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM users")
+    db = get_db()
+    async with db.execute("SELECT * FROM users") as cursor:
         rows = await cursor.fetchall()
-        return [_row_to_user(row) for row in rows]
-    finally:
-        await db.close()
+    return [_row_to_user(row) for row in rows]
 
 
 async def get_user(user_id: str) -> dict | None:
@@ -142,14 +166,25 @@ async def get_user(user_id: str) -> dict | None:
     print(f"[DB] get_user({user_id}) called (total: {call_count['get_user']})")
     await simulate_latency(30)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
+    db = get_db()
+    async with db.execute("SELECT * FROM users WHERE id = ?", (user_id,)) as cursor:
         row = await cursor.fetchone()
-        return _row_to_user(row) if row else None
-    finally:
-        await db.close()
+    return _row_to_user(row) if row else None
+
 
+async def get_users_by_ids(user_ids: list[str]) -> list[dict]:
+    """Get several users by ID in a single query (used by the DataLoader)."""
+    call_count["get_user"] += 1
+    print(f"[DB] get_users_by_ids({user_ids}) called (total: {call_count['get_user']})")
+    await simulate_latency(30)
+
+    placeholders = ", ".join("?" for _ in user_ids)
+    db = get_db()
+    async with db.execute(
+        f"SELECT * FROM users WHERE id IN ({placeholders})", user_ids
+    ) as cursor:
+        rows = await cursor.fetchall()
+    return [_row_to_user(row) for row in rows]
 
 
 async def get_posts() -> list[dict]:
@@ -158,13 +193,10 @@ async def get_posts() -> list[dict]:
     print(f"[DB] get_posts called (total: {call_count['get_posts']})")
     await simulate_latency(50)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM posts")
+    db = get_db()
+    async with db.execute("SELECT * FROM posts") as cursor:
         rows = await cursor.fetchall()
-        return [_row_to_post(row) for row in rows]
-    finally:
-        await db.close()
+    return [_row_to_post(row) for row in rows]
 
 
 async def get_post(post_id: str) -> dict | None:
@@ -173,13 +205,10 @@ async def get_post(post_id: str) -> dict | None:
     print(f"[DB] get_post({post_id}) called (total: {call_count['get_post']})")
     await simulate_latency(30)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM posts WHERE id = ?", (post_id,))
+    db = get_db()
+    async with db.execute("SELECT * FROM posts WHERE id = ?", (post_id,)) as cursor:
         row = await cursor.fetchone()
-        return _row_to_post(row) if row else None
-    finally:
-        await db.close()
+    return _row_to_post(row) if row else None
 
 
 async def get_user_posts(user_id: str) -> list[dict]:
@@ -188,80 +217,83 @@ async def get_user_posts(user_id: str) -> list[dict]:
     print(f"[DB] get_user_posts({user_id}) called (total: {call_count['get_user_posts']})")
     await simulate_latency(40)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM posts WHERE author_id = ?", (user_id,))
+    db = get_db()
+    async with db.execute("SELECT * FROM posts WHERE author_id = ?", (user_id,)) as cursor:
+        rows = await cursor.fetchall()
+    return [_row_to_post(row) for row in rows]
+
+
+async def get_posts_by_author_ids(author_ids: list[str]) -> list[dict]:
+    """Get posts for several authors in a single query (used by the DataLoader)."""
+    call_count["get_user_posts"] += 1
+    print(f"[DB] get_posts_by_author_ids({author_ids}) called (total: {call_count['get_user_posts']})")
+    await simulate_latency(40)
+
+    placeholders = ", ".join("?" for _ in author_ids)
+    db = get_db()
+    async with db.execute(
+        f"SELECT * FROM posts WHERE author_id IN ({placeholders})", author_ids
+    ) as cursor:
         rows = await cursor.fetchall()
-        return [_row_to_post(row) for row in rows]
-    finally:
-        await db.close()
+    return [_row_to_post(row) for row in rows]
 
 
 async def update_user(user_id: str, **kwargs) -> dict | None:
     """Update a user."""
     print(f"[DB] update_user({user_id}, {kwargs})")
 
-    db = await get_db()
-    try:
-        # Build update query dynamically
-        updates = []
-        values = []
-        for key, value in kwargs.items():
-            if value is not None:
-                updates.append(f"{key} = ?")
-                values.append(value)
-
-        if not updates:
-            return await get_user(user_id)
-
-        values.append(user_id)
-        query = f"UPDATE users SET {', '.join(updates)} WHERE id = ?"
-        await db.execute(query, values)
-        await db.commit()
+    db = get_db()
+    # Build update query dynamically
+    updates = []
+    values = []
+    for key, value in kwargs.items():
+        if value is not None:
+            updates.append(f"{key} = ?")
+            values.append(value)
 
+    if not updates:
         return await get_user(user_id)
-    finally:
-        await db.close()
+
+    values.append(user_id)
+    query = f"UPDATE users SET {', '.join(updates)} WHERE id = ?"
+    await db.execute(query, values)
+    await db.commit()
+
+    return await get_user(user_id)
 
 
 async def create_post(title: str, content: str, author_id: str) -> dict:
     """Create a new post."""
     print(f"[DB] create_post(title={title}, author_id={author_id})")
 
-    db = await get_db()
-    try:
-        # Get next ID
-        cursor = await db.execute("SELECT MAX(CAST(id AS INTEGER)) FROM posts")
+    db = get_db()
+    # Get next ID
+    async with db.execute("SELECT MAX(CAST(id AS INTEGER)) FROM posts") as cursor:
         max_id = (await cursor.fetchone())[0] or 0
-        post_id = str(max_id + 1)
+    post_id = str(max_id + 1)
 
-        created_at = datetime.utcnow().isoformat() + "Z"
+    created_at = datetime.utcnow().isoformat() + "Z"
 
-        await db.execute(
-            "INSERT INTO posts (id, title, content, author_id, created_at) VALUES (?, ?, ?, ?, ?)",
-            (post_id, title, content, author_id, created_at)
-        )
-        await db.commit()
+    await db.execute(
+        "INSERT INTO posts (id, title, content, author_id, created_at) VALUES (?, ?, ?, ?, ?)",
+        (post_id, title, content, author_id, created_at)
+    )
+    await db.commit()
 
-        return {
-            "id": post_id,
-            "title": title,
-            "content": content,
-            "author_id": author_id,
-            "created_at": created_at,
-        }
-    finally:
-        await db.close()
+    return {
+        "id": post_id,
+        "title": title,
+        "content": content,
+        "author_id": author_id,
+        "created_at": created_at,
+    }
 
 
 async def delete_post(post_id: str) -> bool:
     """Delete a post."""
     print(f"[DB] delete_post({post_id})")
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("DELETE FROM posts WHERE id = ?", (post_id,))
-        await db.commit()
-        return cursor.rowcount > 0
-    finally:
-        await db.close()
+    db = get_db()
+    cursor = await db.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+    await db.commit()
+    return cursor.rowcount > 0
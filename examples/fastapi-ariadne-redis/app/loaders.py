@@ -0,0 +1,19 @@
+"""Per-request DataLoaders that batch N+1 lookups into single queries."""
+
+from app import database as db
+
+
+async def batch_load_users(user_ids: list[str]) -> list[dict | None]:
+    """Load users for all requested IDs, returned in input order."""
+    users = await db.get_users_by_ids(list(user_ids))
+    by_id = {user["id"]: user for user in users}
+    return [by_id.get(user_id) for user_id in user_ids]
+
+
+async def batch_load_posts_by_author(author_ids: list[str]) -> list[list[dict]]:
+    """Load posts grouped by author, returned in input order."""
+    posts = await db.get_posts_by_author_ids(list(author_ids))
+    by_author: dict[str, list[dict]] = {author_id: [] for author_id in author_ids}
+    for post in posts:
+        by_author[post["author_id"]].append(post)
+    return [by_author[author_id] for author_id in author_ids]
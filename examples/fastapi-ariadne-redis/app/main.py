@@ -1,24 +1,27 @@
 """FastAPI + Ariadne + cacheql example."""
 
 import os
+import re
 from contextlib import asynccontextmanager
 from typing import Any
 
+import xxhash
 from ariadne import make_executable_schema
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
 
+from app.context import RequestContext
 from app.resolvers import resolvers
 from app.schema import TYPE_DEFS
 from app import database as db
 
-from cacheql import CacheConfig, CacheService, DefaultKeyBuilder, JsonSerializer
+from cacheql import CacheConfig, CacheService, DefaultKeyBuilder, OrjsonSerializer
 from cacheql.adapters.ariadne import CachingGraphQL
+from cacheql.utils import xxhash_value
 from cacheql_redis import RedisCacheBackend
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 
 # Cache setup
@@ -35,12 +38,13 @@ cache_config = CacheConfig(
 cache_backend = RedisCacheBackend(
     redis_url=REDIS_URL,
     key_prefix="cacheql:example",
+    max_connections=REDIS_MAX_CONNECTIONS,
 )
 
 cache_service = CacheService(
     backend=cache_backend,
-    key_builder=DefaultKeyBuilder(),
-    serializer=JsonSerializer(),
+    key_builder=DefaultKeyBuilder(hash_func=xxhash_value),
+    serializer=OrjsonSerializer(),
     config=cache_config,
 )
 
@@ -55,6 +59,8 @@ async def lifespan(app: FastAPI):
     yield
     print("[SHUTDOWN] Closing Redis connection")
     await cache_backend.close()
+    print("[SHUTDOWN] Closing SQLite connection")
+    await db.close_db()
 
 
 app = FastAPI(
@@ -73,46 +79,149 @@ app.add_middleware(
 )
 
 
-class CacheControlMiddleware(BaseHTTPMiddleware):
-    """Adds Cache-Control and X-Cache headers to responses."""
+def _etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if if_none_match.strip() == b"*":
+        return True
+    return any(
+        candidate.strip().removeprefix(b"W/") == etag
+        for candidate in if_none_match.split(b",")
+    )
+
+
+class CacheControlMiddleware:
+    """
+    Adds Cache-Control, X-Cache and ETag headers to responses.
+
+    Plain ASGI middleware: it wraps ``send`` and edits the
+    ``http.response.start`` message in place, so there is no per-request
+    task or memory stream as with ``BaseHTTPMiddleware``. The GraphQL
+    handler leaves its decisions in ``scope["state"]`` (``request.state``).
+
+    GET queries get a strong ETag derived from the response body, so CDNs
+    and browsers can revalidate with If-None-Match and receive a bodyless
+    304 when the data has not changed. Hashing the body (instead of the
+    cache key) keeps the ETag correct after a mutation invalidates the
+    cached entry.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Shared with request.state downstream, so handler writes are visible
+        state = scope.setdefault("state", {})
+        is_get = scope["method"] == "GET"
+        start_message = None
+        body_parts: list[bytes] = []
+
+        async def send_with_headers(message) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                cache_header = state.get("cache_control_header")
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", [])
+                    if not (cache_header and name.lower() == b"cache-control")
+                ]
+                if cache_header:
+                    headers.append((b"cache-control", cache_header.encode()))
+                if state.get("cache_hit", False):
+                    headers.append((b"x-cache", b"HIT"))
+                message = {**message, "headers": headers}
+
+                if (
+                    is_get
+                    and message["status"] == 200
+                    and cache_header != "no-store"
+                ):
+                    # Hold the start message until the body can be hashed
+                    start_message = message
+                    return
+                await send(message)
+                return
+
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = b'"%s"' % xxhash.xxh3_64_hexdigest(body).encode()
+            headers = [
+                (name, value)
+                for name, value in start_message["headers"]
+                if name.lower() != b"etag"
+            ]
+            headers.append((b"etag", etag))
+
+            if_none_match = _request_header(scope, b"if-none-match")
+            if if_none_match is not None and _etag_matches(if_none_match, etag):
+                headers = [
+                    (name, value)
+                    for name, value in headers
+                    if name.lower() not in (b"content-length", b"content-type")
+                ]
+                await send({**start_message, "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_headers)
+
+
+def _request_header(scope, name: bytes) -> bytes | None:
+    """Return the first raw request header with the given lowercase name."""
+    for header_name, value in scope["headers"]:
+        if header_name == name:
+            return value
+    return None
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
 
-        cache_header = getattr(request.state, "cache_control_header", None)
-        if cache_header:
-            response.headers["Cache-Control"] = cache_header
+app.add_middleware(CacheControlMiddleware)
 
-        if getattr(request.state, "cache_hit", False):
-            response.headers["X-Cache"] = "HIT"
 
-        return response
+_BEARER_USER_PREFIX = b"Bearer user-"
 
 
-app.add_middleware(CacheControlMiddleware)
+def get_context_value(request: Request) -> RequestContext:
+    # Scan the raw ASGI header bytes: no header dict, no full-value decode
+    current_user_id = None
+    for name, value in request.headers.raw:
+        if name == b"authorization":
+            if value.startswith(_BEARER_USER_PREFIX):
+                current_user_id = value[len(_BEARER_USER_PREFIX):].decode("latin-1")
+            break
 
+    return RequestContext(
+        request=request,
+        cache_service=cache_service,
+        current_user_id=current_user_id,
+    )
 
-def get_context_value(request: Request) -> dict[str, Any]:
-    auth = request.headers.get("Authorization", "")
-    current_user_id = None
-    if auth.startswith("Bearer user-"):
-        current_user_id = auth.removeprefix("Bearer user-")
 
-    return {
-        "request": request,
-        "cache_service": cache_service,
-        "current_user_id": current_user_id,
-    }
+# Fields whose presence disables response caching (debug and introspection).
+# Compiled once so every request is a single pass over the query text.
+_SKIP_CACHE_RE = re.compile(r"dbStats|resetDbStats|__schema")
 
 
 def should_cache(data: dict[str, Any]) -> bool:
-    """Skip caching for debug queries."""
-    query = data.get("query", "")
-    return "dbStats" not in query
+    """Skip caching for debug and introspection queries."""
+    return _SKIP_CACHE_RE.search(data.get("query", "")) is None
 
 
-def get_session_id(context_value: dict) -> str | None:
-    return context_value.get("current_user_id")
+def get_session_id(context_value: RequestContext) -> str | None:
+    return context_value.current_user_id
 
 
 graphql_app = CachingGraphQL(
@@ -125,7 +234,11 @@ graphql_app = CachingGraphQL(
     execute_get_queries=True,
 )
 
-app.mount("/graphql", graphql_app)
+
+# A plain route (not a Mount) so /graphql is dispatched directly, without
+# a sub-application scope rewrite; the GraphQL app is an ASGI app, which
+# Starlette's Route calls as-is.
+app.add_route("/graphql", graphql_app, methods=["GET", "POST"])
 
 
 @app.get("/health")
@@ -162,6 +275,28 @@ async def clear_cache():
     return {"status": "cleared"}
 
 
+@app.get("/_stats")
+async def db_stats():
+    """Database call counters without a GraphQL round-trip (same as `dbStats`)."""
+    return db.call_stats()
+
+
+@app.post("/_stats/reset")
+async def reset_db_stats():
+    """Reset the database call counters (same as `resetDbStats`)."""
+    db.reset_call_count()
+    return {"status": "reset"}
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop and httptools come with uvicorn[standard]; the file watcher
+    # is opt-in so benchmarks are not run under --reload
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=os.getenv("RELOAD", "false").lower() == "true",
+    )
@@ -53,7 +53,7 @@ async def resolve_me(_, info):
     Cache hint is set via @cacheControl directive (60s, PRIVATE).
     Requires "Authorization: Bearer user-{id}" header.
     """
-    current_user_id = info.context.get("current_user_id")
+    current_user_id = info.context.current_user_id
     if not current_user_id:
         return None
     return await db.get_user(current_user_id)
@@ -85,13 +85,7 @@ async def resolve_db_stats(_, info):
     # Explicitly disable caching (also set in schema)
     no_cache(info)
 
-    return {
-        "getUsersCalls": db.call_count["get_users"],
-        "getUserCalls": db.call_count["get_user"],
-        "getPostsCalls": db.call_count["get_posts"],
-        "getPostCalls": db.call_count["get_post"],
-        "getUserPostsCalls": db.call_count["get_user_posts"],
-    }
+    return db.call_stats()
 
 
 # =============================================================================
@@ -114,7 +108,7 @@ async def resolve_update_user(_, info, id: str, name: str = None, email: str = N
         return None
 
     # Get cache service from context to invalidate cache
-    cache_service = info.context.get("cache_service")
+    cache_service = info.context.cache_service
     if cache_service:
         # Invalidate caches related to this user
         await cache_service.invalidate(["User", f"User:{id}"])
@@ -133,7 +127,7 @@ async def resolve_create_post(_, info, title: str, content: str, authorId: str):
     post = await db.create_post(title=title, content=content, author_id=authorId)
 
     # Invalidate caches
-    cache_service = info.context.get("cache_service")
+    cache_service = info.context.cache_service
     if cache_service:
         await cache_service.invalidate(["Post", f"User:{authorId}:posts"])
         print(f"[CACHE] Invalidated Post caches")
@@ -153,7 +147,7 @@ async def resolve_delete_post(_, info, id: str):
     deleted = await db.delete_post(id)
 
     if deleted and post:
-        cache_service = info.context.get("cache_service")
+        cache_service = info.context.cache_service
         if cache_service:
             await cache_service.invalidate(["Post", f"Post:{id}"])
             print(f"[CACHE] Invalidated Post:{id} cache")
@@ -177,8 +171,8 @@ user_type = ObjectType("User")
 
 @user_type.field("posts")
 async def resolve_user_posts(user, info):
-    """Get posts for a user."""
-    return await db.get_user_posts(user["id"])
+    """Get posts for a user (batched across users by the DataLoader)."""
+    return await info.context.user_posts_loader.load(user["id"])
 
 
 @user_type.field("isPublicProfile")
@@ -209,8 +203,8 @@ post_type = ObjectType("Post")
 
 @post_type.field("author")
 async def resolve_post_author(post, info):
-    """Get the author of a post."""
-    return await db.get_user(post["author_id"])
+    """Get the author of a post (batched across posts by the DataLoader)."""
+    return await info.context.user_loader.load(post["author_id"])
 
 
 @post_type.field("createdAt")
@@ -0,0 +1,23 @@
+"""Per-request GraphQL context."""
+
+from dataclasses import dataclass
+
+from strawberry.dataloader import DataLoader
+from strawberry.fastapi import BaseContext
+
+from cacheql import CacheService
+
+
+@dataclass
+class RequestContext(BaseContext):
+    """
+    Context passed to every resolver as ``info.context``.
+
+    A dataclass instead of a dict: resolvers read attributes directly
+    instead of hashing string keys. GraphQLRouter fills in ``request``,
+    ``background_tasks`` and ``response`` from BaseContext.
+    """
+
+    cache_service: CacheService
+    user_loader: DataLoader
+    user_posts_loader: DataLoader
@@ -1,144 +1,257 @@
 """SQLite database for demonstration purposes."""
 
 import asyncio
-from datetime import datetime
+import logging
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
 from pathlib import Path
 
 import aiosqlite
 
+log = logging.getLogger(__name__)
+
 DB_PATH = Path(__file__).parent.parent / "data" / "app.db"
+POOL_SIZE = 8
+
+# Artificial per-query delay that makes cache hits obvious in the demo.
+# Off by default so timings reflect the real database cost.
+SIMULATE_LATENCY = os.getenv("SIMULATE_LATENCY", "false").lower() == "true"
+
+# Upper bound on "?" parameters per statement (SQLITE_MAX_VARIABLE_NUMBER
+# defaults to 999 on SQLite builds older than 3.32)
+MAX_IN_PARAMS = 999
+
 
-call_count: dict[str, int] = {
-    "get_users": 0,
-    "get_user": 0,
-    "get_posts": 0,
-    "get_post": 0,
-    "get_user_posts": 0,
-}
+@dataclass(slots=True)
+class CallCount:
+    """Number of calls per read query, bumped by plain attribute stores."""
+
+    get_users: int = 0
+    get_user: int = 0
+    get_posts: int = 0
+    get_post: int = 0
+    get_user_posts: int = 0
+
+
+call_count = CallCount()
 
 CURRENT_USER_ID = "1"
 
 
 def reset_call_count() -> None:
     """Reset the call counter."""
-    for key in call_count:
-        call_count[key] = 0
+    for field in fields(call_count):
+        setattr(call_count, field.name, 0)
+
+
+class SqlitePool:
+    """Fixed-size LIFO pool of aiosqlite connections.
+
+    Each aiosqlite connection runs its queries on its own thread, so
+    sibling resolvers holding different connections query SQLite
+    concurrently (WAL allows concurrent readers). LIFO hands out the most
+    recently used connection, whose page cache is warmest.
+    """
+
+    def __init__(self, path: Path, size: int = POOL_SIZE) -> None:
+        self._path = path
+        self._size = size
+        self._queue: asyncio.LifoQueue[aiosqlite.Connection] = asyncio.LifoQueue()
+        self._connections: list[aiosqlite.Connection] = []
+
+    async def open(self) -> None:
+        """Open every connection in the pool."""
+        for _ in range(self._size):
+            # Autocommit mode; WAL lets reads proceed while a write is in progress
+            conn = await aiosqlite.connect(self._path, isolation_level=None)
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute("PRAGMA synchronous=NORMAL")
+            await conn.execute("PRAGMA temp_store=MEMORY")
+            await conn.execute("PRAGMA cache_size=-64000")
+            # Writers on different connections wait for each other
+            await conn.execute("PRAGMA busy_timeout=5000")
+            self._connections.append(conn)
+            self._queue.put_nowait(conn)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection, waiting if all of them are in use."""
+        conn = await self._queue.get()
+        try:
+            yield conn
+        finally:
+            self._queue.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every connection in the pool."""
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+
+
+# Connection pool, opened once by init_db() and shared by every query
+_pool: SqlitePool | None = None
+
+
+def get_pool() -> SqlitePool:
+    """Get the shared connection pool."""
+    if _pool is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _pool
 
 
-async def get_db() -> aiosqlite.Connection:
-    """Get database connection."""
+async def init_db() -> None:
+    """Open the connection pool and seed tables with sample data."""
+    global _pool
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    db = await aiosqlite.connect(DB_PATH)
-    db.row_factory = aiosqlite.Row
-    return db
+    _pool = SqlitePool(DB_PATH)
+    await _pool.open()
+
+    async with _pool.acquire() as db:
+        await _create_tables(db)
+
+
+async def _create_tables(db: aiosqlite.Connection) -> None:
+    """Create tables and insert sample data if the database is empty."""
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            secret_note TEXT,
+            is_public_profile INTEGER NOT NULL DEFAULT 1,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            author_id TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (author_id) REFERENCES users(id)
+        )
+    """)
+
+    # get_user_posts / get_posts_by_author_ids filter by author; newest-first
+    # listings can walk the created_at index instead of sorting
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_author_id ON posts(author_id)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts(created_at DESC)"
+    )
+
+    async with db.execute("SELECT COUNT(*) FROM users") as cursor:
+        count = (await cursor.fetchone())[0]
 
+    if count == 0:
+        users = [
+            (
+                "1", "Alice", "alice@example.com",
+                "Alice's secret note", 1, "2024-01-15T10:00:00Z"
+            ),
+            (
+                "2", "Bob", "bob@example.com",
+                "Bob's private thoughts", 0, "2024-02-20T14:30:00Z"
+            ),
+            (
+                "3", "Charlie", "charlie@example.com",
+                None, 1, "2024-03-10T09:15:00Z"
+            ),
+        ]
+        await db.executemany(
+            """INSERT INTO users
+               (id, name, email, secret_note, is_public_profile, created_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            users
+        )
+
+        posts = [
+            (
+                101, "Introduction to GraphQL Caching",
+                "GraphQL caching is essential for performance...",
+                "1", "2024-03-01T12:00:00Z"
+            ),
+            (
+                102, "Apollo Cache Control Explained",
+                "The @cacheControl directive allows fine-grained control...",
+                "1", "2024-03-05T15:30:00Z"
+            ),
+            (
+                103, "Redis as a Cache Backend",
+                "Redis provides excellent performance for distributed caching...",
+                "2", "2024-03-10T09:00:00Z"
+            ),
+            (
+                104, "Best Practices for API Caching",
+                "When implementing caching, consider TTL, invalidation...",
+                "3", "2024-03-15T11:45:00Z"
+            ),
+        ]
+        await db.executemany(
+            """INSERT INTO posts (id, title, content, author_id, created_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            posts
+        )
+
+        await db.commit()
+        log.info("[DB] Database initialized with sample data")
+
+
+async def close_db() -> None:
+    """Close the connection pool."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
 
-async def init_db() -> None:
-    """Initialize the database with tables and sample data."""
-    db = await get_db()
-    try:
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                secret_note TEXT,
-                is_public_profile INTEGER NOT NULL DEFAULT 1,
-                created_at TEXT NOT NULL
-            )
-        """)
-
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS posts (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                author_id TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (author_id) REFERENCES users(id)
-            )
-        """)
-
-        cursor = await db.execute("SELECT COUNT(*) FROM users")
-        count = (await cursor.fetchone())[0]
 
-        if count == 0:
-            users = [
-                (
-                    "1", "Alice", "alice@example.com",
-                    "Alice's secret note", 1, "2024-01-15T10:00:00Z"
-                ),
-                (
-                    "2", "Bob", "bob@example.com",
-                    "Bob's private thoughts", 0, "2024-02-20T14:30:00Z"
-                ),
-                (
-                    "3", "Charlie", "charlie@example.com",
-                    None, 1, "2024-03-10T09:15:00Z"
-                ),
-            ]
-            await db.executemany(
-                """INSERT INTO users
-                   (id, name, email, secret_note, is_public_profile, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                users
-            )
-
-            posts = [
-                (
-                    "101", "Introduction to GraphQL Caching",
-                    "GraphQL caching is essential for performance...",
-                    "1", "2024-03-01T12:00:00Z"
-                ),
-                (
-                    "102", "Apollo Cache Control Explained",
-                    "The @cacheControl directive allows fine-grained control...",
-                    "1", "2024-03-05T15:30:00Z"
-                ),
-                (
-                    "103", "Redis as a Cache Backend",
-                    "Redis provides excellent performance for distributed caching...",
-                    "2", "2024-03-10T09:00:00Z"
-                ),
-                (
-                    "104", "Best Practices for API Caching",
-                    "When implementing caching, consider TTL, invalidation...",
-                    "3", "2024-03-15T11:45:00Z"
-                ),
-            ]
-            await db.executemany(
-                """INSERT INTO posts (id, title, content, author_id, created_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                posts
-            )
-
-            await db.commit()
-            print("[DB] Database initialized with sample data")
-    finally:
-        await db.close()
-
-
-def _row_to_user(row: aiosqlite.Row) -> dict:
+# Columns selected for users and posts, in the order _row_to_* expects
+_USER_COLUMNS = (
+    "id", "name", "email", "secret_note", "is_public_profile", "created_at"
+)
+_POST_COLUMNS = ("id", "title", "content", "author_id", "created_at")
+
+# Fixed statement texts: sqlite3 keeps a per-connection cache of prepared
+# statements keyed by SQL text, so reusing the same strings on the pooled
+# connections skips re-parsing. Explicit columns pin the row layout.
+_SELECT_USERS = f"SELECT {', '.join(_USER_COLUMNS)} FROM users"
+_SELECT_USER = f"{_SELECT_USERS} WHERE id = ?"
+_SELECT_POSTS = f"SELECT {', '.join(_POST_COLUMNS)} FROM posts"
+_SELECT_POST = f"{_SELECT_POSTS} WHERE id = ?"
+_SELECT_USER_POSTS = f"{_SELECT_POSTS} WHERE author_id = ?"
+
+
+def _row_to_user(row: tuple) -> dict:
     """Convert a database row to a user dict."""
-    return {
-        "id": row["id"],
-        "name": row["name"],
-        "email": row["email"],
-        "secret_note": row["secret_note"],
-        "is_public_profile": bool(row["is_public_profile"]),
-        "created_at": row["created_at"],
-    }
+    user = dict(zip(_USER_COLUMNS, row, strict=True))
+    user["is_public_profile"] = bool(user["is_public_profile"])
+    return user
 
 
-def _row_to_post(row: aiosqlite.Row) -> dict:
-    """Convert a database row to a post dict."""
-    return {
-        "id": row["id"],
-        "title": row["title"],
-        "content": row["content"],
-        "author_id": row["author_id"],
-        "created_at": row["created_at"],
-    }
+def _row_to_post(row: tuple) -> dict:
+    """Convert a database row to a post dict (ids are exposed as strings)."""
+    post = dict(zip(_POST_COLUMNS, row, strict=True))
+    post["id"] = str(post["id"])
+    return post
+
+
+async def _fetchall(sql: str, params: tuple = ()) -> list[tuple]:
+    """Run a read query on a pooled connection and return every row."""
+    async with get_pool().acquire() as db, db.execute(sql, params) as cursor:
+        return await cursor.fetchall()
+
+
+async def _fetchone(sql: str, params: tuple = ()) -> tuple | None:
+    """Run a read query on a pooled connection and return the first row."""
+    async with get_pool().acquire() as db, db.execute(sql, params) as cursor:
+        return await cursor.fetchone()
 
 
 async def simulate_latency(ms: int = 100) -> None:
@@ -148,32 +261,45 @@ async def simulate_latency(ms: int = 100) -> None:
 
 async def get_users() -> list[dict]:
     """Get all users."""
-    call_count["get_users"] += 1
-    print(f"[DB] get_users called (total: {call_count['get_users']})")
-    await simulate_latency(50)
+    call_count.get_users += 1
+    log.debug("[DB] get_users called (total: %s)", call_count.get_users)
+    if SIMULATE_LATENCY:
+        await simulate_latency(50)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM users")
-        rows = await cursor.fetchall()
-        return [_row_to_user(row) for row in rows]
-    finally:
-        await db.close()
+    rows = await _fetchall(_SELECT_USERS)
+    return [_row_to_user(row) for row in rows]
 
 
 async def get_user(user_id: str) -> dict | None:
     """Get a user by ID."""
-    call_count["get_user"] += 1
-    print(f"[DB] get_user({user_id}) called (total: {call_count['get_user']})")
-    await simulate_latency(30)
+    call_count.get_user += 1
+    log.debug("[DB] get_user(%s) called (total: %s)", user_id, call_count.get_user)
+    if SIMULATE_LATENCY:
+        await simulate_latency(30)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        row = await cursor.fetchone()
-        return _row_to_user(row) if row else None
-    finally:
-        await db.close()
+    row = await _fetchone(_SELECT_USER, (user_id,))
+    return _row_to_user(row) if row else None
+
+
+async def get_users_by_ids(user_ids: list[str]) -> list[dict]:
+    """Get several users by ID in a single query (used by the DataLoader).
+
+    All IDs go into one parameterized ``IN`` statement, so SQLite prepares
+    and steps a single statement regardless of the batch size. At most
+    MAX_IN_PARAMS IDs may be passed.
+    """
+    call_count.get_user += 1
+    log.debug(
+        "[DB] get_users_by_ids(%s) called (total: %s)", user_ids, call_count.get_user
+    )
+    if SIMULATE_LATENCY:
+        await simulate_latency(30)
+
+    placeholders = ",".join("?" * len(user_ids))
+    rows = await _fetchall(
+        f"{_SELECT_USERS} WHERE id IN ({placeholders})", tuple(user_ids)
+    )
+    return [_row_to_user(row) for row in rows]
 
 
 async def get_current_user() -> dict | None:
@@ -183,116 +309,120 @@ async def get_current_user() -> dict | None:
 
 async def get_posts() -> list[dict]:
     """Get all posts."""
-    call_count["get_posts"] += 1
-    print(f"[DB] get_posts called (total: {call_count['get_posts']})")
-    await simulate_latency(50)
+    call_count.get_posts += 1
+    log.debug("[DB] get_posts called (total: %s)", call_count.get_posts)
+    if SIMULATE_LATENCY:
+        await simulate_latency(50)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM posts")
-        rows = await cursor.fetchall()
-        return [_row_to_post(row) for row in rows]
-    finally:
-        await db.close()
+    rows = await _fetchall(_SELECT_POSTS)
+    return [_row_to_post(row) for row in rows]
 
 
 async def get_post(post_id: str) -> dict | None:
     """Get a post by ID."""
-    call_count["get_post"] += 1
-    print(f"[DB] get_post({post_id}) called (total: {call_count['get_post']})")
-    await simulate_latency(30)
+    call_count.get_post += 1
+    log.debug("[DB] get_post(%s) called (total: %s)", post_id, call_count.get_post)
+    if SIMULATE_LATENCY:
+        await simulate_latency(30)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT * FROM posts WHERE id = ?", (post_id,))
-        row = await cursor.fetchone()
-        return _row_to_post(row) if row else None
-    finally:
-        await db.close()
+    row = await _fetchone(_SELECT_POST, (post_id,))
+    return _row_to_post(row) if row else None
 
 
 async def get_user_posts(user_id: str) -> list[dict]:
     """Get all posts by a user."""
-    call_count["get_user_posts"] += 1
-    total = call_count['get_user_posts']
-    print(f"[DB] get_user_posts({user_id}) called (total: {total})")
-    await simulate_latency(40)
-
-    db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT * FROM posts WHERE author_id = ?", (user_id,)
-        )
-        rows = await cursor.fetchall()
-        return [_row_to_post(row) for row in rows]
-    finally:
-        await db.close()
+    call_count.get_user_posts += 1
+    log.debug(
+        "[DB] get_user_posts(%s) called (total: %s)",
+        user_id, call_count.get_user_posts,
+    )
+    if SIMULATE_LATENCY:
+        await simulate_latency(40)
+
+    rows = await _fetchall(_SELECT_USER_POSTS, (user_id,))
+    return [_row_to_post(row) for row in rows]
+
+
+async def get_posts_by_author_ids(author_ids: list[str]) -> list[dict]:
+    """Get posts for several authors in a single query (used by the DataLoader).
+
+    At most MAX_IN_PARAMS IDs may be passed.
+    """
+    call_count.get_user_posts += 1
+    log.debug(
+        "[DB] get_posts_by_author_ids(%s) called (total: %s)",
+        author_ids, call_count.get_user_posts,
+    )
+    if SIMULATE_LATENCY:
+        await simulate_latency(40)
+
+    placeholders = ",".join("?" * len(author_ids))
+    rows = await _fetchall(
+        f"{_SELECT_POSTS} WHERE author_id IN ({placeholders})", tuple(author_ids)
+    )
+    return [_row_to_post(row) for row in rows]
 
 
 async def update_user(user_id: str, **kwargs) -> dict | None:
     """Update a user."""
-    print(f"[DB] update_user({user_id}, {kwargs})")
-
-    db = await get_db()
-    try:
-        updates = []
-        values = []
-        for key, value in kwargs.items():
-            if value is not None:
-                updates.append(f"{key} = ?")
-                values.append(value)
-
-        if not updates:
-            return await get_user(user_id)
-
-        values.append(user_id)
-        query = f"UPDATE users SET {', '.join(updates)} WHERE id = ?"
+    log.debug("[DB] update_user(%s, %s)", user_id, kwargs)
+
+    updates = []
+    values = []
+    for key, value in kwargs.items():
+        if value is not None:
+            updates.append(f"{key} = ?")
+            values.append(value)
+
+    if not updates:
+        return await get_user(user_id)
+
+    values.append(user_id)
+    query = f"UPDATE users SET {', '.join(updates)} WHERE id = ?"
+    async with get_pool().acquire() as db:
         await db.execute(query, values)
         await db.commit()
 
-        return await get_user(user_id)
-    finally:
-        await db.close()
+    return await get_user(user_id)
 
 
 async def create_post(title: str, content: str, author_id: str) -> dict:
     """Create a new post."""
-    print(f"[DB] create_post(title={title}, author_id={author_id})")
+    log.debug("[DB] create_post(title=%s, author_id=%s)", title, author_id)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT MAX(CAST(id AS INTEGER)) FROM posts")
-        max_id = (await cursor.fetchone())[0] or 0
-        post_id = str(max_id + 1)
+    # Same second-precision UTC format as the seed data, without a datetime
+    created_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-        created_at = datetime.utcnow().isoformat() + "Z"
-
-        await db.execute(
-            """INSERT INTO posts (id, title, content, author_id, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (post_id, title, content, author_id, created_at)
+    async with get_pool().acquire() as db:
+        # SQLite assigns the id (INTEGER PRIMARY KEY), no MAX(id) scan needed
+        cursor = await db.execute(
+            """INSERT INTO posts (title, content, author_id, created_at)
+               VALUES (?, ?, ?, ?)""",
+            (title, content, author_id, created_at)
         )
         await db.commit()
 
-        return {
-            "id": post_id,
-            "title": title,
-            "content": content,
-            "author_id": author_id,
-            "created_at": created_at,
-        }
-    finally:
-        await db.close()
+    return {
+        "id": str(cursor.lastrowid),
+        "title": title,
+        "content": content,
+        "author_id": author_id,
+        "created_at": created_at,
+    }
 
 
-async def delete_post(post_id: str) -> bool:
-    """Delete a post."""
-    print(f"[DB] delete_post({post_id})")
+async def delete_post(post_id: str) -> dict | None:
+    """Delete a post, returning its id and author_id if it existed."""
+    log.debug("[DB] delete_post(%s)", post_id)
 
-    db = await get_db()
-    try:
-        cursor = await db.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+    async with get_pool().acquire() as db:
+        # RETURNING hands back the deleted row, so no prior SELECT is needed
+        cursor = await db.execute(
+            "DELETE FROM posts WHERE id = ? RETURNING id, author_id", (post_id,)
+        )
+        row = await cursor.fetchone()
         await db.commit()
-        return cursor.rowcount > 0
-    finally:
-        await db.close()
+
+    if row is None:
+        return None
+    return {"id": str(row[0]), "author_id": row[1]}
@@ -0,0 +1,91 @@
+"""Per-request DataLoaders that batch N+1 lookups into single queries.
+
+Rows are also cached in Redis by ID: a batch first reads every key with
+one MGET (via ``CacheService.load``), queries SQLite only for the misses,
+and writes those back with one pipelined ``set_many``. Keys embed the
+GraphQL type name, so the mutations' ``invalidate(["User", ...])`` and
+``invalidate(["Post", ...])`` calls drop them too.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from strawberry.dataloader import DataLoader
+
+from app import database as db
+from cacheql import CacheService
+
+# How long cached rows live; mutations invalidate them earlier
+ROW_CACHE_TTL = timedelta(seconds=60)
+
+
+async def _load_through_cache(
+    cache_service: CacheService,
+    keys: list[str],
+    ids: list[str],
+    fetch: Callable[[list[str]], Awaitable[list[Any]]],
+) -> list[Any]:
+    """Return cached values for ``keys`` and fetch the rest by ID."""
+    cached = await asyncio.gather(*(cache_service.load(key) for key in keys))
+    serializer = cache_service.serializer
+    results = [
+        serializer.deserialize(raw) if raw is not None else None for raw in cached
+    ]
+
+    missing = [i for i, raw in enumerate(cached) if raw is None]
+    if missing:
+        fetched = await fetch([ids[i] for i in missing])
+        for i, value in zip(missing, fetched, strict=True):
+            results[i] = value
+        await cache_service.store_many(
+            {keys[i]: value for i, value in zip(missing, fetched, strict=True)},
+            ttl=ROW_CACHE_TTL,
+        )
+    return results
+
+
+async def batch_load_users(user_ids: list[str]) -> list[dict | None]:
+    """Load users for all requested IDs, returned in input order."""
+    users = await db.get_users_by_ids(list(user_ids))
+    by_id = {user["id"]: user for user in users}
+    return [by_id.get(user_id) for user_id in user_ids]
+
+
+async def batch_load_posts_by_author(author_ids: list[str]) -> list[list[dict]]:
+    """Load posts grouped by author, returned in input order."""
+    posts = await db.get_posts_by_author_ids(list(author_ids))
+    by_author: dict[str, list[dict]] = {author_id: [] for author_id in author_ids}
+    for post in posts:
+        by_author[post["author_id"]].append(post)
+    return [by_author[author_id] for author_id in author_ids]
+
+
+def create_loaders(cache_service: CacheService) -> dict[str, DataLoader]:
+    """Create fresh loaders for one request (they memoize results).
+
+    Batches are capped so each one fits in a single ``IN (...)`` statement.
+    """
+    prefix = f"{cache_service.config.key_prefix}:row"
+
+    async def load_users(user_ids: list[str]) -> list[dict | None]:
+        keys = [f"{prefix}:User:{user_id}" for user_id in user_ids]
+        return await _load_through_cache(
+            cache_service, keys, user_ids, batch_load_users
+        )
+
+    async def load_posts_by_author(author_ids: list[str]) -> list[list[dict]]:
+        keys = [f"{prefix}:Post:author:{author_id}" for author_id in author_ids]
+        return await _load_through_cache(
+            cache_service, keys, author_ids, batch_load_posts_by_author
+        )
+
+    return {
+        "user_loader": DataLoader(
+            load_fn=load_users, max_batch_size=db.MAX_IN_PARAMS
+        ),
+        "user_posts_loader": DataLoader(
+            load_fn=load_posts_by_author, max_batch_size=db.MAX_IN_PARAMS
+        ),
+    }
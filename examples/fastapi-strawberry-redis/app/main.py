@@ -1,16 +1,18 @@
 """FastAPI + Strawberry + cacheql example."""
 
+import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Any
 
 import strawberry
 from cacheql_redis import RedisCacheBackend
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 
 from app import database as db
+from app.context import RequestContext
+from app.loaders import create_loaders
 from app.schema import Mutation, Query
 from cacheql import CacheConfig, CacheService, DefaultKeyBuilder, JsonSerializer
 from cacheql.adapters.strawberry import CacheExtension
@@ -18,6 +20,12 @@ from cacheql.adapters.strawberry import CacheExtension
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 
+# DB and cache traces are DEBUG records, so they cost nothing unless enabled
+logging.basicConfig(
+    level=logging.DEBUG if DEBUG else logging.INFO, format="%(message)s"
+)
+log = logging.getLogger(__name__)
+
 # Cache configuration
 cache_config = CacheConfig(
     enabled=True,
@@ -45,12 +53,16 @@ cache_service = CacheService(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    print("[STARTUP] Initializing SQLite database")
+    log.info("[STARTUP] Initializing SQLite database")
+    if db.SIMULATE_LATENCY:
+        log.info("[STARTUP] Simulating database latency (SIMULATE_LATENCY=true)")
     await db.init_db()
-    print(f"[STARTUP] Connecting to Redis at {REDIS_URL}")
+    log.info("[STARTUP] Connecting to Redis at %s", REDIS_URL)
     yield
-    print("[SHUTDOWN] Closing Redis connection")
+    log.info("[SHUTDOWN] Closing Redis connection")
     await cache_backend.close()
+    log.info("[SHUTDOWN] Closing SQLite connection")
+    await db.close_db()
 
 
 app = FastAPI(
@@ -69,12 +81,9 @@ app.add_middleware(
 )
 
 
-async def get_context(request: Request) -> dict[str, Any]:
-    """Get GraphQL context with cache service."""
-    return {
-        "request": request,
-        "cache_service": cache_service,
-    }
+async def get_context() -> RequestContext:
+    """Get GraphQL context with cache service and per-request loaders."""
+    return RequestContext(cache_service=cache_service, **create_loaders(cache_service))
 
 
 # Create cache extension
@@ -135,4 +144,13 @@ async def clear_cache():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop and httptools come with uvicorn[standard]; the file watcher
+    # is opt-in so benchmarks are not run under --reload
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=os.getenv("RELOAD", "false").lower() == "true",
+    )
@@ -1,12 +1,16 @@
 """Strawberry GraphQL schema with cache hints."""
 
 
+import logging
+
 import strawberry
 from strawberry.types import Info
 
 from app import database as db
 from cacheql.hints import no_cache, private_cache, set_cache_hint
 
+log = logging.getLogger(__name__)
+
 
 @strawberry.type
 class User:
@@ -20,9 +24,9 @@ class User:
     created_at: str = ""
 
     @strawberry.field
-    async def posts(self) -> list["Post"]:
-        """Get posts by this user."""
-        posts_data = await db.get_user_posts(self.id)
+    async def posts(self, info: Info) -> list["Post"]:
+        """Get posts by this user (batched per request)."""
+        posts_data = await info.context.user_posts_loader.load(str(self.id))
         return [Post.from_dict(p) for p in posts_data]
 
     @classmethod
@@ -49,9 +53,9 @@ class Post:
     created_at: str = ""
 
     @strawberry.field
-    async def author(self) -> User | None:
-        """Get the post author."""
-        user_data = await db.get_user(self.author_id)
+    async def author(self, info: Info) -> User | None:
+        """Get the post author (batched per request)."""
+        user_data = await info.context.user_loader.load(self.author_id)
         return User.from_dict(user_data) if user_data else None
 
     @classmethod
@@ -129,11 +133,11 @@ class Query:
         """Get database call statistics. Never cached."""
         no_cache(info)
         return DbStats(
-            get_users_calls=db.call_count["get_users"],
-            get_user_calls=db.call_count["get_user"],
-            get_posts_calls=db.call_count["get_posts"],
-            get_post_calls=db.call_count["get_post"],
-            get_user_posts_calls=db.call_count["get_user_posts"],
+            get_users_calls=db.call_count.get_users,
+            get_user_calls=db.call_count.get_user,
+            get_posts_calls=db.call_count.get_posts,
+            get_post_calls=db.call_count.get_post,
+            get_user_posts_calls=db.call_count.get_user_posts,
         )
 
 
@@ -155,10 +159,8 @@ class Mutation:
             return None
 
         # Invalidate cache
-        cache_service = info.context.get("cache_service")
-        if cache_service:
-            await cache_service.invalidate(["User", f"User:{id}"])
-            print(f"[CACHE] Invalidated caches for User:{id}")
+        await info.context.cache_service.invalidate(["User", f"User:{id}"])
+        log.debug("[CACHE] Invalidated caches for User:%s", id)
 
         return User.from_dict(user_data)
 
@@ -176,26 +178,26 @@ class Mutation:
         )
 
         # Invalidate cache
-        cache_service = info.context.get("cache_service")
-        if cache_service:
-            await cache_service.invalidate(["Post", f"User:{author_id}:posts"])
-            print("[CACHE] Invalidated Post caches")
+        await info.context.cache_service.invalidate(
+            ["Post", f"User:{author_id}:posts"]
+        )
+        log.debug("[CACHE] Invalidated Post caches")
 
         return Post.from_dict(post_data)
 
     @strawberry.mutation
     async def delete_post(self, info: Info, id: strawberry.ID) -> bool:
         """Delete a post. Invalidates post caches."""
-        post_data = await db.get_post(str(id))
         deleted = await db.delete_post(str(id))
 
-        if deleted and post_data:
-            cache_service = info.context.get("cache_service")
-            if cache_service:
-                await cache_service.invalidate(["Post", f"Post:{id}"])
-                print(f"[CACHE] Invalidated Post:{id} cache")
+        if deleted:
+            author_id = deleted["author_id"]
+            await info.context.cache_service.invalidate(
+                ["Post", f"Post:{id}", f"User:{author_id}:posts"]
+            )
+            log.debug("[CACHE] Invalidated Post:%s cache", id)
 
-        return deleted
+        return deleted is not None
 
     @strawberry.mutation
     async def reset_db_stats(self) -> bool:
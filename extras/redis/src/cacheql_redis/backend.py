@@ -5,6 +5,12 @@ from typing import Optional
 
 import redis.asyncio as redis
 
+# Maximum number of keys per UNLINK command
+_UNLINK_CHUNK_SIZE = 512
+
+# COUNT hint for SCAN; larger pages mean fewer cursor round-trips
+_SCAN_COUNT = 500
+
 
 class RedisCacheBackend:
     """Redis cache backend for distributed deployments.
@@ -18,16 +24,33 @@ class RedisCacheBackend:
         redis_url: str = "redis://localhost:6379",
         key_prefix: str = "cacheql",
         default_ttl: Optional[int] = 300,
+        max_connections: Optional[int] = None,
     ) -> None:
         """Initialize the Redis cache backend.
 
+        A single connection pool is created here and shared by every
+        command issued through this backend. Values are returned as raw
+        bytes (no response decoding), and redis-py uses the hiredis parser
+        automatically when it is installed (``pip install cacheql[redis]``
+        includes it).
+
         Args:
             redis_url: Redis connection URL.
             key_prefix: Prefix for all cache keys.
             default_ttl: Default TTL in seconds.
+            max_connections: Maximum number of pooled connections.
+                If None, uses the redis-py default.
         """
-        self._redis: redis.Redis = redis.from_url(redis_url)  # type: ignore
+        self._pool: redis.ConnectionPool = redis.ConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            decode_responses=False,
+        )
+        self._redis: redis.Redis = redis.Redis(connection_pool=self._pool)
         self._key_prefix = key_prefix
+        # Precomputed once; redis-py sends bytes keys without re-encoding
+        self._prefix = f"{key_prefix}:"
+        self._prefix_bytes = self._prefix.encode()
         self._default_ttl = default_ttl
 
     async def get(self, key: str) -> Optional[bytes]:
@@ -41,6 +64,20 @@ class RedisCacheBackend:
         """
         return await self._redis.get(self._prefixed_key(key))
 
+    async def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        """Retrieve several cached values with a single MGET.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            The cached values in the same order as ``keys``, with None for
+            keys that are missing or expired.
+        """
+        if not keys:
+            return []
+        return await self._redis.mget([self._prefixed_key(key) for key in keys])
+
     async def set(
         self,
         key: str,
@@ -63,6 +100,29 @@ class RedisCacheBackend:
         else:
             await self._redis.set(prefixed_key, value)
 
+    async def set_many(
+        self,
+        items: dict[str, bytes],
+        ttl: Optional[timedelta] = None,
+    ) -> None:
+        """Store several values with one pipelined round-trip.
+
+        Args:
+            items: Mapping of cache key to value bytes.
+            ttl: Optional time-to-live. If None, uses default.
+        """
+        if not items:
+            return
+
+        seconds = int(ttl.total_seconds()) if ttl is not None else self._default_ttl
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                if seconds is not None:
+                    pipe.setex(self._prefixed_key(key), seconds, value)
+                else:
+                    pipe.set(self._prefixed_key(key), value)
+            await pipe.execute()
+
     async def delete(self, key: str) -> bool:
         """Delete cached value.
 
@@ -106,10 +166,63 @@ class RedisCacheBackend:
         """
         return await self._delete_by_pattern(pattern)
 
+    async def delete_patterns(self, patterns: list[str]) -> int:
+        """Delete keys matching any of the given patterns.
+
+        SCAN cursors for every pattern advance together in one pipeline
+        round-trip per step. Keys matched by a step are removed with UNLINK
+        (memory is reclaimed in the background) in chunks queued on the
+        next step's pipeline, so matches are never accumulated in memory.
+        Falls back to per-pattern deletion if the pipeline fails (e.g. on
+        proxies without pipeline support).
+
+        Args:
+            patterns: Redis glob patterns.
+
+        Returns:
+            Number of keys deleted.
+        """
+        if not patterns:
+            return 0
+
+        count = 0
+        cursors = dict.fromkeys(patterns, 0)
+        pending: list[bytes] = []
+
+        try:
+            while cursors or pending:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for start in range(0, len(pending), _UNLINK_CHUNK_SIZE):
+                        pipe.unlink(*pending[start:start + _UNLINK_CHUNK_SIZE])
+                    for pattern, cursor in cursors.items():
+                        pipe.scan(cursor, match=pattern, count=_SCAN_COUNT)
+                    results = await pipe.execute()
+
+                unlinks = -(-len(pending) // _UNLINK_CHUNK_SIZE)
+                count += sum(results[:unlinks])
+
+                # Overlapping patterns may match a key twice; UNLINK of an
+                # already removed key counts 0, so only dedupe per step.
+                found_keys: dict[bytes, None] = {}
+                next_cursors: dict[str, int] = {}
+                scans = results[unlinks:]
+                for pattern, (cursor, found) in zip(cursors, scans, strict=True):
+                    found_keys.update(dict.fromkeys(found))
+                    if cursor != 0:
+                        next_cursors[pattern] = cursor
+                cursors = next_cursors
+                pending = list(found_keys)
+        except redis.RedisError:
+            for pattern in patterns:
+                count += await self._delete_by_pattern(pattern)
+
+        return count
+
     async def _delete_by_pattern(self, pattern: str) -> int:
         """Delete keys matching a pattern using SCAN.
 
-        Uses SCAN instead of KEYS for production safety.
+        Uses SCAN instead of KEYS for production safety, and UNLINK so
+        Redis frees the memory in a background thread instead of blocking.
 
         Args:
             pattern: Redis glob pattern.
@@ -121,33 +234,38 @@ class RedisCacheBackend:
         cursor = 0
 
         while True:
-            cursor, keys = await self._redis.scan(cursor, match=pattern, count=100)
+            cursor, keys = await self._redis.scan(
+                cursor, match=pattern, count=_SCAN_COUNT
+            )
 
             if keys:
-                deleted = await self._redis.delete(*keys)
-                count += deleted
+                count += await self._redis.unlink(*keys)
 
             if cursor == 0:
                 break
 
         return count
 
-    def _prefixed_key(self, key: str) -> str:
+    def _prefixed_key(self, key: str) -> bytes:
         """Add prefix to key if not already present.
 
+        Keys built by ``CacheService`` already carry the configured prefix,
+        so they are only encoded; other keys get the precomputed prefix.
+
         Args:
             key: The cache key.
 
         Returns:
-            The key with prefix.
+            The encoded key with prefix.
         """
-        if key.startswith(f"{self._key_prefix}:"):
-            return key
-        return f"{self._key_prefix}:{key}"
+        if key.startswith(self._prefix):
+            return key.encode()
+        return self._prefix_bytes + key.encode()
 
     async def close(self) -> None:
-        """Close the Redis connection."""
-        await self._redis.close()
+        """Close the Redis client and disconnect the connection pool."""
+        await self._redis.aclose()
+        await self._pool.disconnect()
 
     async def __aenter__(self) -> "RedisCacheBackend":
         """Async context manager entry."""
@@ -95,6 +95,8 @@ from cacheql.infrastructure import (
     DefaultKeyBuilder,
     InMemoryCacheBackend,
     JsonSerializer,
+    OrjsonSerializer,
+    ZstdSerializer,
 )
 
 __version__ = "0.1.0"
@@ -131,6 +133,8 @@ __all__ = [
     "InMemoryCacheBackend",
     "DefaultKeyBuilder",
     "JsonSerializer",
+    "OrjsonSerializer",
+    "ZstdSerializer",
     # Decorators
     "cached",
     "invalidates",
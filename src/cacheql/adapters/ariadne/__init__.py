@@ -3,10 +3,12 @@
 from cacheql.adapters.ariadne.decorators import cached_resolver, invalidates_cache
 from cacheql.adapters.ariadne.graphql import CachingGraphQL
 from cacheql.adapters.ariadne.handler import CachingGraphQLHTTPHandler
+from cacheql.adapters.ariadne.query_cache import QueryDocumentCache
 
 __all__ = [
     "CachingGraphQL",
     "CachingGraphQLHTTPHandler",
+    "QueryDocumentCache",
     # Decorators for resolver-level caching
     "cached_resolver",
     "invalidates_cache",
@@ -11,6 +11,9 @@ from cacheql.infrastructure.key_builders.default import DefaultKeyBuilder
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# {arg_name} placeholders in custom keys and tags
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
 # Global cache service reference for decorators
 _cache_service: CacheService | None = None
 _key_builder: DefaultKeyBuilder | None = None
@@ -50,37 +53,44 @@ def cached_resolver(
     """
 
     def decorator(func: F) -> F:
+        # (func_name, type_name), resolved on the first call and reused
+        names: tuple[str, str] | None = None
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if _cache_service is None or _key_builder is None:
+            nonlocal names
+            # Read the module global once; reconfiguring still takes effect
+            # on the next call
+            service = _cache_service
+            if service is None or _key_builder is None:
                 # Cache not configured, execute directly
                 return await func(*args, **kwargs)
 
             # Build cache key
-            cache_key = _build_cache_key(func, args, kwargs, key)
+            if names is None:
+                names = (func.__name__, _get_type_name_from_func(func))
+            cache_key = _build_cache_key(*names, args, kwargs, key)
 
-            # Try to get from cache
-            cached_data = await _cache_service._backend.get(cache_key)
+            # Try to get from cache (batched with concurrent lookups)
+            cached_data = await service.load(cache_key)
             if cached_data is not None:
-                return _cache_service._serializer.deserialize(cached_data)
+                return service._serializer.deserialize(cached_data)
 
             # Execute resolver
             result = await func(*args, **kwargs)
 
-            # Cache result
-            effective_ttl = ttl or _cache_service.config.default_ttl
-            serialized = _cache_service._serializer.serialize(result)
-            await _cache_service._backend.set(cache_key, serialized, effective_ttl)
-
-            # Store tag mappings
+            # Cache result and its tag mappings in one backend batch
+            effective_ttl = ttl or service.config.default_ttl
+            items = {cache_key: service._serializer.serialize(result)}
             resolved_tags = _resolve_tags(tags, args, kwargs)
             if resolved_tags:
+                # Hoisted so each tag key is a plain concatenation
+                tag_key_prefix = f"{service.config.key_prefix}:tag:"
+                tag_key_suffix = ":" + cache_key
+                encoded_key = cache_key.encode()
                 for tag in resolved_tags:
-                    prefix = _cache_service.config.key_prefix
-                    tag_key = f"{prefix}:tag:{tag}:{cache_key}"
-                    await _cache_service._backend.set(
-                        tag_key, cache_key.encode(), effective_ttl
-                    )
+                    items[tag_key_prefix + tag + tag_key_suffix] = encoded_key
+            await service._set_many(items, effective_ttl)
 
             return result
 
@@ -126,7 +136,8 @@ def invalidates_cache(
 
 
 def _build_cache_key(
-    func: Callable[..., Any],
+    func_name: str,
+    type_name: str,
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
     custom_key: str | Callable[..., str] | None,
@@ -134,7 +145,8 @@ def _build_cache_key(
     """Build cache key for a resolver call.
 
     Args:
-        func: The resolver function.
+        func_name: The resolver function name.
+        type_name: The GraphQL type name of the resolver.
         args: Positional arguments.
         kwargs: Keyword arguments.
         custom_key: Custom key or key builder function.
@@ -151,9 +163,6 @@ def _build_cache_key(
         return _interpolate_string(custom_key, args, kwargs)
 
     # Build default key from function name and arguments
-    func_name = func.__name__
-    type_name = _get_type_name_from_func(func)
-
     return _key_builder.build_field_key(
         type_name=type_name,
         field_name=func_name,
@@ -201,12 +210,11 @@ def _resolve_tags(
     if not tags:
         return []
 
-    resolved: list[str] = []
-    for tag in tags:
-        resolved_tag = _interpolate_string(tag, args, kwargs)
-        resolved.append(resolved_tag)
-
-    return resolved
+    # Static tags (no placeholders) skip the interpolation call entirely
+    return [
+        _interpolate_string(tag, args, kwargs) if "{" in tag else tag
+        for tag in tags
+    ]
 
 
 def _interpolate_string(
@@ -224,8 +232,9 @@ def _interpolate_string(
     Returns:
         Interpolated string.
     """
-    # Find all {name} patterns
-    pattern = r"\{(\w+)\}"
+    if "{" not in template:
+        # Static tags such as "User" need no regex pass
+        return template
 
     def replacer(match: re.Match[str]) -> str:
         name = match.group(1)
@@ -233,4 +242,4 @@ def _interpolate_string(
             return str(kwargs[name])
         return match.group(0)  # Keep original if not found
 
-    return re.sub(pattern, replacer, template)
+    return _PLACEHOLDER_RE.sub(replacer, template)
@@ -6,6 +6,7 @@ from typing import Any
 from ariadne.asgi import GraphQL
 
 from cacheql.adapters.ariadne.handler import CachingGraphQLHTTPHandler
+from cacheql.adapters.ariadne.query_cache import QueryDocumentCache
 from cacheql.core.services.cache_service import CacheService
 
 
@@ -13,6 +14,10 @@ class CachingGraphQL(GraphQL):
     """Drop-in replacement for Ariadne's GraphQL with built-in caching.
 
     Automatically caches responses based on @cacheControl directives.
+    Parsed and validated query documents are memoized by query text, so
+    repeated operations skip parsing and validation. Pass
+    ``query_cache_size=0`` or a custom ``query_parser``/``query_validator``
+    to opt out.
 
     Example::
 
@@ -30,16 +35,27 @@ class CachingGraphQL(GraphQL):
         should_cache: Callable[[dict[str, Any]], bool] | None = None,
         session_id: Callable[[Any], str | None] | None = None,
         set_http_headers: bool = True,
+        background_writes: bool = False,
+        query_cache_size: int = 1024,
         **kwargs: Any,
     ) -> None:
         debug = kwargs.get("debug", False)
 
+        self._query_cache: QueryDocumentCache | None = None
+        if query_cache_size > 0:
+            self._query_cache = QueryDocumentCache(maxsize=query_cache_size)
+            if kwargs.get("query_parser") is None:
+                kwargs["query_parser"] = self._query_cache.parse
+            if kwargs.get("query_validator") is None:
+                kwargs["query_validator"] = self._query_cache.validate
+
         http_handler = CachingGraphQLHTTPHandler(
             cache_service=cache_service,
             schema=schema,
             should_cache=should_cache,
             session_id=session_id,
             set_http_headers=set_http_headers,
+            background_writes=background_writes,
             debug=debug,
         )
 
@@ -52,6 +68,10 @@ class CachingGraphQL(GraphQL):
     def cache_service(self) -> CacheService:
         return self._cache_service
 
+    @property
+    def query_cache(self) -> QueryDocumentCache | None:
+        return self._query_cache
+
     @property
     def cache_stats(self) -> dict[str, int]:
         return self._cache_service.stats
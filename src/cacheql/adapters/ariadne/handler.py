@@ -1,19 +1,109 @@
 """Caching HTTP handler for Ariadne GraphQL."""
 
+import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
 from datetime import timedelta
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from ariadne.asgi.handlers import GraphQLHTTPHandler
+from graphql import DocumentNode, OperationDefinitionNode, OperationType
+from starlette.responses import Response
 
 from cacheql.core.entities.cache_control import CacheScope, ResponseCachePolicy
+from cacheql.core.interfaces.serializer import ISerializer
 from cacheql.core.services.cache_control_calculator import CacheControlCalculator
 from cacheql.core.services.cache_service import CacheService
 from cacheql.core.services.directive_parser import DirectiveParser, SchemaDirectives
+from cacheql.infrastructure.serializers.json import JsonSerializer
+from cacheql.infrastructure.serializers.orjson import OrjsonSerializer
+from cacheql.utils.query import is_mutation_query
 
 logger = logging.getLogger(__name__)
 
+# Set while graphql_http_server handles a request, i.e. when the result of
+# execute_graphql_query goes straight to create_json_response
+_building_http_response: ContextVar[bool] = ContextVar(
+    "cacheql_building_http_response", default=False
+)
+
+
+# Policy of every response when nothing can make one cacheable
+_UNCACHEABLE_POLICY = ResponseCachePolicy(max_age=0, scope=CacheScope.PUBLIC)
+
+
+# Parsed @cacheControl directives per schema, shared by every handler built
+# for the same schema object and dropped when the schema is collected
+_schema_directives_cache: WeakKeyDictionary[Any, SchemaDirectives] = (
+    WeakKeyDictionary()
+)
+
+
+def _parse_schema_directives(schema: Any, default_max_age: int) -> SchemaDirectives:
+    """Return the schema's directives, parsing it only the first time."""
+    try:
+        directives = _schema_directives_cache.get(schema)
+    except TypeError:
+        # Not weak-referenceable or unhashable; parse without caching
+        return DirectiveParser(default_max_age=default_max_age).parse_schema(schema)
+
+    if directives is None:
+        parser = DirectiveParser(default_max_age=default_max_age)
+        directives = parser.parse_schema(schema)
+        _schema_directives_cache[schema] = directives
+    return directives
+
+
+def _is_mutation_document(
+    document: DocumentNode, operation_name: str | None
+) -> bool:
+    """Check whether the operation to execute in a parsed document is a mutation.
+
+    Args:
+        document: The parsed query document.
+        operation_name: The requested operation name, if any.
+
+    Returns:
+        True if the selected operation (or, without a name, any operation)
+        is a mutation.
+    """
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        if operation_name is not None and (
+            definition.name is None or definition.name.value != operation_name
+        ):
+            continue
+        if definition.operation is OperationType.MUTATION:
+            return True
+    return False
+
+
+class CachedJSONBody:
+    """Serialized JSON response body read from the cache.
+
+    Passed from ``execute_graphql_query`` to ``create_json_response`` on a
+    cache hit when the cache serializer writes UTF-8 JSON, so the stored
+    bytes become the HTTP response body as-is.
+    """
+
+    __slots__ = ("body",)
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+
+def _writes_http_json(serializer: ISerializer) -> bool:
+    """Check whether cached bytes can be used as an HTTP JSON body unchanged."""
+    if isinstance(serializer, OrjsonSerializer):
+        return True
+    return (
+        isinstance(serializer, JsonSerializer)
+        and serializer.encoding.lower().replace("_", "-") in ("utf-8", "utf8")
+    )
+
 
 class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
     """HTTP handler that adds response caching to Ariadne.
@@ -25,6 +115,15 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
     - PUBLIC responses are cached with a shared key (no session context).
     - PRIVATE responses are cached per-user using the session_id.
     - PRIVATE responses without a session_id are not cached.
+
+    When the cache service uses a JSON serializer (JsonSerializer with
+    UTF-8 or OrjsonSerializer), HTTP cache hits are sent as the stored
+    bytes without decoding and re-encoding the response. Direct calls to
+    ``execute_graphql_query`` still return the decoded dict.
+
+    With ``background_writes=True``, responses are stored in a background
+    task on a miss, so the client does not wait for the cache write.
+    Failed background writes are logged, not raised.
     """
 
     def __init__(
@@ -34,6 +133,7 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
         should_cache: Callable[[dict[str, Any]], bool] | None = None,
         session_id: Callable[[Any], str | None] | None = None,
         set_http_headers: bool = True,
+        background_writes: bool = False,
         debug: bool = False,
     ) -> None:
         super().__init__()
@@ -41,28 +141,63 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
         self._should_cache = should_cache
         self._session_id = session_id
         self._set_http_headers = set_http_headers
+        self._background_writes = background_writes
+        # Strong references; the event loop only keeps weak ones to tasks
+        self._pending_writes: set[asyncio.Task[Any]] = set()
         self._debug = debug
+        self._raw_hits = _writes_http_json(cache_service.serializer)
 
         self._schema_directives: SchemaDirectives | None = None
         if schema is not None:
-            parser = DirectiveParser(
-                default_max_age=cache_service.config.default_max_age
+            self._schema_directives = _parse_schema_directives(
+                schema, cache_service.config.default_max_age
             )
-            self._schema_directives = parser.parse_schema(schema)
 
         self._calculator = CacheControlCalculator(
             schema_directives=self._schema_directives,
             default_max_age=cache_service.config.default_max_age,
         )
+        # Without a default maxAge or any schema hint no response is ever
+        # cacheable, so the policy walk over each response is skipped
+        directives = self._schema_directives
+        self._never_cacheable = cache_service.config.default_max_age == 0 and (
+            directives is None
+            or not (directives.type_hints or directives.field_hints)
+        )
 
     def _get_session_id(self, context_value: Any) -> str | None:
         if self._session_id is None:
             return None
         return self._session_id(context_value)
 
-    def _log(self, message: str) -> None:
+    def _log(self, message: str, *args: Any) -> None:
+        # Formatting is deferred so nothing is built when debug is off
         if self._debug:
-            print(f"[CACHE] {message}")
+            print(f"[CACHE] {message % args if args else message}")
+
+    async def _write(self, write: Coroutine[Any, Any, Any]) -> None:
+        """Run a cache write now, or in the background if configured."""
+        if not self._background_writes:
+            await write
+            return
+
+        task = asyncio.create_task(write)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._write_done)
+
+    def _write_done(self, task: asyncio.Task[Any]) -> None:
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Background cache write failed", exc_info=task.exception()
+            )
+
+    async def graphql_http_server(self, request: Any) -> Response:
+        token = _building_http_response.set(True)
+        try:
+            return await super().graphql_http_server(request)
+        finally:
+            _building_http_response.reset(token)
 
     async def execute_graphql_query(
         self,
@@ -83,8 +218,14 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
         variables = data.get("variables")
         operation_name = data.get("operationName")
 
-        # Don't cache mutations
-        if query and query.strip().lower().startswith("mutation"):
+        # Don't cache mutations; an already parsed document is checked
+        # through its AST instead of scanning the query string
+        if query_document is not None:
+            is_mutation = _is_mutation_document(query_document, operation_name)
+        else:
+            is_mutation = bool(query) and is_mutation_query(query)
+
+        if is_mutation:
             self._log("Skipping cache for mutation")
             return await super().execute_graphql_query(
                 request, data,
@@ -92,6 +233,15 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
                 query_document=query_document,
             )
 
+        # Trivial queries are cheaper to execute than to look up and store
+        if len(query) < self._cache_service.config.min_query_length:
+            self._log("Skipping cache for short query")
+            return await super().execute_graphql_query(
+                request, data,
+                context_value=context_value,
+                query_document=query_document,
+            )
+
         # Check should_cache callback
         if self._should_cache and not self._should_cache(data):
             self._log("Skipping cache per should_cache callback")
@@ -101,32 +251,39 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
                 query_document=query_document,
             )
 
-        # Resolve context before cache lookup so session_id is available
-        if context_value is None:
-            context_value = await self.get_context_for_request(request, data)
+        # Resolve context before cache lookup only when session_id needs it;
+        # otherwise the base handler resolves it on a miss
+        sid: str | None = None
+        if self._session_id is not None:
+            if context_value is None:
+                context_value = await self.get_context_for_request(request, data)
+            sid = self._get_session_id(context_value)
+
+        # Keys are built once here and reused to store the response on a miss
+        build_key = self._cache_service.build_response_key
+        private_key: str | None = None
+        # Shared by the private lookup and store so it is built once
+        private_context = {"session_id": sid} if sid is not None else None
 
-        sid = self._get_session_id(context_value)
+        public_key = build_key(operation_name, query, variables, None)
 
-        # Dual lookup: try private key first (if sid), then public key
+        # Dual lookup: private and public keys are fetched in one backend
+        # call (a single MGET on Redis) and a private hit takes precedence
         if sid is not None:
-            cached = await self._cache_service.get_cached_response(
-                operation_name=operation_name,
-                query=query,
-                variables=variables,
-                context={"session_id": sid},
+            private_key = build_key(operation_name, query, variables, private_context)
+            cached, public_cached = await self._get_cached_many(
+                [private_key, public_key]
             )
             if cached is not None:
                 self._log("HIT (private)")
                 self._mark_cache_hit(request)
                 return True, cached
+            cached = public_cached
+        else:
+            cached = await self._get_cached(
+                operation_name, query, variables, None, public_key
+            )
 
-        # Try public key
-        cached = await self._cache_service.get_cached_response(
-            operation_name=operation_name,
-            query=query,
-            variables=variables,
-            context=None,
-        )
         if cached is not None:
             self._log("HIT (public)")
             self._mark_cache_hit(request)
@@ -142,43 +299,95 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
         # Cache successful responses (scope-aware)
         if success and isinstance(response, dict) and not response.get("errors"):
             response_data = response.get("data")
-            policy = self._calculator.calculate_policy(data=response_data)
+            policy = (
+                _UNCACHEABLE_POLICY
+                if self._never_cacheable
+                else self._calculator.calculate_policy(
+                    data=response_data, field_hints=False
+                )
+            )
 
             if policy.is_cacheable:
                 ttl = timedelta(seconds=policy.max_age)
 
-                if policy.scope == CacheScope.PRIVATE:
+                if policy.scope is CacheScope.PRIVATE:
                     if sid is not None:
-                        await self._cache_service.cache_response(
+                        await self._write(self._cache_service.cache_response(
                             operation_name=operation_name,
                             query=query,
                             variables=variables,
                             response=response,
                             ttl=ttl,
-                            context={"session_id": sid},
-                        )
-                        self._log(f"Cached private (TTL: {policy.max_age}s)")
+                            context=private_context,
+                            key=private_key,
+                        ))
+                        self._log("Cached private (TTL: %ss)", policy.max_age)
                     else:
                         logger.warning(
                             "PRIVATE response not cached: no session_id available"
                         )
                         self._log("Skipping cache: PRIVATE scope without session_id")
                 else:
-                    await self._cache_service.cache_response(
+                    await self._write(self._cache_service.cache_response(
                         operation_name=operation_name,
                         query=query,
                         variables=variables,
                         response=response,
                         ttl=ttl,
                         context=None,
-                    )
-                    self._log(f"Cached public (TTL: {policy.max_age}s)")
+                        key=public_key,
+                    ))
+                    self._log("Cached public (TTL: %ss)", policy.max_age)
 
             if self._set_http_headers:
                 self._set_cache_headers(request, policy)
 
         return success, response
 
+    async def create_json_response(
+        self,
+        request: Any,
+        result: Any,
+        success: bool,
+    ) -> Response:
+        if isinstance(result, CachedJSONBody):
+            return Response(result.body, media_type="application/json")
+        return await super().create_json_response(request, result, success)
+
+    async def _get_cached(
+        self,
+        operation_name: str | None,
+        query: str,
+        variables: dict[str, Any] | None,
+        context: dict[str, Any] | None,
+        key: str | None = None,
+    ) -> Any | None:
+        if self._raw_hits and _building_http_response.get():
+            body = await self._cache_service.get_cached_response_raw(
+                operation_name=operation_name,
+                query=query,
+                variables=variables,
+                context=context,
+                key=key,
+            )
+            return CachedJSONBody(body) if body is not None else None
+        return await self._cache_service.get_cached_response(
+            operation_name=operation_name,
+            query=query,
+            variables=variables,
+            context=context,
+            key=key,
+        )
+
+    async def _get_cached_many(self, keys: list[str]) -> list[Any | None]:
+        if self._raw_hits and _building_http_response.get():
+            bodies = await self._cache_service.get_cached_responses_raw(keys)
+            return [
+                CachedJSONBody(body) if body is not None else None
+                for body in bodies
+            ]
+        return await self._cache_service.get_cached_responses(keys)
+
     def _mark_cache_hit(self, request: Any) -> None:
         if hasattr(request, "state"):
             request.state.cache_hit = True
@@ -187,4 +396,4 @@ class CachingGraphQLHTTPHandler(GraphQLHTTPHandler):
         header = policy.to_http_header()
         if hasattr(request, "state"):
             request.state.cache_control_header = header
-        self._log(f"Cache-Control: {header}")
+        self._log("Cache-Control: %s", header)
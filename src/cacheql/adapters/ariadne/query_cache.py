@@ -0,0 +1,117 @@
+"""Memoized query parsing and validation for Ariadne."""
+
+from collections.abc import Collection
+from typing import Any
+
+from cachetools import LRUCache
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, parse, validate
+from graphql.validation import ASTValidationRule
+
+
+class QueryDocumentCache:
+    """LRU cache of parsed and validated GraphQL documents.
+
+    Exposes ``parse`` and ``validate`` callables matching Ariadne's
+    ``query_parser`` and ``query_validator`` options. Repeated query
+    strings reuse the same ``DocumentNode``, and validation results are
+    memoized per schema and document so identical requests skip both
+    the AST build and the validation rules.
+
+    Example::
+
+        query_cache = QueryDocumentCache(maxsize=1024)
+        app = GraphQL(
+            schema,
+            query_parser=query_cache.parse,
+            query_validator=query_cache.validate,
+        )
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize the query document cache.
+
+        Args:
+            maxsize: Maximum number of documents (and validation results)
+                to keep.
+        """
+        self._documents: LRUCache[str, DocumentNode] = LRUCache(maxsize=maxsize)
+        self._validations: LRUCache[
+            tuple[int, int, Any, int | None],
+            tuple[GraphQLSchema, DocumentNode, list[GraphQLError]],
+        ] = LRUCache(maxsize=maxsize)
+
+    def parse(self, context_value: Any, data: dict[str, Any]) -> DocumentNode:
+        """Parse the query in ``data``, reusing a cached document if present.
+
+        Args:
+            context_value: The GraphQL context (unused).
+            data: The GraphQL request payload.
+
+        Returns:
+            The parsed document.
+
+        Raises:
+            GraphQLError: If the query has syntax errors. Failures are not
+                cached.
+        """
+        query: str = data["query"]
+        document = self._documents.get(query)
+        if document is None:
+            document = parse(query)
+            self._documents[query] = document
+        return document
+
+    def validate(
+        self,
+        schema: GraphQLSchema,
+        document_ast: DocumentNode,
+        rules: Collection[type[ASTValidationRule]] | None = None,
+        max_errors: int | None = None,
+        type_info: Any = None,
+    ) -> list[GraphQLError]:
+        """Validate a document, reusing a cached result if present.
+
+        Results are keyed by schema and document identity, so rebuilding
+        the schema or evicting the document naturally misses the cache.
+
+        Args:
+            schema: The schema to validate against.
+            document_ast: The parsed document.
+            rules: Optional validation rules.
+            max_errors: Optional maximum number of errors to report.
+            type_info: Optional type info. Bypasses the cache when given.
+
+        Returns:
+            List of validation errors, empty if the document is valid.
+        """
+        if type_info is not None:
+            # Only accepted by graphql-core < 3.3
+            validate_kwargs: dict[str, Any] = {"type_info": type_info}
+            return validate(
+                schema, document_ast, rules=rules, max_errors=max_errors,
+                **validate_kwargs,
+            )
+
+        rules_key = tuple(rules) if rules is not None else None
+        key = (id(schema), id(document_ast), rules_key, max_errors)
+
+        cached = self._validations.get(key)
+        if (
+            cached is not None
+            and cached[0] is schema
+            and cached[1] is document_ast
+        ):
+            return list(cached[2])
+
+        errors = validate(schema, document_ast, rules=rules, max_errors=max_errors)
+        self._validations[key] = (schema, document_ast, errors)
+        return list(errors)
+
+    def clear(self) -> None:
+        """Drop all cached documents and validation results."""
+        self._documents.clear()
+        self._validations.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached documents."""
+        return len(self._documents)
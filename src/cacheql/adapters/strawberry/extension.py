@@ -1,19 +1,28 @@
 """Strawberry extension for GraphQL response caching."""
 
+import asyncio
+import contextlib
+import logging
 from collections.abc import AsyncIterator, Callable
 from typing import TYPE_CHECKING, Any
 
 from strawberry.extensions import SchemaExtension
+from strawberry.types.execution import ExecutionResult
+from strawberry.types.graphql import OperationType
 
 from cacheql.core.services.cache_service import CacheService
+from cacheql.utils.query import is_mutation_query
 
 if TYPE_CHECKING:
     from strawberry.types import ExecutionContext
 
+logger = logging.getLogger(__name__)
+
 
 def CacheExtension(  # noqa: N802 - PascalCase intentional for class factory
     cache_service: CacheService,
     should_cache: Callable[["ExecutionContext"], bool] | None = None,
+    background_writes: bool = False,
 ) -> type[SchemaExtension]:
     """Create a Strawberry cache extension configured with the given service.
 
@@ -21,6 +30,9 @@ def CacheExtension(  # noqa: N802 - PascalCase intentional for class factory
         cache_service: The cache service to use.
         should_cache: Optional callback to determine if a request should
             be cached. Receives the execution context and returns True/False.
+        background_writes: Store responses in a background task so the
+            operation does not wait for the cache write. Failed writes
+            are logged, not raised.
 
     Returns:
         A configured SchemaExtension class.
@@ -42,6 +54,14 @@ def CacheExtension(  # noqa: N802 - PascalCase intentional for class factory
         )
     """
 
+    # Strong references; the event loop only keeps weak ones to tasks
+    pending_writes: set[asyncio.Task[Any]] = set()
+
+    def _write_done(task: asyncio.Task[Any]) -> None:
+        pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background cache write failed", exc_info=task.exception())
+
     class _CacheExtension(SchemaExtension):
         """Strawberry SchemaExtension for GraphQL response caching."""
 
@@ -66,49 +86,46 @@ def CacheExtension(  # noqa: N802 - PascalCase intentional for class factory
 
             If we have a cached response, set result before execution.
             """
-            if self._cached_response is not None:
-                # We have a cached response - set result before yield
-                from strawberry.types.execution import ExecutionResult
+            if self._cached_response is None:
+                yield
+                return
 
-                ctx = self.execution_context
-                ctx.result = ExecutionResult(data=self._cached_response, errors=[])
+            # We have a cached response - set result before yield
+            ctx = self.execution_context
+            hit_result = ExecutionResult(data=self._cached_response, errors=[])
+            ctx.result = hit_result
             yield
-            # After execution - if we had cached, restore the cached result
-            # (in case execution overwrote it)
-            if self._cached_response is not None:
-                from strawberry.types.execution import ExecutionResult
-
-                ctx = self.execution_context
-                ctx.result = ExecutionResult(data=self._cached_response, errors=[])
+            # Restore the cached result in case execution overwrote it
+            if ctx.result is not hit_result:
+                ctx.result = hit_result
 
         async def _check_cache(self) -> None:
             """Check cache before execution."""
             ctx = self.execution_context
 
-            query = ctx.query if hasattr(ctx, "query") else None
+            query = getattr(ctx, "query", None)
             if not query:
                 return
 
-            variables = ctx.variables if hasattr(ctx, "variables") else None
-            operation_name = (
-                ctx.operation_name if hasattr(ctx, "operation_name") else None
-            )
+            variables = getattr(ctx, "variables", None)
+            operation_name = getattr(ctx, "operation_name", None)
 
             try:
-                if hasattr(ctx, "operation_type") and ctx.operation_type is not None:
-                    op_type = str(ctx.operation_type).upper()
-                    self._is_mutation = "MUTATION" in op_type
+                operation_type = getattr(ctx, "operation_type", None)
+                if operation_type is not None:
+                    self._is_mutation = operation_type is OperationType.MUTATION
                 else:
-                    query_lower = query.lower().strip()
-                    self._is_mutation = query_lower.startswith("mutation")
+                    self._is_mutation = is_mutation_query(query)
             except RuntimeError:
                 # operation_type may raise if document not yet parsed
-                query_lower = query.lower().strip()
-                self._is_mutation = query_lower.startswith("mutation")
+                self._is_mutation = is_mutation_query(query)
 
             if self._is_mutation and not cache_service.config.cache_mutations:
                 return
 
+            if len(query) < cache_service.config.min_query_length:
+                return
+
             if should_cache and not should_cache(ctx):
                 return
 
@@ -121,8 +138,14 @@ def CacheExtension(  # noqa: N802 - PascalCase intentional for class factory
 
             if cached is not None:
                 self._cached_response = cached
-                if hasattr(ctx, "context") and ctx.context is not None:
-                    ctx.context["_cacheql_cached_response"] = cached
+                context = getattr(ctx, "context", None)
+                if isinstance(context, dict):
+                    context["_cacheql_cached_response"] = cached
+                elif context is not None:
+                    # Object contexts (e.g. strawberry.fastapi.BaseContext);
+                    # fully slotted classes cannot take the extra attribute
+                    with contextlib.suppress(AttributeError):
+                        context._cacheql_cached_response = cached
 
         async def _cache_response(self) -> None:
             """Cache response after execution."""
@@ -136,40 +159,44 @@ def CacheExtension(  # noqa: N802 - PascalCase intentional for class factory
                     await self._handle_mutation_invalidation()
                 return
 
-            result = ctx.result if hasattr(ctx, "result") else None
+            result = getattr(ctx, "result", None)
             if result is None:
                 return
 
-            if hasattr(result, "errors") and result.errors:
+            if getattr(result, "errors", None):
                 return
 
-            query = ctx.query if hasattr(ctx, "query") else None
-            if not query:
+            query = getattr(ctx, "query", None)
+            if not query or len(query) < cache_service.config.min_query_length:
                 return
 
-            variables = ctx.variables if hasattr(ctx, "variables") else None
-            operation_name = (
-                ctx.operation_name if hasattr(ctx, "operation_name") else None
-            )
+            variables = getattr(ctx, "variables", None)
+            operation_name = getattr(ctx, "operation_name", None)
 
-            data = result.data if hasattr(result, "data") else result
-            await cache_service.cache_response(
+            data = getattr(result, "data", result)
+            write = cache_service.cache_response(
                 operation_name=operation_name,
                 query=query,
                 variables=variables,
                 response=data,
                 context=None,
             )
+            if background_writes:
+                task = asyncio.create_task(write)
+                pending_writes.add(task)
+                task.add_done_callback(_write_done)
+            else:
+                await write
 
         async def _handle_mutation_invalidation(self) -> None:
             """Handle automatic cache invalidation on mutation."""
             ctx = self.execution_context
-            result = ctx.result if hasattr(ctx, "result") else None
+            result = getattr(ctx, "result", None)
 
             if result is None:
                 return
 
-            data = result.data if hasattr(result, "data") else result
+            data = getattr(result, "data", result)
             if not data:
                 return
 
@@ -178,23 +205,39 @@ def CacheExtension(  # noqa: N802 - PascalCase intentional for class factory
                 await cache_service.invalidate(tags)
 
         def _extract_tags_from_response(self, data: Any) -> list[str]:
-            """Extract cache tags from mutation response data."""
-            tags: list[str] = []
-
-            if isinstance(data, dict):
-                for _key, value in data.items():
-                    if isinstance(value, dict):
-                        type_name = value.get("__typename")
-                        if type_name:
-                            tags.append(type_name)
-                            if "id" in value:
-                                tags.append(f"{type_name}:{value['id']}")
-                        tags.extend(self._extract_tags_from_response(value))
-                    elif isinstance(value, list):
-                        for item in value:
-                            tags.extend(self._extract_tags_from_response(item))
-
-            return tags
+            """Extract cache tags from mutation response data.
+
+            Every object with a ``__typename``, including list items, adds
+            ``"Type"`` and ``"Type:id"`` tags. The response is walked with
+            an explicit stack instead of recursion, and tags are deduped
+            in first-seen order.
+            """
+            if not isinstance(data, (dict, list)):
+                return []
+
+            tags: dict[str, None] = {}
+            stack = [data]
+            push = stack.append
+
+            while stack:
+                node = stack.pop()
+                if isinstance(node, list):
+                    # Only containers are pushed; scalar and null items
+                    # carry no tags
+                    stack.extend(
+                        item for item in node if isinstance(item, (dict, list))
+                    )
+                    continue
+                type_name = node.get("__typename")
+                if type_name:
+                    tags[type_name] = None
+                    if "id" in node:
+                        tags[f"{type_name}:{node['id']}"] = None
+                for value in node.values():
+                    if isinstance(value, (dict, list)):
+                        push(value)
+
+            return list(tags)
 
         def get_results(self) -> dict[str, Any]:
             """Return cache metadata for response extensions."""
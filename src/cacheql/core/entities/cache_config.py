@@ -19,6 +19,27 @@ class CacheConfig:
     Legacy Mode:
         When use_cache_control=False, uses simple TTL-based caching
         with the default_ttl value.
+
+    Negative Cache:
+        When negative_cache_capacity is set, CacheService keeps an
+        in-process Bloom filter of the response keys it has written and
+        answers lookups for other keys as misses without a backend
+        round-trip. Responses cached by other processes are not seen until
+        this process caches them itself, so it suits miss-heavy,
+        single-process deployments best.
+
+    Local (L1) Cache:
+        When l1_ttl is set, CacheService keeps recently read and written
+        responses in a small in-process LRU in front of the backend (e.g.
+        Redis) for at most l1_ttl. Invalidation clears this process's L1;
+        other processes may serve a stale response for up to l1_ttl, so
+        keep it short.
+
+        Responses written by this process are kept for the shorter of
+        l1_ttl and their TTL. Responses read from the backend are kept for
+        the full l1_ttl, because the backend does not report how long an
+        entry has left, so they may be served for up to l1_ttl after the
+        backend entry has expired.
     """
 
     enabled: bool = True
@@ -29,6 +50,8 @@ class CacheConfig:
     # Query-level settings
     cache_queries: bool = True
     cache_mutations: bool = False
+    # Queries shorter than this many characters skip the cache entirely
+    min_query_length: int = 0
 
     # Field-level settings
     cache_fields: bool = False
@@ -41,6 +64,13 @@ class CacheConfig:
     default_max_age: int = 0  # Default maxAge in seconds (0 = no cache by default)
     calculate_http_headers: bool = True  # Generate Cache-Control HTTP headers
 
+    # Negative cache: expected number of response keys (None = disabled)
+    negative_cache_capacity: int | None = None
+
+    # Local (L1) response cache in front of the backend (None = disabled)
+    l1_ttl: timedelta | None = None
+    l1_max_size: int = 1024
+
     def __post_init__(self) -> None:
         """Set default TTL if not provided."""
         if self.default_ttl is None:
@@ -8,6 +8,7 @@ See: https://www.apollographql.com/docs/apollo-server/performance/caching
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 
 class CacheScope(Enum):
@@ -20,13 +21,39 @@ class CacheScope(Enum):
     PUBLIC = "PUBLIC"
     PRIVATE = "PRIVATE"
 
+    @classmethod
+    def from_str(cls, value: str) -> "CacheScope":
+        """Parse a scope name, ignoring case.
+
+        Uses a prebuilt lookup table instead of the Enum value lookup.
+
+        Args:
+            value: The scope name (e.g. "PUBLIC" or "private").
+
+        Returns:
+            The matching CacheScope.
+
+        Raises:
+            ValueError: If the value is not a valid scope name.
+        """
+        name = value.upper()
+        try:
+            return _SCOPE_FROM_STR[name]
+        except KeyError:
+            raise ValueError(f"{name!r} is not a valid {cls.__name__}") from None
+
+
+# Scope name -> member, for CacheScope.from_str
+_SCOPE_FROM_STR: dict[str, CacheScope] = {scope.value: scope for scope in CacheScope}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CacheHint:
     """Cache hint for a field or type.
 
     Represents the caching policy as defined by @cacheControl directive.
-    Used to calculate the overall cache policy for a response.
+    Used to calculate the overall cache policy for a response. Hints are
+    immutable, so they can be shared and used as cache keys.
 
     Attributes:
         max_age: Maximum cache validity in seconds. None means not set.
@@ -53,30 +80,10 @@ class CacheHint:
             other: The other cache hint to merge with.
 
         Returns:
-            A new CacheHint with merged values.
+            A CacheHint with merged values. Equal inputs return the same
+            shared instance.
         """
-        # Calculate max_age (lowest wins)
-        if self.max_age is None:
-            new_max_age = other.max_age
-        elif other.max_age is None:
-            new_max_age = self.max_age
-        else:
-            new_max_age = min(self.max_age, other.max_age)
-
-        # Calculate scope (PRIVATE wins)
-        new_scope: CacheScope | None
-        if self.scope == CacheScope.PRIVATE or other.scope == CacheScope.PRIVATE:
-            new_scope = CacheScope.PRIVATE
-        elif self.scope is not None:
-            new_scope = self.scope
-        else:
-            new_scope = other.scope
-
-        return CacheHint(
-            max_age=new_max_age,
-            scope=new_scope,
-            inherit_max_age=False,  # Not applicable after merge
-        )
+        return _merge_hints(self.max_age, self.scope, other.max_age, other.scope)
 
     def restrict(
         self,
@@ -118,7 +125,7 @@ class CacheHint:
         """
         parsed_scope = None
         if scope:
-            parsed_scope = CacheScope(scope.upper())
+            parsed_scope = CacheScope.from_str(scope)
 
         return cls(
             max_age=max_age,
@@ -127,7 +134,7 @@ class CacheHint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldCacheHint:
     """Cache hint associated with a specific field path.
 
@@ -145,7 +152,7 @@ class FieldCacheHint:
         return ".".join(self.path)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseCachePolicy:
     """Overall cache policy for a GraphQL response.
 
@@ -163,11 +170,7 @@ class ResponseCachePolicy:
 
     def to_http_header(self) -> str:
         """Generate HTTP Cache-Control header value."""
-        if not self.is_cacheable:
-            return "no-store"
-
-        scope_str = "private" if self.scope == CacheScope.PRIVATE else "public"
-        return f"max-age={self.max_age}, {scope_str}"
+        return _cache_control_header(self.max_age, self.scope)
 
     @classmethod
     def from_hints(
@@ -198,20 +201,29 @@ class ResponseCachePolicy:
         # Start with most permissive values
         overall_max_age: int | None = None
         overall_scope = CacheScope.PUBLIC
+        private = CacheScope.PRIVATE
 
         for field_hint in hints:
             hint = field_hint.hint
 
             # Update max_age (lowest wins)
-            if hint.max_age is not None:
-                if overall_max_age is None:
-                    overall_max_age = hint.max_age
-                else:
-                    overall_max_age = min(overall_max_age, hint.max_age)
+            max_age = hint.max_age
+            if max_age is not None and (
+                overall_max_age is None or max_age < overall_max_age
+            ):
+                overall_max_age = max_age
 
             # Update scope (PRIVATE wins)
-            if hint.scope == CacheScope.PRIVATE:
-                overall_scope = CacheScope.PRIVATE
+            if hint.scope is private:
+                overall_scope = private
+
+            # No later hint can make the policy more restrictive
+            if (
+                overall_scope is private
+                and overall_max_age is not None
+                and overall_max_age <= 0
+            ):
+                break
 
         return cls(
             max_age=overall_max_age if overall_max_age is not None else default_max_age,
@@ -219,6 +231,110 @@ class ResponseCachePolicy:
             field_hints=hints,
         )
 
+    @classmethod
+    def from_values(
+        cls,
+        max_ages: list[int | None],
+        scopes: list[CacheScope | None],
+        default_max_age: int = 0,
+        field_hints: list[FieldCacheHint] | None = None,
+    ) -> "ResponseCachePolicy":
+        """Calculate response cache policy from parallel hint values.
+
+        Same rules as ``from_hints``, applied to the ``max_age`` and
+        ``scope`` of each hint collected into two parallel lists, so
+        aggregation needs no attribute access on FieldCacheHint objects.
+
+        Args:
+            max_ages: The max_age of each hint.
+            scopes: The scope of each hint, in the same order.
+            default_max_age: Default max_age if no hints are set.
+            field_hints: Optional hints to keep on the policy.
+
+        Returns:
+            The calculated ResponseCachePolicy.
+        """
+        overall_max_age = min(
+            (max_age for max_age in max_ages if max_age is not None),
+            default=None,
+        )
+        return cls(
+            max_age=overall_max_age if overall_max_age is not None else default_max_age,
+            scope=(
+                CacheScope.PRIVATE
+                if CacheScope.PRIVATE in scopes
+                else CacheScope.PUBLIC
+            ),
+            field_hints=field_hints if field_hints is not None else [],
+        )
+
+
+@lru_cache(maxsize=4096)
+def _merge_hints(
+    max_age: int | None,
+    scope: CacheScope | None,
+    other_max_age: int | None,
+    other_scope: CacheScope | None,
+) -> CacheHint:
+    """Merge two hints' values, applying most restrictive rules.
+
+    Sibling list items produce the same hints over and over, so each
+    distinct merge is computed once and the resulting hint is reused.
+
+    Args:
+        max_age: The first hint's max_age.
+        scope: The first hint's scope.
+        other_max_age: The second hint's max_age.
+        other_scope: The second hint's scope.
+
+    Returns:
+        The merged CacheHint.
+    """
+    # Calculate max_age (lowest wins)
+    new_max_age: int | None
+    if max_age is None:
+        new_max_age = other_max_age
+    elif other_max_age is None:
+        new_max_age = max_age
+    else:
+        new_max_age = min(max_age, other_max_age)
+
+    # Calculate scope (PRIVATE wins)
+    new_scope: CacheScope | None
+    if scope is CacheScope.PRIVATE or other_scope is CacheScope.PRIVATE:
+        new_scope = CacheScope.PRIVATE
+    elif scope is not None:
+        new_scope = scope
+    else:
+        new_scope = other_scope
+
+    return CacheHint(
+        max_age=new_max_age,
+        scope=new_scope,
+        inherit_max_age=False,  # Not applicable after merge
+    )
+
+
+@lru_cache(maxsize=256)
+def _cache_control_header(max_age: int, scope: CacheScope) -> str:
+    """Build a Cache-Control header value.
+
+    Schemas use a handful of distinct (max_age, scope) pairs, so each
+    header string is built once and reused for every later response.
+
+    Args:
+        max_age: The response max-age in seconds.
+        scope: The response cache scope.
+
+    Returns:
+        The header value.
+    """
+    if max_age <= 0:
+        return "no-store"
+
+    scope_str = "private" if scope is CacheScope.PRIVATE else "public"
+    return f"max-age={max_age}, {scope_str}"
+
 
 # Type alias for cache control configuration per field/type
 CacheControlConfig = dict[str, CacheHint]
@@ -1,11 +1,12 @@
 """Cache entry entity."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CacheEntry:
     """Immutable cache entry value object.
 
@@ -19,6 +20,18 @@ class CacheEntry:
     ttl: timedelta | None = None
     tags: tuple[str, ...] = ()
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Expiry as a POSIX timestamp, computed once so is_expired is a
+    # single float comparison
+    _expires_at_ts: float | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the expiry timestamp."""
+        expires_at_ts = (
+            None
+            if self.ttl is None
+            else self.created_at.timestamp() + self.ttl.total_seconds()
+        )
+        object.__setattr__(self, "_expires_at_ts", expires_at_ts)
 
     @property
     def expires_at(self) -> datetime | None:
@@ -38,9 +51,8 @@ class CacheEntry:
         Returns:
             True if the entry has expired, False otherwise.
         """
-        if self.expires_at is None:
-            return False
-        return datetime.now(timezone.utc) > self.expires_at
+        expires_at_ts = self._expires_at_ts
+        return expires_at_ts is not None and time.time() > expires_at_ts
 
     @classmethod
     def create(
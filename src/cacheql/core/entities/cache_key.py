@@ -1,11 +1,11 @@
 """Cache key value object."""
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CacheKey:
     """Immutable cache key value object.
 
@@ -18,20 +18,26 @@ class CacheKey:
     query_hash: str
     variables_hash: str
     context_hash: str | None = None
+    # Full key string, built once since every component is immutable
+    _str: str = field(init=False, repr=False, compare=False)
 
-    def __str__(self) -> str:
-        """Return the full cache key string.
-
-        Returns:
-            The complete cache key as a string.
-        """
+    def __post_init__(self) -> None:
+        """Build the full cache key string."""
         parts = [self.prefix]
         if self.operation_name:
             parts.append(self.operation_name)
         parts.extend([self.query_hash, self.variables_hash])
         if self.context_hash:
             parts.append(self.context_hash)
-        return ":".join(parts)
+        object.__setattr__(self, "_str", ":".join(parts))
+
+    def __str__(self) -> str:
+        """Return the full cache key string.
+
+        Returns:
+            The complete cache key as a string.
+        """
+        return self._str
 
     @classmethod
     def from_components(
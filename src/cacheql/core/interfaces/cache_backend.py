@@ -10,6 +10,10 @@ class ICacheBackend(Protocol):
     All cache backends must implement this protocol to be used
     with CacheService. Methods are async to support both in-memory
     and distributed cache implementations.
+
+    The batch methods ``get_many``, ``set_many`` and ``delete_patterns``
+    were added later. CacheService falls back to one ``get``, ``set`` or
+    ``delete_pattern`` call per item for backends that lack them.
     """
 
     async def get(self, key: str) -> bytes | None:
@@ -23,6 +27,18 @@ class ICacheBackend(Protocol):
         """
         ...
 
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Retrieve several cached values in one round-trip.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            The cached values in the same order as ``keys``, with None for
+            keys that are missing or expired.
+        """
+        ...
+
     async def set(
         self,
         key: str,
@@ -38,6 +54,19 @@ class ICacheBackend(Protocol):
         """
         ...
 
+    async def set_many(
+        self,
+        items: dict[str, bytes],
+        ttl: timedelta | None = None,
+    ) -> None:
+        """Store several values with the same TTL in one round-trip.
+
+        Args:
+            items: Mapping of cache key to value bytes.
+            ttl: Optional time-to-live. If None, uses backend default.
+        """
+        ...
+
     async def delete(self, key: str) -> bool:
         """Delete cached value.
 
@@ -74,3 +103,17 @@ class ICacheBackend(Protocol):
             Number of keys deleted.
         """
         ...
+
+    async def delete_patterns(self, patterns: list[str]) -> int:
+        """Delete keys matching any of the given patterns in one batch.
+
+        Backends should resolve all patterns together so that multi-tag
+        invalidation costs a constant number of round-trips.
+
+        Args:
+            patterns: Glob-style patterns to match keys.
+
+        Returns:
+            Number of keys deleted.
+        """
+        ...
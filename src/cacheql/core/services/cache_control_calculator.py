@@ -21,7 +21,7 @@ from cacheql.core.entities.cache_control import (
 from cacheql.core.services.directive_parser import SchemaDirectives
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheControlContext:
     """Context for cache control during request execution.
 
@@ -38,8 +38,9 @@ class CacheControlContext:
     # Default max_age for fields without explicit hints
     default_max_age: int = 0
 
-    # Current field path during execution
-    _current_path: list[str] = field(default_factory=list)
+    # Stack of cumulative field paths during execution; the top is the
+    # current path, so reading it never copies
+    _current_path: list[tuple[str, ...]] = field(default_factory=list)
 
     def set_cache_hint(
         self,
@@ -57,13 +58,13 @@ class CacheControlContext:
         parsed_scope = None
         if scope is not None:
             if isinstance(scope, str):
-                parsed_scope = CacheScope(scope.upper())
+                parsed_scope = CacheScope.from_str(scope)
             else:
                 parsed_scope = scope
 
         hint = CacheHint(max_age=max_age, scope=parsed_scope)
         field_hint = FieldCacheHint(
-            path=tuple(self._current_path),
+            path=self.current_path,
             hint=hint,
             source="resolver",
         )
@@ -71,7 +72,7 @@ class CacheControlContext:
 
     def push_path(self, field_name: str) -> None:
         """Push a field name onto the current path."""
-        self._current_path.append(field_name)
+        self._current_path.append((*self.current_path, field_name))
 
     def pop_path(self) -> None:
         """Pop the last field name from the current path."""
@@ -81,7 +82,7 @@ class CacheControlContext:
     @property
     def current_path(self) -> tuple[str, ...]:
         """Get the current field path as a tuple."""
-        return tuple(self._current_path)
+        return self._current_path[-1] if self._current_path else ()
 
 
 class CacheControlCalculator:
@@ -99,11 +100,15 @@ class CacheControlCalculator:
     ) -> None:
         """Initialize the calculator.
 
+        Field-level hints are indexed by parent type here, so directives
+        added to ``schema_directives`` afterwards are not seen.
+
         Args:
             schema_directives: Pre-parsed schema directives.
             default_max_age: Default maxAge for fields without hints.
         """
         self._schema_directives = schema_directives or SchemaDirectives()
+        self._field_hints_by_type = self._schema_directives.field_hints_by_type()
         self._default_max_age = default_max_age
 
     def calculate_policy(
@@ -111,6 +116,7 @@ class CacheControlCalculator:
         data: Any,
         type_info: dict[str, str] | None = None,
         context: CacheControlContext | None = None,
+        field_hints: bool = True,
     ) -> ResponseCachePolicy:
         """Calculate the cache policy for a response.
 
@@ -118,109 +124,153 @@ class CacheControlCalculator:
             data: The GraphQL response data.
             type_info: Optional mapping of field paths to type names.
             context: Optional cache control context with resolver hints.
+            field_hints: Record every hint in the policy's ``field_hints``.
+                Pass False when only ``max_age`` and ``scope`` are needed,
+                to skip building a FieldCacheHint per hinted field.
 
         Returns:
             The calculated ResponseCachePolicy.
         """
-        hints: list[FieldCacheHint] = []
+        hints: list[FieldCacheHint] | None = [] if field_hints else None
+        # max_age and scope of every hint, as parallel lists
+        max_ages: list[int | None] = []
+        scopes: list[CacheScope | None] = []
 
         # Collect hints from schema directives by walking the response
         self._collect_hints_from_data(
             data=data,
-            path=[],
+            path=(),
             parent_type="Query",
             parent_hint=None,
             hints=hints,
             type_info=type_info or {},
+            max_ages=max_ages,
+            scopes=scopes,
         )
 
         # Add resolver hints from context
         if context is not None:
-            hints.extend(context.resolver_hints)
+            for resolver_hint in context.resolver_hints:
+                max_ages.append(resolver_hint.hint.max_age)
+                scopes.append(resolver_hint.hint.scope)
+            if hints is not None:
+                hints.extend(context.resolver_hints)
 
         # Calculate overall policy
-        return ResponseCachePolicy.from_hints(hints, self._default_max_age)
+        return ResponseCachePolicy.from_values(
+            max_ages, scopes, self._default_max_age, hints
+        )
 
     def _collect_hints_from_data(
         self,
         data: Any,
-        path: list[str],
+        path: tuple[str, ...],
         parent_type: str,
         parent_hint: CacheHint | None,
-        hints: list[FieldCacheHint],
+        hints: list[FieldCacheHint] | None,
         type_info: dict[str, str],
+        max_ages: list[int | None],
+        scopes: list[CacheScope | None],
     ) -> None:
-        """Recursively collect cache hints from response data.
+        """Collect cache hints from response data.
+
+        Walks the response depth-first with an explicit stack rather than
+        recursion, so deeply nested responses cannot hit the recursion
+        limit and no Python frame is set up per node.
 
         Args:
-            data: Current data node.
-            path: Current field path.
-            parent_type: The parent GraphQL type name.
-            parent_hint: The parent field's cache hint.
-            hints: List to append hints to.
+            data: Root data node.
+            path: Field path of the root node.
+            parent_type: The GraphQL type name of the root node.
+            parent_hint: The cache hint of the field holding the root node.
+            hints: List to append hints to, or None to skip building them.
             type_info: Mapping of paths to type names.
+            max_ages: List to append each hint's max_age to.
+            scopes: List to append each hint's scope to.
         """
-        if data is None:
-            return
+        get_type_hint = self._schema_directives.get_hint_for_type
+        field_hints_by_type = self._field_hints_by_type
+        add_max_age = max_ages.append
+        add_scope = scopes.append
+        add_hint = hints.append if hints is not None else None
+
+        # Children are pushed in reverse so objects are visited in
+        # document order, as the recursive walk did
+        stack: list[tuple[Any, tuple[str, ...], str, CacheHint | None]] = [
+            (data, path, parent_type, parent_hint)
+        ]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            data, path, parent_type, parent_hint = pop()
+
+            if isinstance(data, list):
+                # List items keep the list's path, type and parent hint
+                for item in reversed(data):
+                    if isinstance(item, (dict, list)):
+                        push((item, path, parent_type, parent_hint))
+                continue
+
+            if not isinstance(data, dict):
+                continue
 
-        if isinstance(data, dict):
             # Get type from __typename or type_info
             type_name = data.get("__typename")
             if type_name is None:
-                path_str = ".".join(path)
-                type_name = type_info.get(path_str, parent_type)
+                type_name = (
+                    type_info.get(".".join(path), parent_type)
+                    if type_info
+                    else parent_type
+                )
 
             # Check for type-level hint
-            type_hint = self._schema_directives.get_hint_for_type(type_name)
+            type_hint = get_type_hint(type_name)
             if type_hint is not None:
-                hints.append(FieldCacheHint(
-                    path=tuple(path) if path else ("$root",),
-                    hint=type_hint,
-                    source="type",
-                ))
+                add_max_age(type_hint.max_age)
+                add_scope(type_hint.scope)
+                if add_hint is not None:
+                    # Positional arguments: cheaper than keywords per node
+                    add_hint(FieldCacheHint(path or ("$root",), type_hint, "type"))
+
+            # Field hints of this type, looked up once per object; fields
+            # without one fall back to the type-level hint
+            field_hints = field_hints_by_type.get(type_name)
+
+            first_child = len(stack)
 
             # Process each field
             for field_name, field_value in data.items():
                 if field_name == "__typename":
                     continue
 
-                field_path = [*path, field_name]
+                field_path = (*path, field_name)
 
-                # Get field-level hint
-                field_hint = self._schema_directives.get_hint_for_field(
-                    type_name=type_name or parent_type,
-                    field_name=field_name,
-                    parent_hint=parent_hint,
+                # Get field-level hint (same resolution as get_hint_for_field)
+                field_hint = (
+                    field_hints.get(field_name) if field_hints is not None else None
                 )
+                if field_hint is None:
+                    field_hint = type_hint
+                elif field_hint.inherit_max_age and parent_hint is not None:
+                    field_hint = CacheHint(
+                        max_age=parent_hint.max_age,
+                        scope=field_hint.scope or parent_hint.scope,
+                        inherit_max_age=False,
+                    )
 
                 if field_hint is not None:
-                    hints.append(FieldCacheHint(
-                        path=tuple(field_path),
-                        hint=field_hint,
-                        source="schema",
-                    ))
-
-                # Recurse into nested data
-                self._collect_hints_from_data(
-                    data=field_value,
-                    path=field_path,
-                    parent_type=type_name or parent_type,
-                    parent_hint=field_hint,
-                    hints=hints,
-                    type_info=type_info,
-                )
-
-        elif isinstance(data, list):
-            # Process list items
-            for item in data:
-                self._collect_hints_from_data(
-                    data=item,
-                    path=path,  # Keep same path for list items
-                    parent_type=parent_type,
-                    parent_hint=parent_hint,
-                    hints=hints,
-                    type_info=type_info,
-                )
+                    add_max_age(field_hint.max_age)
+                    add_scope(field_hint.scope)
+                    if add_hint is not None:
+                        add_hint(FieldCacheHint(field_path, field_hint, "schema"))
+
+                # Descend into nested data; scalar leaves carry no hints
+                if isinstance(field_value, (dict, list)):
+                    push((field_value, field_path, type_name, field_hint))
+
+            # Children were pushed in document order; reverse them in place
+            if len(stack) - first_child > 1:
+                stack[first_child:] = stack[first_child:][::-1]
 
     def calculate_from_hints(
         self,
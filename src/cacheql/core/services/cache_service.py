@@ -1,13 +1,17 @@
 """Cache service - main orchestrator for caching operations."""
 
+import asyncio
 from datetime import timedelta
 from typing import Any
 
+from cachetools import TLRUCache
+
 from cacheql.core.entities.cache_config import CacheConfig
 from cacheql.core.entities.cache_entry import CacheEntry
 from cacheql.core.interfaces.cache_backend import ICacheBackend
 from cacheql.core.interfaces.key_builder import IKeyBuilder
 from cacheql.core.interfaces.serializer import ISerializer
+from cacheql.utils.bloom import BloomFilter
 
 
 class CacheService:
@@ -41,11 +45,33 @@ class CacheService:
         self._hits = 0
         self._misses = 0
 
+        # Response keys written by this process, to skip lookups of others
+        self._written_keys: BloomFilter | None = None
+        if self._config.negative_cache_capacity:
+            self._written_keys = BloomFilter(self._config.negative_cache_capacity)
+
+        # Local (L1) copies of responses as (value, ttl seconds)
+        self._l1: TLRUCache[str, tuple[bytes, float]] | None = None
+        if self._config.l1_ttl is not None:
+            self._l1 = TLRUCache(maxsize=self._config.l1_max_size, ttu=_l1_expiry)
+        self._l1_seconds = (
+            self._config.l1_ttl.total_seconds() if self._config.l1_ttl else 0.0
+        )
+
+        # Raw-key lookups waiting to be sent in the next get_many batch
+        self._pending_loads: dict[str, asyncio.Future[bytes | None]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
     @property
     def config(self) -> CacheConfig:
         """Get the cache configuration."""
         return self._config
 
+    @property
+    def serializer(self) -> ISerializer:
+        """Get the serializer used for cached values."""
+        return self._serializer
+
     @property
     def stats(self) -> dict[str, int]:
         """Get cache statistics.
@@ -59,12 +85,42 @@ class CacheService:
             "total": self._hits + self._misses,
         }
 
+    def build_response_key(
+        self,
+        operation_name: str | None,
+        query: str,
+        variables: dict[str, Any] | None,
+        context: dict[str, Any] | None = None,
+    ) -> str:
+        """Build the cache key for a GraphQL operation's response.
+
+        Callers that look up and then store the same operation can build
+        the key once and pass it as ``key`` to both calls, so the query is
+        normalized and hashed only once.
+
+        Args:
+            operation_name: The GraphQL operation name.
+            query: The GraphQL query string.
+            variables: Variables passed to the operation.
+            context: Optional additional context for key generation.
+
+        Returns:
+            The cache key string.
+        """
+        return self._key_builder.build(
+            operation_name=operation_name,
+            query=query,
+            variables=variables,
+            context=context,
+        )
+
     async def get_cached_response(
         self,
         operation_name: str | None,
         query: str,
         variables: dict[str, Any] | None,
         context: dict[str, Any] | None = None,
+        key: str | None = None,
     ) -> Any | None:
         """Try to get cached response for GraphQL operation.
 
@@ -73,19 +129,68 @@ class CacheService:
             query: The GraphQL query string.
             variables: Variables passed to the operation.
             context: Optional additional context for key generation.
+            key: Optional key from ``build_response_key``. When given, the
+                other arguments are not used to build the key.
 
         Returns:
             The cached response value, or None if not found.
         """
-        if not self._config.enabled:
-            return None
-
-        key = self._key_builder.build(
+        cached_data = await self.get_cached_response_raw(
             operation_name=operation_name,
             query=query,
             variables=variables,
             context=context,
+            key=key,
         )
+        if cached_data is None:
+            return None
+        return self._serializer.deserialize(cached_data)
+
+    async def get_cached_response_raw(
+        self,
+        operation_name: str | None,
+        query: str,
+        variables: dict[str, Any] | None,
+        context: dict[str, Any] | None = None,
+        key: str | None = None,
+    ) -> bytes | None:
+        """Try to get the serialized cached response for GraphQL operation.
+
+        Unlike ``get_cached_response``, the stored bytes are returned as-is,
+        so callers that can use the serializer's output directly (e.g. JSON
+        written straight to an HTTP response) skip deserialization.
+
+        With ``negative_cache_capacity`` configured, keys this process has
+        never cached are reported as misses without querying the backend.
+        With ``l1_ttl`` configured, recently seen responses are served from
+        the in-process L1 cache first.
+
+        Args:
+            operation_name: The GraphQL operation name.
+            query: The GraphQL query string.
+            variables: Variables passed to the operation.
+            context: Optional additional context for key generation.
+            key: Optional key from ``build_response_key``. When given, the
+                other arguments are not used to build the key.
+
+        Returns:
+            The serialized cached response, or None if not found.
+        """
+        if not self._config.enabled:
+            return None
+
+        if key is None:
+            key = self.build_response_key(operation_name, query, variables, context)
+
+        if self._l1 is not None:
+            local = self._l1.get(key)
+            if local is not None:
+                self._hits += 1
+                return local[0]
+
+        if self._written_keys is not None and key not in self._written_keys:
+            self._misses += 1
+            return None
 
         cached_data = await self._backend.get(key)
 
@@ -93,8 +198,126 @@ class CacheService:
             self._misses += 1
             return None
 
+        if self._l1 is not None:
+            # The backend entry's remaining TTL is unknown here, so this
+            # copy may outlive it by up to l1_ttl (see CacheConfig)
+            self._l1[key] = (cached_data, self._l1_seconds)
         self._hits += 1
-        return self._serializer.deserialize(cached_data)
+        return cached_data
+
+    async def get_cached_responses(self, keys: list[str]) -> list[Any | None]:
+        """Look up several prebuilt response keys in one backend call.
+
+        Args:
+            keys: Keys from ``build_response_key``.
+
+        Returns:
+            The cached response values in the same order as ``keys``, with
+            None for misses.
+        """
+        return [
+            self._serializer.deserialize(data) if data is not None else None
+            for data in await self.get_cached_responses_raw(keys)
+        ]
+
+    async def get_cached_responses_raw(self, keys: list[str]) -> list[bytes | None]:
+        """Look up several prebuilt response keys, returning stored bytes.
+
+        Keys not answered by the L1 cache or the negative cache are fetched
+        with a single ``get_many`` (one MGET on Redis), e.g. the private and
+        public keys of a session-scoped request.
+
+        Args:
+            keys: Keys from ``build_response_key``.
+
+        Returns:
+            The serialized cached responses in the same order as ``keys``,
+            with None for misses.
+        """
+        results: list[bytes | None] = [None] * len(keys)
+        if not self._config.enabled:
+            return results
+
+        # Indexes of keys that need a backend lookup
+        remote: list[int] = []
+        for index, key in enumerate(keys):
+            if self._l1 is not None:
+                local = self._l1.get(key)
+                if local is not None:
+                    results[index] = local[0]
+                    continue
+            if self._written_keys is not None and key not in self._written_keys:
+                continue
+            remote.append(index)
+
+        if remote:
+            values = await self._get_many([keys[i] for i in remote])
+            for index, value in zip(remote, values, strict=True):
+                results[index] = value
+                if value is not None and self._l1 is not None:
+                    # May outlive the backend entry by up to l1_ttl
+                    self._l1[keys[index]] = (value, self._l1_seconds)
+
+        hits = sum(value is not None for value in results)
+        self._hits += hits
+        self._misses += len(results) - hits
+        return results
+
+    async def load(self, key: str) -> bytes | None:
+        """Load a raw cached value by key, batching concurrent lookups.
+
+        Lookups issued in the same event loop iteration (e.g. sibling
+        field resolvers) are coalesced into a single ``get_many`` call on
+        the backend, and duplicate keys share one result.
+
+        Args:
+            key: The full cache key.
+
+        Returns:
+            The cached bytes, or None if not found.
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_task is None or self._flush_task.done():
+            # A flush cancelled before it ran (e.g. its event loop shut
+            # down) leaves lookups behind that nothing will answer
+            self._drop_pending_loads()
+            self._flush_task = loop.create_task(self._flush_loads())
+        future = self._pending_loads.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending_loads[key] = future
+        # Shield so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+
+    async def _flush_loads(self) -> None:
+        """Resolve every pending lookup with one backend ``get_many`` call."""
+        pending = self._pending_loads
+        self._pending_loads = {}
+        # Lookups from here on need a new batch
+        self._flush_task = None
+
+        try:
+            values = await self._get_many(list(pending))
+            for future, value in zip(pending.values(), values, strict=True):
+                if not future.done():
+                    future.set_result(value)
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled mid-batch: fail the lookups rather than leave them
+            for future in pending.values():
+                if not future.done():
+                    future.cancel()
+
+    def _drop_pending_loads(self) -> None:
+        """Cancel and forget lookups left behind by an unfinished flush."""
+        for future in self._pending_loads.values():
+            # Futures of a closed loop cannot run their callbacks
+            if not future.get_loop().is_closed():
+                future.cancel()
+        self._pending_loads = {}
 
     async def cache_response(
         self,
@@ -105,6 +328,7 @@ class CacheService:
         ttl: timedelta | None = None,
         tags: list[str] | None = None,
         context: dict[str, Any] | None = None,
+        key: str | None = None,
     ) -> CacheEntry:
         """Cache GraphQL response.
 
@@ -116,6 +340,8 @@ class CacheService:
             ttl: Optional TTL. Uses config default if not provided.
             tags: Optional tags for invalidation.
             context: Optional additional context for key generation.
+            key: Optional key from ``build_response_key``. When given, the
+                other arguments are not used to build the key.
 
         Returns:
             The created CacheEntry.
@@ -128,12 +354,8 @@ class CacheService:
                 tags=tags,
             )
 
-        key = self._key_builder.build(
-            operation_name=operation_name,
-            query=query,
-            variables=variables,
-            context=context,
-        )
+        if key is None:
+            key = self.build_response_key(operation_name, query, variables, context)
 
         effective_ttl = ttl or self._config.default_ttl
 
@@ -148,6 +370,13 @@ class CacheService:
         # Serialize and store
         serialized = self._serializer.serialize(response)
         await self._backend.set(key, serialized, effective_ttl)
+        if self._written_keys is not None:
+            self._written_keys.add(key)
+        if self._l1 is not None and effective_ttl is not None:
+            self._l1[key] = (
+                serialized,
+                min(self._l1_seconds, effective_ttl.total_seconds()),
+            )
 
         # Store tag mappings for invalidation
         if tags:
@@ -155,6 +384,28 @@ class CacheService:
 
         return entry
 
+    async def store_many(
+        self,
+        values: dict[str, Any],
+        ttl: timedelta | None = None,
+    ) -> None:
+        """Serialize and store several values by raw key in one batch.
+
+        The counterpart of ``load`` for callers that manage their own keys,
+        such as a DataLoader caching rows by ID.
+
+        Args:
+            values: Mapping of full cache key to value.
+            ttl: Optional TTL. Uses config default if not provided.
+        """
+        if not self._config.enabled or not values:
+            return
+
+        await self._set_many(
+            {key: self._serializer.serialize(value) for key, value in values.items()},
+            ttl or self._config.default_ttl,
+        )
+
     async def invalidate(self, tags: list[str]) -> int:
         """Invalidate cached entries by tags.
 
@@ -164,17 +415,31 @@ class CacheService:
         Returns:
             Number of entries invalidated.
         """
-        count = 0
-        for tag in tags:
-            # Delete tag index and get associated keys
-            pattern = f"{self._config.key_prefix}:tag:{tag}:*"
-            count += await self._backend.delete_pattern(pattern)
+        if not tags:
+            return 0
 
-            # Also try direct pattern matching
-            pattern = f"{self._config.key_prefix}:*{tag}*"
-            count += await self._backend.delete_pattern(pattern)
+        # "*{tag}*" already covers the "tag:{tag}:*" index entries, and any
+        # tag containing another requested tag is covered by the shorter one
+        # (e.g. "User" covers "User:1"), so only the minimal set is sent.
+        minimal_tags: list[str] = []
+        for tag in sorted(set(tags), key=len):
+            if not any(kept in tag for kept in minimal_tags):
+                minimal_tags.append(tag)
 
-        return count
+        patterns = [f"{self._config.key_prefix}:*{tag}*" for tag in minimal_tags]
+
+        # L1 entries carry no tags, so drop them all rather than serve stale
+        if self._l1 is not None:
+            self._l1.clear()
+
+        # Resolve every pattern in a single backend batch
+        deleted = await self._delete_patterns(patterns)
+
+        # Reads during the delete may have copied doomed entries back
+        if self._l1 is not None:
+            self._l1.clear()
+
+        return deleted
 
     async def invalidate_by_type(self, type_name: str) -> int:
         """Invalidate cached entries by GraphQL type.
@@ -190,6 +455,10 @@ class CacheService:
     async def clear(self) -> None:
         """Clear all cached entries."""
         await self._backend.clear()
+        if self._written_keys is not None:
+            self._written_keys.clear()
+        if self._l1 is not None:
+            self._l1.clear()
         self._hits = 0
         self._misses = 0
 
@@ -200,7 +469,58 @@ class CacheService:
             key: The cache key.
             tags: Tags to associate with the key.
         """
-        for tag in tags:
-            tag_key = f"{self._config.key_prefix}:tag:{tag}:{key}"
-            # Store with same TTL as the main entry
-            await self._backend.set(tag_key, key.encode(), self._config.default_ttl)
+        tag_key_prefix = f"{self._config.key_prefix}:tag:"
+        tag_key_suffix = ":" + key
+        encoded_key = key.encode()
+        await self._set_many(
+            {tag_key_prefix + tag + tag_key_suffix: encoded_key for tag in tags},
+            self._config.default_ttl,
+        )
+
+    # get_many, set_many and delete_patterns were added to ICacheBackend
+    # after its first release; backends written before then fall back to
+    # one call per key or pattern.
+
+    async def _get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Fetch several keys, one by one if the backend has no get_many."""
+        get_many = getattr(self._backend, "get_many", None)
+        if get_many is None:
+            return [await self._backend.get(key) for key in keys]
+        values: list[bytes | None] = await get_many(keys)
+        return values
+
+    async def _set_many(
+        self, items: dict[str, bytes], ttl: timedelta | None = None
+    ) -> None:
+        """Store several values, one by one if the backend has no set_many."""
+        set_many = getattr(self._backend, "set_many", None)
+        if set_many is None:
+            for key, value in items.items():
+                await self._backend.set(key, value, ttl)
+            return
+        await set_many(items, ttl)
+
+    async def _delete_patterns(self, patterns: list[str]) -> int:
+        """Delete by several patterns, looping if delete_patterns is missing."""
+        delete_patterns = getattr(self._backend, "delete_patterns", None)
+        if delete_patterns is None:
+            deleted = 0
+            for pattern in patterns:
+                deleted += await self._backend.delete_pattern(pattern)
+            return deleted
+        count: int = await delete_patterns(patterns)
+        return count
+
+
+def _l1_expiry(_key: str, value: tuple[bytes, float], now: float) -> float:
+    """Return when an L1 entry expires, from the TTL stored with it.
+
+    Args:
+        _key: The cache key (unused).
+        value: The cached ``(bytes, ttl seconds)`` pair.
+        now: The current cache timer value.
+
+    Returns:
+        The expiry time on the cache timer.
+    """
+    return now + value[1]
@@ -84,6 +84,22 @@ class SchemaDirectives:
 
         return None
 
+    def field_hints_by_type(self) -> dict[str, dict[str, CacheHint]]:
+        """Group the field-level hints by their parent type.
+
+        Lets callers look up every hint of a type once and then resolve
+        fields by name, instead of building a ``"Type.field"`` key per
+        field.
+
+        Returns:
+            Mapping of type name to a mapping of field name to CacheHint.
+        """
+        by_type: dict[str, dict[str, CacheHint]] = {}
+        for field_key, hint in self.field_hints.items():
+            type_name, _, field_name = field_key.partition(".")
+            by_type.setdefault(type_name, {})[field_name] = hint
+        return by_type
+
     def get_hint_for_type(self, type_name: str) -> CacheHint | None:
         """Get the cache hint for a type.
 
@@ -200,7 +216,7 @@ class DirectiveParser:
             if arg_name == "maxAge" and isinstance(arg_value, int):
                 max_age = arg_value
             elif arg_name == "scope" and isinstance(arg_value, str):
-                scope = CacheScope(arg_value.upper())
+                scope = CacheScope.from_str(arg_value)
             elif arg_name == "inheritMaxAge" and isinstance(arg_value, bool):
                 inherit_max_age = arg_value
 
@@ -15,6 +15,9 @@ from cacheql.infrastructure.key_builders.default import DefaultKeyBuilder
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# {arg_name} placeholders in custom keys and tags
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
 # Module-level cache service reference
 _cache_service: CacheService | None = None
 _key_builder: DefaultKeyBuilder | None = None
@@ -81,40 +84,47 @@ def cached(
     """
 
     def decorator(func: F) -> F:
+        # (func_name, type_name), resolved on the first call and reused
+        names: tuple[str, str] | None = None
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if _cache_service is None or _key_builder is None:
+            nonlocal names
+            # Read the module global once; reconfiguring still takes effect
+            # on the next call
+            service = _cache_service
+            if service is None or _key_builder is None:
                 # Cache not configured, execute directly
                 return await func(*args, **kwargs)
 
             # Build cache key
-            cache_key = _build_cache_key(func, args, kwargs, key)
+            if names is None:
+                names = (func.__name__, _get_type_name_from_module(func))
+            cache_key = _build_cache_key(*names, args, kwargs, key)
 
-            # Try to get from cache
-            cached_data = await _cache_service._backend.get(cache_key)
+            # Try to get from cache (batched with concurrent lookups)
+            cached_data = await service.load(cache_key)
             if cached_data is not None:
-                _cache_service._hits += 1
-                return _cache_service._serializer.deserialize(cached_data)
+                service._hits += 1
+                return service._serializer.deserialize(cached_data)
 
-            _cache_service._misses += 1
+            service._misses += 1
 
             # Execute function
             result = await func(*args, **kwargs)
 
-            # Cache result
-            effective_ttl = ttl or _cache_service.config.default_ttl
-            serialized = _cache_service._serializer.serialize(result)
-            await _cache_service._backend.set(cache_key, serialized, effective_ttl)
-
-            # Store tag mappings for invalidation
+            # Cache result and its tag mappings in one backend batch
+            effective_ttl = ttl or service.config.default_ttl
+            items = {cache_key: service._serializer.serialize(result)}
             resolved_tags = _resolve_tags(tags, args, kwargs)
             if resolved_tags:
+                # Hoisted so each tag key is a plain concatenation
+                tag_key_prefix = f"{service.config.key_prefix}:tag:"
+                tag_key_suffix = ":" + cache_key
+                encoded_key = cache_key.encode()
                 for tag in resolved_tags:
-                    prefix = _cache_service.config.key_prefix
-                    tag_key = f"{prefix}:tag:{tag}:{cache_key}"
-                    await _cache_service._backend.set(
-                        tag_key, cache_key.encode(), effective_ttl
-                    )
+                    items[tag_key_prefix + tag + tag_key_suffix] = encoded_key
+            await service._set_many(items, effective_ttl)
 
             return result
 
@@ -162,7 +172,8 @@ def invalidates(
 
 
 def _build_cache_key(
-    func: Callable[..., Any],
+    func_name: str,
+    type_name: str,
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
     custom_key: str | Callable[..., str] | None,
@@ -170,7 +181,8 @@ def _build_cache_key(
     """Build cache key for a function call.
 
     Args:
-        func: The function being cached.
+        func_name: The name of the function being cached.
+        type_name: The key namespace, derived from the function's module.
         args: Positional arguments.
         kwargs: Keyword arguments.
         custom_key: Custom key or key builder function.
@@ -187,17 +199,27 @@ def _build_cache_key(
         return _interpolate_string(custom_key, args, kwargs)
 
     # Build default key from function module, name, and arguments
-    module = func.__module__ or ""
-    func_name = func.__name__
-
     return _key_builder.build_field_key(
-        type_name=module.split(".")[-1] if module else "default",
+        type_name=type_name,
         field_name=func_name,
         args=kwargs if kwargs else None,
         parent_value=args[0] if args else None,
     )
 
 
+def _get_type_name_from_module(func: Callable[..., Any]) -> str:
+    """Derive the key namespace from the function's module.
+
+    Args:
+        func: The function being cached.
+
+    Returns:
+        The last component of the module name, or "default".
+    """
+    module = func.__module__ or ""
+    return module.split(".")[-1] if module else "default"
+
+
 def _resolve_tags(
     tags: list[str] | None,
     args: tuple[Any, ...],
@@ -216,12 +238,11 @@ def _resolve_tags(
     if not tags:
         return []
 
-    resolved: list[str] = []
-    for tag in tags:
-        resolved_tag = _interpolate_string(tag, args, kwargs)
-        resolved.append(resolved_tag)
-
-    return resolved
+    # Static tags (no placeholders) skip the interpolation call entirely
+    return [
+        _interpolate_string(tag, args, kwargs) if "{" in tag else tag
+        for tag in tags
+    ]
 
 
 def _interpolate_string(
@@ -239,7 +260,9 @@ def _interpolate_string(
     Returns:
         Interpolated string.
     """
-    pattern = r"\{(\w+)\}"
+    if "{" not in template:
+        # Static tags such as "User" need no regex pass
+        return template
 
     def replacer(match: re.Match[str]) -> str:
         name = match.group(1)
@@ -247,4 +270,4 @@ def _interpolate_string(
             return str(kwargs[name])
         return match.group(0)  # Keep original if not found
 
-    return re.sub(pattern, replacer, template)
+    return _PLACEHOLDER_RE.sub(replacer, template)
@@ -98,7 +98,7 @@ def cache_hint(
     """
     parsed_scope: CacheScope | None = None
     if scope is not None:
-        parsed_scope = CacheScope(scope.upper()) if isinstance(scope, str) else scope
+        parsed_scope = CacheScope.from_str(scope) if isinstance(scope, str) else scope
 
     return CacheHint(max_age=max_age, scope=parsed_scope)
 
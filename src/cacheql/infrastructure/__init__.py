@@ -2,10 +2,16 @@
 
 from cacheql.infrastructure.backends import InMemoryCacheBackend
 from cacheql.infrastructure.key_builders import DefaultKeyBuilder
-from cacheql.infrastructure.serializers import JsonSerializer
+from cacheql.infrastructure.serializers import (
+    JsonSerializer,
+    OrjsonSerializer,
+    ZstdSerializer,
+)
 
 __all__ = [
     "InMemoryCacheBackend",
     "DefaultKeyBuilder",
     "JsonSerializer",
+    "OrjsonSerializer",
+    "ZstdSerializer",
 ]
@@ -1,6 +1,7 @@
 """In-memory cache backend implementation."""
 
 import fnmatch
+import re
 from datetime import timedelta
 
 from cachetools import TTLCache
@@ -45,6 +46,22 @@ class InMemoryCacheBackend:
         result = self._cache.get(key)
         return result if isinstance(result, bytes) else None
 
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Retrieve several cached values.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            The cached values in the same order as ``keys``, with None for
+            keys that are missing or expired.
+        """
+        results: list[bytes | None] = []
+        for key in keys:
+            result = self._cache.get(key)
+            results.append(result if isinstance(result, bytes) else None)
+        return results
+
     async def set(
         self,
         key: str,
@@ -65,6 +82,19 @@ class InMemoryCacheBackend:
         # but we store anyway (uses global TTL)
         self._cache[key] = value
 
+    async def set_many(
+        self,
+        items: dict[str, bytes],
+        ttl: timedelta | None = None,
+    ) -> None:
+        """Store several values.
+
+        Args:
+            items: Mapping of cache key to value bytes.
+            ttl: Optional time-to-live. If None, uses default.
+        """
+        self._cache.update(items)
+
     async def delete(self, key: str) -> bool:
         """Delete cached value.
 
@@ -122,6 +152,36 @@ class InMemoryCacheBackend:
 
         return count
 
+    async def delete_patterns(self, patterns: list[str]) -> int:
+        """Delete keys matching any of the given patterns.
+
+        Patterns are combined into one regex, so each stored key is
+        tested once in a single pass instead of once per pattern.
+
+        Args:
+            patterns: Glob-style patterns to match keys.
+
+        Returns:
+            Number of keys deleted.
+        """
+        if not patterns:
+            return 0
+
+        matcher = re.compile("|".join(fnmatch.translate(p) for p in patterns))
+        keys_to_delete = [
+            key for key in list(self._cache.keys()) if matcher.match(key)
+        ]
+
+        count = 0
+        for key in keys_to_delete:
+            try:
+                del self._cache[key]
+                count += 1
+            except KeyError:
+                pass
+
+        return count
+
     def __len__(self) -> int:
         """Return the number of items in the cache."""
         return len(self._cache)
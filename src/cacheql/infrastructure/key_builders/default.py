@@ -1,7 +1,10 @@
 """Default key builder implementation."""
 
+from collections.abc import Callable
 from typing import Any
 
+from cachetools import LRUCache
+
 from cacheql.utils.hashing import hash_value, normalize_query
 
 
@@ -9,22 +12,37 @@ class DefaultKeyBuilder:
     """Default key builder using hash of query and variables.
 
     Creates deterministic cache keys from GraphQL operation parameters
-    using SHA-256 hashing.
+    using SHA-256 hashing by default. Pass ``hash_func=xxhash_value`` (from
+    ``cacheql.utils``) for a faster non-cryptographic hash; note that this
+    changes every key, so all processes sharing a cache must agree.
+
+    Query hashes are memoized per query string, so repeated documents are
+    normalized and hashed once instead of on every request.
     """
 
     def __init__(
         self,
         prefix: str = "cacheql",
         include_operation_name: bool = True,
+        hash_func: Callable[[Any], str] | None = None,
+        query_hash_cache_size: int = 1024,
     ) -> None:
         """Initialize the key builder.
 
         Args:
             prefix: Prefix for all cache keys.
             include_operation_name: Whether to include operation name in key.
+            hash_func: Optional hash function for key components.
+                Defaults to ``hash_value`` (truncated SHA-256).
+            query_hash_cache_size: Number of query hashes to memoize.
+                Pass 0 to hash every query.
         """
         self._prefix = prefix
         self._include_operation_name = include_operation_name
+        self._hash = hash_func or hash_value
+        self._query_hashes: LRUCache[str, str] | None = None
+        if query_hash_cache_size > 0:
+            self._query_hashes = LRUCache(maxsize=query_hash_cache_size)
 
     def build(
         self,
@@ -50,23 +68,38 @@ class DefaultKeyBuilder:
         if self._include_operation_name and operation_name:
             parts.append(operation_name)
 
-        # Hash normalized query
-        normalized = normalize_query(query)
-        query_hash = hash_value(normalized)
-        parts.append(f"q:{query_hash}")
+        parts.append(f"q:{self._query_hash(query)}")
 
         # Hash variables
         if variables:
-            vars_hash = hash_value(variables)
+            vars_hash = self._hash(variables)
             parts.append(f"v:{vars_hash}")
 
         # Hash context if provided
         if context:
-            ctx_hash = hash_value(context)
+            ctx_hash = self._hash(context)
             parts.append(f"c:{ctx_hash}")
 
         return ":".join(parts)
 
+    def _query_hash(self, query: str) -> str:
+        """Hash a normalized query, reusing the memoized hash if present.
+
+        Args:
+            query: The GraphQL query string.
+
+        Returns:
+            The hash of the normalized query.
+        """
+        if self._query_hashes is None:
+            return self._hash(normalize_query(query))
+
+        query_hash = self._query_hashes.get(query)
+        if query_hash is None:
+            query_hash = self._hash(normalize_query(query))
+            self._query_hashes[query] = query_hash
+        return query_hash
+
     def build_field_key(
         self,
         type_name: str,
@@ -88,7 +121,7 @@ class DefaultKeyBuilder:
         parts = [self._prefix, "field", type_name, field_name]
 
         if args:
-            args_hash = hash_value(args)
+            args_hash = self._hash(args)
             parts.append(f"a:{args_hash}")
 
         if parent_value is not None:
@@ -98,7 +131,7 @@ class DefaultKeyBuilder:
             elif isinstance(parent_value, dict) and "id" in parent_value:
                 parts.append(f"p:{parent_value['id']}")
             else:
-                parent_hash = hash_value(parent_value)
+                parent_hash = self._hash(parent_value)
                 parts.append(f"p:{parent_hash}")
 
         return ":".join(parts)
@@ -1,5 +1,7 @@
 """Serializer implementations."""
 
 from cacheql.infrastructure.serializers.json import JsonSerializer
+from cacheql.infrastructure.serializers.orjson import OrjsonSerializer
+from cacheql.infrastructure.serializers.zstd import ZstdSerializer
 
-__all__ = ["JsonSerializer"]
+__all__ = ["JsonSerializer", "OrjsonSerializer", "ZstdSerializer"]
@@ -1,9 +1,15 @@
 """JSON serializer implementation."""
 
+import codecs
 import json
 from datetime import date, datetime
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
 
 class SerializationError(Exception):
     """Raised when serialization or deserialization fails."""
@@ -16,15 +22,36 @@ class JsonSerializer:
 
     Handles serialization of Python objects to JSON bytes
     and deserialization back to Python objects.
+
+    When orjson is installed and the encoding is UTF-8, values are encoded
+    and decoded with orjson. Anything orjson rejects (e.g. integers wider
+    than 64 bits, or legacy entries containing ``NaN``) falls back to the
+    standard library, so the readable format is unchanged.
+
+    orjson writes non-finite floats (``NaN``, ``Infinity``) as ``null``,
+    where the standard library writes ``NaN``, so such values read back as
+    None. Pass ``use_orjson=False`` to keep them.
     """
 
-    def __init__(self, encoding: str = "utf-8") -> None:
+    def __init__(self, encoding: str = "utf-8", use_orjson: bool = True) -> None:
         """Initialize the JSON serializer.
 
         Args:
             encoding: Character encoding to use.
+            use_orjson: Use orjson when it is installed and the encoding
+                is UTF-8.
         """
         self._encoding = encoding
+        self._orjson = (
+            use_orjson
+            and orjson is not None
+            and codecs.lookup(encoding).name == "utf-8"
+        )
+
+    @property
+    def encoding(self) -> str:
+        """Get the character encoding of serialized values."""
+        return self._encoding
 
     def serialize(self, value: Any) -> bytes:
         """Serialize value to bytes.
@@ -38,6 +65,16 @@ class JsonSerializer:
         Raises:
             SerializationError: If the value cannot be serialized.
         """
+        if self._orjson:
+            try:
+                return orjson.dumps(
+                    value,
+                    default=self._default_encoder,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                )
+            except orjson.JSONEncodeError:
+                pass  # Retry with the standard library below
+
         try:
             json_str = json.dumps(value, default=self._default_encoder)
             return json_str.encode(self._encoding)
@@ -56,6 +93,12 @@ class JsonSerializer:
         Raises:
             SerializationError: If the data cannot be deserialized.
         """
+        if self._orjson:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # Retry with the standard library below
+
         try:
             json_str = data.decode(self._encoding)
             return json.loads(json_str)
@@ -0,0 +1,107 @@
+"""orjson serializer implementation."""
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+from cacheql.infrastructure.serializers.json import SerializationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+class OrjsonSerializer:
+    """JSON serializer backed by orjson.
+
+    Produces the same wire format as JsonSerializer, so the two can be
+    swapped on a live cache, but encodes and decodes in native code and
+    works on bytes directly without an intermediate str. Values orjson
+    rejects (integers wider than 64 bits, or entries containing ``NaN``
+    written by JsonSerializer) fall back to the standard library.
+
+    Requires the optional ``orjson`` dependency
+    (``pip install cacheql[orjson]``).
+    """
+
+    def __init__(self) -> None:
+        """Initialize the orjson serializer.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        if orjson is None:
+            raise ImportError(
+                "OrjsonSerializer requires orjson. "
+                "Install it with: pip install cacheql[orjson]"
+            )
+        # Datetimes go through the default encoder so they keep the
+        # JsonSerializer markers instead of orjson's plain ISO strings.
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def serialize(self, value: Any) -> bytes:
+        """Serialize value to bytes.
+
+        Args:
+            value: The Python object to serialize.
+
+        Returns:
+            The serialized value as bytes.
+
+        Raises:
+            SerializationError: If the value cannot be serialized.
+        """
+        try:
+            return orjson.dumps(
+                value, default=self._default_encoder, option=self._options
+            )
+        except orjson.JSONEncodeError:
+            pass  # Retry with the standard library below
+
+        try:
+            return json.dumps(value, default=self._default_encoder).encode()
+        except (TypeError, ValueError) as e:
+            raise SerializationError(f"Failed to serialize value: {e}") from e
+
+    def deserialize(self, data: bytes) -> Any:
+        """Deserialize bytes to value.
+
+        Args:
+            data: The bytes to deserialize.
+
+        Returns:
+            The deserialized Python object.
+
+        Raises:
+            SerializationError: If the data cannot be deserialized.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Retry with the standard library below
+
+        try:
+            return json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise SerializationError(f"Failed to deserialize data: {e}") from e
+
+    def _default_encoder(self, obj: Any) -> Any:
+        """Custom encoder for types orjson does not handle natively.
+
+        Args:
+            obj: The object to encode.
+
+        Returns:
+            A JSON-serializable representation of the object.
+
+        Raises:
+            TypeError: If the object cannot be encoded.
+        """
+        if isinstance(obj, datetime):
+            return {"__datetime__": obj.isoformat()}
+        if isinstance(obj, date):
+            return {"__date__": obj.isoformat()}
+        if hasattr(obj, "__dict__"):
+            return obj.__dict__
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,205 @@
+"""Zstandard-compressing serializer implementation."""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from cacheql.core.interfaces.serializer import ISerializer
+from cacheql.infrastructure.serializers.json import JsonSerializer, SerializationError
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None  # type: ignore[assignment]
+
+# One-byte header prepended to every value written by ZstdSerializer.
+# Neither byte can start a JSON document, so values written by a plain
+# JSON serializer are still recognised and read as-is.
+_RAW = b"\x00"
+_COMPRESSED = b"\x01"
+
+
+class ZstdSerializer:
+    """Serializer that compresses another serializer's output with zstd.
+
+    GraphQL responses are highly repetitive (same field names on every
+    list item), so they compress well. Small payloads are stored raw
+    because the frame overhead outweighs the savings.
+
+    Optional dictionaries, trained offline with ``train_dictionary`` on
+    sample responses, are selected by the response's root field name
+    (e.g. ``"users"`` for ``{"data": {"users": [...]}}`` as the Ariadne
+    adapter caches it, or ``{"users": [...]}`` as the Strawberry
+    extension does). The dictionary ID is embedded in each zstd frame, so
+    decompression picks the right dictionary automatically.
+
+    Requires the optional ``zstandard`` dependency
+    (``pip install cacheql[zstd]``).
+
+    Example::
+
+        dictionaries = {
+            "users": ZstdSerializer.train_dictionary(user_responses),
+            "posts": ZstdSerializer.train_dictionary(post_responses),
+        }
+        serializer = ZstdSerializer(dictionaries=dictionaries)
+    """
+
+    def __init__(
+        self,
+        inner: ISerializer | None = None,
+        level: int = 3,
+        min_size: int = 256,
+        dictionaries: Mapping[str, bytes] | None = None,
+    ) -> None:
+        """Initialize the zstd serializer.
+
+        Args:
+            inner: Serializer producing the bytes to compress.
+                Defaults to JsonSerializer.
+            level: zstd compression level.
+            min_size: Payloads smaller than this many bytes are stored
+                uncompressed.
+            dictionaries: Optional mapping of GraphQL root field name to
+                a trained zstd dictionary.
+
+        Raises:
+            ImportError: If zstandard is not installed.
+        """
+        if zstandard is None:
+            raise ImportError(
+                "ZstdSerializer requires zstandard. "
+                "Install it with: pip install cacheql[zstd]"
+            )
+
+        self._inner = inner or JsonSerializer()
+        self._min_size = min_size
+
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+        # Per-root-field compressors, plus decompressors by dictionary ID
+        self._dict_compressors: dict[str, zstandard.ZstdCompressor] = {}
+        self._dict_decompressors: dict[int, zstandard.ZstdDecompressor] = {}
+        for field_name, data in (dictionaries or {}).items():
+            zstd_dict = zstandard.ZstdCompressionDict(data)
+            self._dict_compressors[field_name] = zstandard.ZstdCompressor(
+                level=level, dict_data=zstd_dict
+            )
+            self._dict_decompressors[zstd_dict.dict_id()] = zstandard.ZstdDecompressor(
+                dict_data=zstd_dict
+            )
+
+    def serialize(self, value: Any) -> bytes:
+        """Serialize value to bytes, compressing large payloads.
+
+        Args:
+            value: The Python object to serialize.
+
+        Returns:
+            The serialized value as bytes.
+
+        Raises:
+            SerializationError: If the value cannot be serialized.
+        """
+        raw = self._inner.serialize(value)
+        if len(raw) < self._min_size:
+            return _RAW + raw
+
+        compressor = self._dict_compressors.get(_root_field(value) or "")
+        if compressor is None:
+            compressor = self._compressor
+
+        try:
+            return _COMPRESSED + compressor.compress(raw)
+        except zstandard.ZstdError as e:
+            raise SerializationError(f"Failed to compress value: {e}") from e
+
+    def deserialize(self, data: bytes) -> Any:
+        """Deserialize bytes to value, decompressing if needed.
+
+        Args:
+            data: The bytes to deserialize.
+
+        Returns:
+            The deserialized Python object.
+
+        Raises:
+            SerializationError: If the data cannot be deserialized.
+        """
+        header = data[:1]
+        if header == _RAW:
+            return self._inner.deserialize(data[1:])
+        if header != _COMPRESSED:
+            # Written without this serializer (e.g. before it was enabled)
+            return self._inner.deserialize(data)
+
+        frame = data[1:]
+        try:
+            dict_id = zstandard.get_frame_parameters(frame).dict_id
+            decompressor = self._dict_decompressors.get(dict_id) if dict_id else None
+            if dict_id and decompressor is None:
+                raise SerializationError(f"Unknown zstd dictionary id {dict_id}")
+            raw = (decompressor or self._decompressor).decompress(frame)
+        except zstandard.ZstdError as e:
+            raise SerializationError(f"Failed to decompress data: {e}") from e
+
+        return self._inner.deserialize(raw)
+
+    @staticmethod
+    def train_dictionary(
+        samples: Iterable[Any],
+        dict_size: int = 16 * 1024,
+        inner: ISerializer | None = None,
+    ) -> bytes:
+        """Train a zstd dictionary from sample values.
+
+        Intended to be run offline on a representative set of cached
+        responses for one root field; the result can be saved to a file
+        and passed to ``ZstdSerializer(dictionaries=...)``.
+
+        Args:
+            samples: Sample values (e.g. GraphQL responses) to train on.
+            dict_size: Maximum dictionary size in bytes.
+            inner: Serializer used to encode the samples. Must match the
+                serializer used at runtime. Defaults to JsonSerializer.
+
+        Returns:
+            The trained dictionary as bytes.
+
+        Raises:
+            ImportError: If zstandard is not installed.
+        """
+        if zstandard is None:
+            raise ImportError(
+                "ZstdSerializer requires zstandard. "
+                "Install it with: pip install cacheql[zstd]"
+            )
+
+        serializer = inner or JsonSerializer()
+        encoded: list[bytes | bytearray | memoryview] = [
+            serializer.serialize(sample) for sample in samples
+        ]
+        trained: bytes = zstandard.train_dictionary(dict_size, encoded).as_bytes()
+        return trained
+
+
+def _root_field(value: Any) -> str | None:
+    """Return the first root field name of a GraphQL response, if any.
+
+    Accepts both a full response (``{"data": {...}}``, cached by the
+    Ariadne adapter) and its bare data (cached by the Strawberry
+    extension).
+
+    Args:
+        value: The value being serialized.
+
+    Returns:
+        The root field name, or None if the value is not a dict.
+    """
+    if not isinstance(value, dict):
+        return None
+    data = value.get("data")
+    root = data if isinstance(data, dict) else value
+    for field_name in root:
+        return str(field_name)
+    return None
@@ -1,5 +1,7 @@
 """Utility functions for cacheql."""
 
-from cacheql.utils.hashing import hash_value
+from cacheql.utils.bloom import BloomFilter
+from cacheql.utils.hashing import hash_value, xxhash_value
+from cacheql.utils.query import is_mutation_query
 
-__all__ = ["hash_value"]
+__all__ = ["BloomFilter", "hash_value", "is_mutation_query", "xxhash_value"]
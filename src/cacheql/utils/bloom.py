@@ -0,0 +1,86 @@
+"""In-process Bloom filter for negative cache lookups."""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys.
+
+    Answers "definitely not added" or "possibly added". Used to skip
+    backend round-trips for keys that were never written. Bit positions
+    are derived from one BLAKE2b digest per key (double hashing), so a
+    lookup costs a single C-level hash regardless of the number of
+    hash functions.
+
+    Filling the filter past ``capacity`` raises the false-positive rate
+    but never produces false negatives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """Initialize the Bloom filter.
+
+        Args:
+            capacity: Expected number of distinct keys.
+            error_rate: Target false-positive rate at ``capacity`` keys.
+
+        Raises:
+            ValueError: If capacity is not positive or error_rate is not
+                between 0 and 1.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self._size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter.
+
+        Args:
+            key: The key to add.
+        """
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key may have been added.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            False if the key was definitely never added, True otherwise.
+        """
+        if not isinstance(key, str):
+            return False
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def clear(self) -> None:
+        """Remove every key from the filter."""
+        self._bits = bytearray(len(self._bits))
+
+    def _positions(self, key: str) -> list[int]:
+        """Compute the bit positions for a key.
+
+        Args:
+            key: The key to hash.
+
+        Returns:
+            The bit positions, one per hash function.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self._size
+        return [(h1 + i * h2) % size for i in range(self._hash_count)]
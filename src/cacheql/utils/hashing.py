@@ -2,8 +2,20 @@
 
 import hashlib
 import json
+import re
 from typing import Any
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - exercised only without xxhash
+    xxhash = None  # type: ignore[assignment]
+
+# A string literal (block or regular, kept as group 1) or a comment. Matching
+# strings first means a "#" inside a string is never taken for a comment.
+_COMMENT_RE = re.compile(
+    r'("""(?:\\"""|[\s\S])*?"""|"(?:\\.|[^"\\\n])*")|#[^\n\r]*'
+)
+
 
 def hash_value(value: Any) -> str:
     """Create a deterministic hash of a value.
@@ -22,11 +34,47 @@ def hash_value(value: Any) -> str:
     return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
 
+def xxhash_value(value: Any) -> str:
+    """Create a deterministic, non-cryptographic hash of a value.
+
+    Uses XXH3-128, which is much cheaper than SHA-256 while keeping
+    collisions negligible for cache keys. Strings (e.g. normalized
+    queries) are hashed directly instead of being JSON-encoded first.
+    Requires the optional ``xxhash`` dependency.
+
+    Args:
+        value: Any JSON-serializable value.
+
+    Returns:
+        A 32-character hexadecimal hash string.
+
+    Raises:
+        ImportError: If xxhash is not installed.
+    """
+    if xxhash is None:
+        raise ImportError(
+            "xxhash_value requires xxhash. "
+            "Install it with: pip install cacheql[xxhash]"
+        )
+
+    if value is None:
+        return "none"
+
+    if isinstance(value, str):
+        data = value.encode()
+    else:
+        data = json.dumps(
+            value, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+    return xxhash.xxh3_128_hexdigest(data)
+
+
 def normalize_query(query: str) -> str:
     """Normalize a GraphQL query string for consistent hashing.
 
-    Removes extra whitespace and normalizes formatting to ensure
-    equivalent queries produce the same hash.
+    Strips comments and collapses whitespace so that the same document
+    sent with different formatting produces the same hash. Comment markers
+    inside string literals are left untouched.
 
     Args:
         query: The GraphQL query string.
@@ -34,5 +82,6 @@ def normalize_query(query: str) -> str:
     Returns:
         The normalized query string.
     """
-    # Simple normalization: collapse whitespace
+    if "#" in query:
+        query = _COMMENT_RE.sub(r"\1", query)
     return " ".join(query.split())
@@ -0,0 +1,21 @@
+"""GraphQL query string helpers."""
+
+import re
+
+# Leading whitespace followed by the mutation keyword, matched in place
+_MUTATION_RE = re.compile(r"\s*mutation", re.IGNORECASE)
+
+
+def is_mutation_query(query: str) -> bool:
+    """Check whether a query string starts with the ``mutation`` keyword.
+
+    Equivalent to ``query.strip().lower().startswith("mutation")`` without
+    copying or lowercasing the whole query.
+
+    Args:
+        query: The GraphQL query string.
+
+    Returns:
+        True if the first token is ``mutation`` (case-insensitive).
+    """
+    return _MUTATION_RE.match(query) is not None
@@ -1,7 +1,8 @@
 """Integration tests for Ariadne caching components."""
 
+import json
 from datetime import timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -17,6 +18,25 @@ from cacheql.adapters.ariadne import CachingGraphQL, CachingGraphQLHTTPHandler
 pytest.importorskip("ariadne")
 
 
+def _json_request(query: str):
+    """Build a Starlette POST request carrying a GraphQL query."""
+    from starlette.requests import Request
+
+    body = json.dumps({"query": query}).encode()
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/graphql",
+        "headers": [(b"content-type", b"application/json")],
+        "query_string": b"",
+    }
+    return Request(scope, receive)
+
+
 @pytest.fixture
 def cache_service() -> CacheService:
     return CacheService(
@@ -97,6 +117,52 @@ class TestCachingGraphQLHTTPHandler:
         with pytest.raises((TypeError, AttributeError)):
             await handler.execute_graphql_query(request, data)
 
+    @pytest.mark.asyncio
+    async def test_http_hit_sends_cached_bytes(
+        self, cache_service: CacheService, handler: CachingGraphQLHTTPHandler
+    ) -> None:
+        query = "query { users { id } }"
+        await cache_service.cache_response(
+            operation_name=None,
+            query=query,
+            variables=None,
+            response={"data": {"users": [{"id": "1"}]}},
+        )
+        stored = JsonSerializer().serialize({"data": {"users": [{"id": "1"}]}})
+
+        with patch.object(
+            JsonSerializer, "deserialize", side_effect=AssertionError
+        ):
+            response = await handler.graphql_http_server(_json_request(query))
+
+        assert response.status_code == 200
+        assert response.body == stored
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == str(len(stored))
+
+    @pytest.mark.asyncio
+    async def test_http_hit_decodes_non_json_serializer(self) -> None:
+        serializer = MagicMock(wraps=JsonSerializer())
+        cache_service = CacheService(
+            backend=InMemoryCacheBackend(maxsize=100),
+            key_builder=DefaultKeyBuilder(),
+            serializer=serializer,
+        )
+        handler = CachingGraphQLHTTPHandler(cache_service=cache_service)
+        query = "query { users { id } }"
+        await cache_service.cache_response(
+            operation_name=None,
+            query=query,
+            variables=None,
+            response={"data": {"users": [{"id": "1"}]}},
+        )
+
+        response = await handler.graphql_http_server(_json_request(query))
+
+        assert response.status_code == 200
+        assert json.loads(response.body) == {"data": {"users": [{"id": "1"}]}}
+        serializer.deserialize.assert_called_once()
+
 
 class TestScopeAwareCaching:
     """Tests that session_id callback produces scope-aware cache entries."""
@@ -283,3 +349,37 @@ class TestCachingGraphQL:
         )
 
         assert app._caching_handler._debug is True
+
+    def test_installs_query_cache(self, cache_service: CacheService) -> None:
+        from ariadne import make_executable_schema
+
+        schema = make_executable_schema("type Query { hello: String }")
+
+        app = CachingGraphQL(schema, cache_service=cache_service)
+
+        assert app.query_cache is not None
+        assert app._caching_handler.query_parser == app.query_cache.parse
+        assert app._caching_handler.query_validator == app.query_cache.validate
+
+    def test_query_cache_disabled(self, cache_service: CacheService) -> None:
+        from ariadne import make_executable_schema
+
+        schema = make_executable_schema("type Query { hello: String }")
+
+        app = CachingGraphQL(schema, cache_service=cache_service, query_cache_size=0)
+
+        assert app.query_cache is None
+        assert app._caching_handler.query_parser is None
+
+    def test_custom_query_parser_is_kept(self, cache_service: CacheService) -> None:
+        from ariadne import make_executable_schema
+        from graphql import parse
+
+        schema = make_executable_schema("type Query { hello: String }")
+
+        def parser(context_value, data):
+            return parse(data["query"])
+
+        app = CachingGraphQL(schema, cache_service=cache_service, query_parser=parser)
+
+        assert app._caching_handler.query_parser is parser
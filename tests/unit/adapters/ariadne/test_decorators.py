@@ -25,9 +25,8 @@ def _make_cache_service(
     """Create a mock CacheService."""
     svc = MagicMock()
     svc.config = config or CacheConfig()
-    svc._backend = MagicMock()
-    svc._backend.get = AsyncMock(return_value=cached_data)
-    svc._backend.set = AsyncMock()
+    svc.load = AsyncMock(return_value=cached_data)
+    svc._set_many = AsyncMock()
     svc._serializer = MagicMock()
     svc._serializer.serialize.return_value = b'{"serialized": true}'
     svc._serializer.deserialize.return_value = {"deserialized": True}
@@ -91,7 +90,7 @@ class TestCachedResolver:
 
         assert result == {"id": "1", "name": "Alice"}
         resolver.assert_awaited_once()
-        svc._backend.set.assert_awaited()
+        svc._set_many.assert_awaited_once()
         svc._serializer.serialize.assert_called_once_with({"id": "1", "name": "Alice"})
 
     async def test_cache_hit_returns_cached_without_executing(self):
@@ -118,8 +117,8 @@ class TestCachedResolver:
 
         await decorated("root", "info")
 
-        set_call = svc._backend.set.call_args
-        assert set_call[0][2] == timedelta(seconds=30)
+        set_call = svc._set_many.call_args
+        assert set_call[0][1] == timedelta(seconds=30)
 
     async def test_default_ttl_used_when_no_custom_ttl(self):
         config = CacheConfig(default_ttl=timedelta(minutes=10))
@@ -132,8 +131,8 @@ class TestCachedResolver:
 
         await decorated("root", "info")
 
-        set_call = svc._backend.set.call_args
-        assert set_call[0][2] == timedelta(minutes=10)
+        set_call = svc._set_many.call_args
+        assert set_call[0][1] == timedelta(minutes=10)
 
     async def test_tags_are_stored(self):
         svc = _make_cache_service(cached_data=None)
@@ -145,8 +144,10 @@ class TestCachedResolver:
 
         await decorated("root", "info")
 
-        # backend.set is called once for data + once per tag
-        assert svc._backend.set.await_count == 2
+        # Data and tag mapping are written in a single batch
+        svc._set_many.assert_awaited_once()
+        items = svc._set_many.call_args[0][0]
+        assert len(items) == 2
 
     async def test_tags_with_interpolation(self):
         svc = _make_cache_service(cached_data=None)
@@ -158,12 +159,10 @@ class TestCachedResolver:
 
         await decorated("root", "info", id="42")
 
-        # data + 2 tags = 3 set calls
-        assert svc._backend.set.await_count == 3
-        tag_calls = svc._backend.set.call_args_list
-        # Second call should be for "User" tag, third for "User:42"
-        tag_key_2 = tag_calls[1][0][0]
-        tag_key_3 = tag_calls[2][0][0]
+        # data + 2 tags in one batch
+        svc._set_many.assert_awaited_once()
+        data_key, tag_key_2, tag_key_3 = svc._set_many.call_args[0][0]
+        assert ":tag:" not in data_key
         assert ":tag:User:" in tag_key_2
         assert ":tag:User:42:" in tag_key_3
 
@@ -177,7 +176,7 @@ class TestCachedResolver:
 
         await decorated("root", "info", id="99")
 
-        get_call = svc._backend.get.call_args[0][0]
+        get_call = svc.load.call_args[0][0]
         assert get_call == "user:99"
 
     async def test_custom_key_as_callable(self):
@@ -192,7 +191,7 @@ class TestCachedResolver:
         await decorated("root", "info", id="5")
 
         key_fn.assert_called_once_with("root", "info", id="5")
-        get_call = svc._backend.get.call_args[0][0]
+        get_call = svc.load.call_args[0][0]
         assert get_call == "custom-key-123"
 
     async def test_preserves_function_name(self):
@@ -213,8 +212,9 @@ class TestCachedResolver:
 
         await decorated("root", "info")
 
-        # Only one set call for data, no tag calls
-        assert svc._backend.set.await_count == 1
+        # Only the data key, no tag mappings
+        items = svc._set_many.call_args[0][0]
+        assert len(items) == 1
 
 
 # ── invalidates_cache ────────────────────────────────────────────────────
@@ -280,11 +280,8 @@ class TestInvalidatesCache:
 
 class TestBuildCacheKey:
     def test_raises_when_key_builder_not_configured(self):
-        def my_func():
-            pass
-
         with pytest.raises(RuntimeError, match="Cache not configured"):
-            _build_cache_key(my_func, (), {}, None)
+            _build_cache_key("my_func", "Query", (), {}, None)
 
     def test_callable_custom_key(self):
         svc = _make_cache_service()
@@ -292,7 +289,7 @@ class TestBuildCacheKey:
 
         key_fn = MagicMock(return_value="my-custom-key")
 
-        result = _build_cache_key(lambda: None, ("a", "b"), {"x": 1}, key_fn)
+        result = _build_cache_key("f", "Query", ("a", "b"), {"x": 1}, key_fn)
 
         key_fn.assert_called_once_with("a", "b", x=1)
         assert result == "my-custom-key"
@@ -301,7 +298,7 @@ class TestBuildCacheKey:
         svc = _make_cache_service()
         configure_cache(svc)
 
-        result = _build_cache_key(lambda: None, (), {"id": "42"}, "user:{id}")
+        result = _build_cache_key("f", "Query", (), {"id": "42"}, "user:{id}")
 
         assert result == "user:42"
 
@@ -309,10 +306,7 @@ class TestBuildCacheKey:
         svc = _make_cache_service()
         configure_cache(svc)
 
-        def resolve_user():
-            pass
-
-        result = _build_cache_key(resolve_user, (), {}, None)
+        result = _build_cache_key("resolve_user", "Query", (), {}, None)
 
         assert "resolve_user" in result
         assert "Query" in result
@@ -321,11 +315,8 @@ class TestBuildCacheKey:
         svc = _make_cache_service()
         configure_cache(svc)
 
-        def resolve_user():
-            pass
-
-        key_no_args = _build_cache_key(resolve_user, (), {}, None)
-        key_with_args = _build_cache_key(resolve_user, (), {"id": "1"}, None)
+        key_no_args = _build_cache_key("resolve_user", "Query", (), {}, None)
+        key_with_args = _build_cache_key("resolve_user", "Query", (), {"id": "1"}, None)
 
         assert key_no_args != key_with_args
 
@@ -333,11 +324,10 @@ class TestBuildCacheKey:
         svc = _make_cache_service()
         configure_cache(svc)
 
-        def resolve_user():
-            pass
-
-        key_no_parent = _build_cache_key(resolve_user, (), {}, None)
-        key_with_parent = _build_cache_key(resolve_user, ({"id": "1"},), {}, None)
+        key_no_parent = _build_cache_key("resolve_user", "Query", (), {}, None)
+        key_with_parent = _build_cache_key(
+            "resolve_user", "Query", ({"id": "1"},), {}, None
+        )
 
         assert key_no_parent != key_with_parent
 
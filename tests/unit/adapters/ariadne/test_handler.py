@@ -1,6 +1,7 @@
 """Unit tests for CachingGraphQLHTTPHandler."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -23,6 +24,7 @@ def _make_handler(
     svc = MagicMock()
     svc.config = CacheConfig(default_max_age=default_max_age)
     svc.get_cached_response = AsyncMock(return_value=None)
+    svc.get_cached_responses = AsyncMock(return_value=[None, None])
     svc.cache_response = AsyncMock()
 
     handler = object.__new__(CachingGraphQLHTTPHandler)
@@ -30,8 +32,12 @@ def _make_handler(
     handler._should_cache = None
     handler._session_id = session_id
     handler._set_http_headers = True
+    handler._background_writes = False
+    handler._pending_writes = set()
     handler._debug = False
+    handler._raw_hits = False
     handler._schema_directives = None
+    handler._never_cacheable = False
 
     # Mock calculator
     handler._calculator = MagicMock()
@@ -56,14 +62,31 @@ class TestGetSessionId:
         assert handler._get_session_id({"current_user_id": "42"}) is None
 
 
+class TestDebugLog:
+    def test_formats_args_when_debug(self, capsys):
+        handler = _make_handler()
+        handler._debug = True
+        handler._log("Cached public (TTL: %ss)", 300)
+        assert capsys.readouterr().out == "[CACHE] Cached public (TTL: 300s)\n"
+
+    def test_silent_without_debug(self, capsys):
+        handler = _make_handler()
+        handler._log("Cache-Control: %s", "max-age=300, public")
+        assert capsys.readouterr().out == ""
+
+
 class TestDualLookup:
     @pytest.mark.asyncio
     async def test_private_hit(self):
         """When sid is set and private cache entry exists, return it."""
         handler = _make_handler(session_id=lambda ctx: "user-1")
+        handler._cache_service.build_response_key = MagicMock(
+            side_effect=lambda op, q, v, ctx: "private" if ctx else "public"
+        )
         private_response = {"data": {"me": {"id": "1"}}}
-        handler._cache_service.get_cached_response = AsyncMock(
-            side_effect=[private_response]
+        public_response = {"data": {"me": None}}
+        handler._cache_service.get_cached_responses = AsyncMock(
+            return_value=[private_response, public_response]
         )
 
         request = MagicMock()
@@ -76,20 +99,38 @@ class TestDualLookup:
 
         assert success is True
         assert result == private_response
-        handler._cache_service.get_cached_response.assert_awaited_once_with(
-            operation_name=None,
-            query="query { me { id } }",
-            variables=None,
-            context={"session_id": "user-1"},
+        handler._cache_service.get_cached_responses.assert_awaited_once_with(
+            ["private", "public"]
         )
+        handler._cache_service.get_cached_response.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_no_session_callback_hit_skips_context_resolution(self):
+        """Without a session_id callback, a hit never builds the context."""
+        handler = _make_handler(session_id=None)
+        public_response = {"data": {"users": []}}
+        handler._cache_service.get_cached_response = AsyncMock(
+            return_value=public_response
+        )
+        handler.get_context_for_request = AsyncMock()
+
+        request = MagicMock()
+        request.state = MagicMock()
+        data = {"query": "query { users { id } }"}
+
+        success, result = await handler.execute_graphql_query(request, data)
+
+        assert success is True
+        assert result == public_response
+        handler.get_context_for_request.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_public_hit_after_private_miss(self):
-        """When sid is set but private misses, try public key."""
+        """When sid is set but private misses, use the public entry."""
         handler = _make_handler(session_id=lambda ctx: "user-1")
         public_response = {"data": {"users": [{"id": "1"}]}}
-        handler._cache_service.get_cached_response = AsyncMock(
-            side_effect=[None, public_response]
+        handler._cache_service.get_cached_responses = AsyncMock(
+            return_value=[None, public_response]
         )
 
         request = MagicMock()
@@ -102,20 +143,12 @@ class TestDualLookup:
 
         assert success is True
         assert result == public_response
-        calls = handler._cache_service.get_cached_response.call_args_list
-        assert len(calls) == 2
-        # First call: private lookup
-        assert calls[0].kwargs["context"] == {"session_id": "user-1"}
-        # Second call: public lookup
-        assert calls[1].kwargs["context"] is None
+        handler._cache_service.get_cached_responses.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_both_miss(self):
         """When both private and public miss, execute query."""
         handler = _make_handler(session_id=lambda ctx: "user-1")
-        handler._cache_service.get_cached_response = AsyncMock(
-            side_effect=[None, None]
-        )
 
         request = MagicMock()
         request.state = MagicMock()
@@ -133,7 +166,8 @@ class TestDualLookup:
             )
 
         assert success is True
-        assert handler._cache_service.get_cached_response.await_count == 2
+        assert result == executed_response[1]
+        handler._cache_service.get_cached_responses.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_no_sid_skips_private_lookup(self):
@@ -159,6 +193,7 @@ class TestDualLookup:
             query="query { users { id } }",
             variables=None,
             context=None,
+            key=ANY,
         )
 
     @pytest.mark.asyncio
@@ -184,10 +219,37 @@ class TestDualLookup:
             query="query { users { id } }",
             variables=None,
             context=None,
+            key=ANY,
         )
 
 
 class TestScopeAwareStore:
+    @pytest.mark.asyncio
+    async def test_miss_stores_with_key_built_for_lookup(self):
+        handler = _make_handler(session_id=None)
+        handler._cache_service.build_response_key = MagicMock(
+            return_value="public-key"
+        )
+
+        request = MagicMock()
+        request.state = MagicMock()
+        data = {"query": "query { users { id } }"}
+        executed_response = (True, {"data": {"users": []}})
+
+        with patch.object(
+            CachingGraphQLHTTPHandler.__bases__[0],
+            "execute_graphql_query",
+            new_callable=AsyncMock,
+            return_value=executed_response,
+        ):
+            await handler.execute_graphql_query(request, data, context_value={})
+
+        handler._cache_service.build_response_key.assert_called_once()
+        lookup_kwargs = handler._cache_service.get_cached_response.call_args.kwargs
+        store_kwargs = handler._cache_service.cache_response.call_args.kwargs
+        assert lookup_kwargs["key"] == "public-key"
+        assert store_kwargs["key"] == "public-key"
+
     @pytest.mark.asyncio
     async def test_public_scope_stores_with_no_context(self):
         handler = _make_handler(session_id=lambda ctx: "user-1")
@@ -322,3 +384,200 @@ class TestScopeAwareStore:
             )
 
         handler._cache_service.cache_response.assert_not_called()
+
+
+class TestMinQueryLength:
+    @pytest.mark.asyncio
+    async def test_short_query_skips_lookup_and_store(self):
+        from cacheql.core.entities.cache_config import CacheConfig
+
+        handler = _make_handler(session_id=None)
+        handler._cache_service.config = CacheConfig(min_query_length=100)
+
+        request = MagicMock()
+        request.state = MagicMock()
+        data = {"query": "{ me { id } }"}
+        executed_response = (True, {"data": {"me": {"id": "1"}}})
+
+        with patch.object(
+            CachingGraphQLHTTPHandler.__bases__[0],
+            "execute_graphql_query",
+            new_callable=AsyncMock,
+            return_value=executed_response,
+        ):
+            result = await handler.execute_graphql_query(
+                request, data, context_value={}
+            )
+
+        assert result == executed_response
+        handler._cache_service.get_cached_response.assert_not_called()
+        handler._cache_service.cache_response.assert_not_called()
+
+
+class TestBackgroundWrites:
+    @pytest.mark.asyncio
+    async def test_miss_returns_before_store_completes(self):
+        handler = _make_handler(session_id=None)
+        handler._background_writes = True
+        release = asyncio.Event()
+
+        async def slow_store(**kwargs):
+            await release.wait()
+
+        handler._cache_service.cache_response = AsyncMock(side_effect=slow_store)
+
+        request = MagicMock()
+        request.state = MagicMock()
+        data = {"query": "query { users { id } }"}
+        executed_response = (True, {"data": {"users": []}})
+
+        with patch.object(
+            CachingGraphQLHTTPHandler.__bases__[0],
+            "execute_graphql_query",
+            new_callable=AsyncMock,
+            return_value=executed_response,
+        ):
+            result = await handler.execute_graphql_query(
+                request, data, context_value={}
+            )
+
+        assert result == executed_response
+        assert len(handler._pending_writes) == 1
+
+        release.set()
+        await asyncio.gather(*handler._pending_writes)
+        await asyncio.sleep(0)
+
+        handler._cache_service.cache_response.assert_awaited_once()
+        assert not handler._pending_writes
+
+    @pytest.mark.asyncio
+    async def test_failed_store_is_logged(self, caplog):
+        handler = _make_handler(session_id=None)
+        handler._background_writes = True
+        handler._cache_service.cache_response = AsyncMock(
+            side_effect=ConnectionError("backend down")
+        )
+
+        request = MagicMock()
+        request.state = MagicMock()
+        data = {"query": "query { users { id } }"}
+        executed_response = (True, {"data": {"users": []}})
+
+        with patch.object(
+            CachingGraphQLHTTPHandler.__bases__[0],
+            "execute_graphql_query",
+            new_callable=AsyncMock,
+            return_value=executed_response,
+        ):
+            await handler.execute_graphql_query(request, data, context_value={})
+
+        await asyncio.gather(*handler._pending_writes, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert "Background cache write failed" in caplog.text
+        assert not handler._pending_writes
+
+
+class TestSchemaDirectivesCache:
+    def test_handlers_for_same_schema_share_parsed_directives(self):
+        from graphql import build_schema
+
+        from cacheql.core.entities.cache_config import CacheConfig
+
+        schema = build_schema("type Query { users: [String] }")
+        svc = MagicMock()
+        svc.config = CacheConfig()
+
+        with patch(
+            "cacheql.adapters.ariadne.handler.DirectiveParser.parse_schema",
+            autospec=True,
+            side_effect=lambda parser, s: MagicMock(),
+        ) as parse_schema:
+            first = CachingGraphQLHTTPHandler(svc, schema=schema)
+            second = CachingGraphQLHTTPHandler(svc, schema=schema)
+
+        parse_schema.assert_called_once()
+        assert first._schema_directives is second._schema_directives
+
+
+class TestNeverCacheable:
+    def test_detected_from_config_and_schema(self):
+        from graphql import build_schema
+
+        from cacheql.core.entities.cache_config import CacheConfig
+
+        svc = MagicMock()
+        svc.config = CacheConfig(default_max_age=0)
+        plain = build_schema("type Query { users: [String] }")
+        hinted = build_schema(
+            "directive @cacheControl(maxAge: Int) on FIELD_DEFINITION\n"
+            "type Query { users: [String] @cacheControl(maxAge: 60) }"
+        )
+
+        assert CachingGraphQLHTTPHandler(svc)._never_cacheable is True
+        assert CachingGraphQLHTTPHandler(svc, schema=plain)._never_cacheable is True
+        assert CachingGraphQLHTTPHandler(svc, schema=hinted)._never_cacheable is False
+
+        svc.config = CacheConfig(default_max_age=300)
+        assert CachingGraphQLHTTPHandler(svc)._never_cacheable is False
+
+    @pytest.mark.asyncio
+    async def test_skips_policy_walk(self):
+        handler = _make_handler()
+        handler._never_cacheable = True
+
+        request = MagicMock()
+        request.state = MagicMock()
+        data = {"query": "query { users { id } }"}
+
+        with patch.object(
+            CachingGraphQLHTTPHandler.__bases__[0],
+            "execute_graphql_query",
+            new_callable=AsyncMock,
+            return_value=(True, {"data": {"users": []}}),
+        ):
+            await handler.execute_graphql_query(request, data)
+
+        handler._calculator.calculate_policy.assert_not_called()
+        handler._cache_service.cache_response.assert_not_awaited()
+        assert request.state.cache_control_header == "no-store"
+
+
+class TestMutationDetection:
+    @pytest.mark.asyncio
+    async def test_parsed_mutation_document_skips_cache(self):
+        from graphql import parse
+
+        handler = _make_handler()
+        # The leading comment hides the keyword from a string prefix check
+        query = "# create a post\nmutation { createPost { id } }"
+        data = {"query": query}
+        executed_response = (True, {"data": {"createPost": {"id": "1"}}})
+
+        with patch.object(
+            CachingGraphQLHTTPHandler.__bases__[0],
+            "execute_graphql_query",
+            new_callable=AsyncMock,
+            return_value=executed_response,
+        ):
+            result = await handler.execute_graphql_query(
+                MagicMock(), data, context_value={}, query_document=parse(query)
+            )
+
+        assert result == executed_response
+        handler._cache_service.get_cached_response.assert_not_called()
+        handler._cache_service.cache_response.assert_not_called()
+
+    def test_document_operation_selected_by_name(self):
+        from graphql import parse
+
+        from cacheql.adapters.ariadne.handler import _is_mutation_document
+
+        document = parse(
+            "query GetPosts { posts { id } } mutation AddPost { addPost { id } }"
+        )
+
+        assert _is_mutation_document(document, "AddPost") is True
+        assert _is_mutation_document(document, "GetPosts") is False
+        assert _is_mutation_document(document, None) is True
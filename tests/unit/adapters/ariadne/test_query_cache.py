@@ -0,0 +1,78 @@
+"""Unit tests for QueryDocumentCache."""
+
+import pytest
+from graphql import GraphQLError, build_schema, specified_rules
+
+from cacheql.adapters.ariadne.query_cache import QueryDocumentCache
+
+SCHEMA = build_schema("type Query { hello: String, count: Int }")
+
+
+class TestParse:
+    def test_reuses_document_for_same_query(self):
+        cache = QueryDocumentCache()
+        first = cache.parse(None, {"query": "{ hello }"})
+        second = cache.parse(None, {"query": "{ hello }"})
+        assert first is second
+        assert len(cache) == 1
+
+    def test_different_queries_get_different_documents(self):
+        cache = QueryDocumentCache()
+        first = cache.parse(None, {"query": "{ hello }"})
+        second = cache.parse(None, {"query": "{ count }"})
+        assert first is not second
+        assert len(cache) == 2
+
+    def test_syntax_error_is_raised_and_not_cached(self):
+        cache = QueryDocumentCache()
+        with pytest.raises(GraphQLError):
+            cache.parse(None, {"query": "{ hello"})
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = QueryDocumentCache(maxsize=1)
+        first = cache.parse(None, {"query": "{ hello }"})
+        cache.parse(None, {"query": "{ count }"})
+        assert cache.parse(None, {"query": "{ hello }"}) is not first
+
+
+class TestValidate:
+    def test_valid_document(self):
+        cache = QueryDocumentCache()
+        document = cache.parse(None, {"query": "{ hello }"})
+        assert cache.validate(SCHEMA, document, rules=specified_rules) == []
+
+    def test_memoizes_validation_errors(self, monkeypatch):
+        from cacheql.adapters.ariadne import query_cache
+
+        calls = []
+        real_validate = query_cache.validate
+
+        def counting_validate(*args, **kwargs):
+            calls.append(args)
+            return real_validate(*args, **kwargs)
+
+        monkeypatch.setattr(query_cache, "validate", counting_validate)
+
+        cache = QueryDocumentCache()
+        document = cache.parse(None, {"query": "{ missing }"})
+        first = cache.validate(SCHEMA, document, rules=specified_rules)
+        second = cache.validate(SCHEMA, document, rules=specified_rules)
+
+        assert len(first) == 1
+        assert first == second
+        assert len(calls) == 1
+
+    def test_new_schema_is_revalidated(self):
+        cache = QueryDocumentCache()
+        document = cache.parse(None, {"query": "{ extra }"})
+        assert len(cache.validate(SCHEMA, document)) == 1
+
+        extended = build_schema("type Query { hello: String, extra: Int }")
+        assert cache.validate(extended, document) == []
+
+    def test_clear(self):
+        cache = QueryDocumentCache()
+        cache.parse(None, {"query": "{ hello }"})
+        cache.clear()
+        assert len(cache) == 0
@@ -1,6 +1,8 @@
 """Unit tests for Strawberry CacheExtension."""
 
+import asyncio
 import contextlib
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
@@ -8,6 +10,7 @@ import pytest
 strawberry = pytest.importorskip("strawberry")
 
 from strawberry.extensions import SchemaExtension  # noqa: E402
+from strawberry.types.graphql import OperationType  # noqa: E402
 
 from cacheql.adapters.strawberry.extension import CacheExtension  # noqa: E402
 from cacheql.core.entities.cache_config import CacheConfig  # noqa: E402
@@ -50,9 +53,14 @@ def _make_ext(
     cache_service: MagicMock,
     ctx: MagicMock,
     should_cache: object | None = None,
+    background_writes: bool = False,
 ) -> object:
     """Instantiate the inner _CacheExtension with a mocked execution_context."""
-    cls = CacheExtension(cache_service, should_cache=should_cache)
+    cls = CacheExtension(
+        cache_service,
+        should_cache=should_cache,
+        background_writes=background_writes,
+    )
     with patch.object(SchemaExtension, "__init__", return_value=None):
         ext = cls(execution_context=ctx)
     ext.execution_context = ctx
@@ -146,7 +154,7 @@ class TestCheckCache:
 
     async def test_detects_mutation_via_operation_type(self):
         svc = _make_cache_service()
-        ctx = _make_context(operation_type="MUTATION")
+        ctx = _make_context(operation_type=OperationType.MUTATION)
         ext = _make_ext(svc, ctx)
 
         await ext._check_cache()
@@ -155,7 +163,7 @@ class TestCheckCache:
 
     async def test_detects_query_via_operation_type(self):
         svc = _make_cache_service()
-        ctx = _make_context(operation_type="QUERY")
+        ctx = _make_context(operation_type=OperationType.QUERY)
         ext = _make_ext(svc, ctx)
 
         await ext._check_cache()
@@ -201,7 +209,7 @@ class TestCheckCache:
         svc = _make_cache_service(config=config)
         ctx = _make_context(
             query="mutation Foo { foo }",
-            operation_type="MUTATION",
+            operation_type=OperationType.MUTATION,
         )
         ext = _make_ext(svc, ctx)
 
@@ -218,6 +226,16 @@ class TestCheckCache:
 
         svc.get_cached_response.assert_not_called()
 
+    async def test_short_query_skips_lookup(self):
+        config = CacheConfig(min_query_length=100)
+        svc = _make_cache_service(config=config)
+        ctx = _make_context(query="{ me { id } }")
+        ext = _make_ext(svc, ctx)
+
+        await ext._check_cache()
+
+        svc.get_cached_response.assert_not_called()
+
     async def test_should_cache_none_proceeds(self):
         svc = _make_cache_service()
         ctx = _make_context()
@@ -238,6 +256,31 @@ class TestCheckCache:
         assert ext._cached_response == cached_data
         assert ctx.context["_cacheql_cached_response"] == cached_data
 
+    async def test_cache_hit_sets_attribute_on_object_context(self):
+        cached_data = {"user": {"id": "1"}}
+        svc = _make_cache_service(cached_response=cached_data)
+        context = SimpleNamespace()
+        ctx = _make_context(context=context)
+        ext = _make_ext(svc, ctx)
+
+        await ext._check_cache()
+
+        assert ext._cached_response == cached_data
+        assert context._cacheql_cached_response == cached_data
+
+    async def test_cache_hit_slotted_context_no_error(self):
+        class SlottedContext:
+            __slots__ = ("request",)
+
+        cached_data = {"user": {"id": "1"}}
+        svc = _make_cache_service(cached_response=cached_data)
+        ctx = _make_context(context=SlottedContext())
+        ext = _make_ext(svc, ctx)
+
+        await ext._check_cache()
+
+        assert ext._cached_response == cached_data
+
     async def test_cache_hit_no_context_attr_no_error(self):
         cached_data = {"user": {"id": "1"}}
         svc = _make_cache_service(cached_response=cached_data)
@@ -283,6 +326,21 @@ class TestOnExecute:
         assert ctx.result.data == {"user": {"id": "1"}}
         assert ctx.result.errors == []
 
+    async def test_cached_result_restored_after_execution(self):
+        svc = _make_cache_service()
+        ctx = _make_context()
+        ext = _make_ext(svc, ctx)
+        ext._cached_response = {"user": {"id": "1"}}
+
+        gen = ext.on_execute()
+        await gen.__anext__()
+        hit_result = ctx.result
+        ctx.result = MagicMock()
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
+
+        assert ctx.result is hit_result
+
     async def test_cached_result_has_empty_errors_list(self):
         svc = _make_cache_service()
         ctx = _make_context()
@@ -335,6 +393,19 @@ class TestCacheResponse:
         svc.invalidate.assert_not_called()
         svc.cache_response.assert_not_called()
 
+    async def test_short_query_not_cached(self):
+        config = CacheConfig(min_query_length=100)
+        svc = _make_cache_service(config=config)
+        result = MagicMock()
+        result.data = {"me": {"id": "1"}}
+        result.errors = None
+        ctx = _make_context(query="{ me { id } }", result=result)
+        ext = _make_ext(svc, ctx)
+
+        await ext._cache_response()
+
+        svc.cache_response.assert_not_called()
+
     async def test_no_result_returns_early(self):
         svc = _make_cache_service()
         ctx = _make_context(result=None)
@@ -389,6 +460,44 @@ class TestCacheResponse:
             context=None,
         )
 
+    async def test_background_write_does_not_block(self):
+        svc = _make_cache_service()
+        release = asyncio.Event()
+        stored = asyncio.Event()
+
+        async def slow_store(**kwargs):
+            await release.wait()
+            stored.set()
+
+        svc.cache_response = AsyncMock(side_effect=slow_store)
+        result = MagicMock()
+        result.errors = None
+        result.data = {"user": {"id": "1"}}
+        ctx = _make_context(result=result)
+        ext = _make_ext(svc, ctx, background_writes=True)
+
+        await ext._cache_response()
+
+        assert not stored.is_set()
+        release.set()
+        await asyncio.wait_for(stored.wait(), timeout=1)
+        svc.cache_response.assert_awaited_once()
+
+    async def test_failed_background_write_is_logged(self, caplog):
+        svc = _make_cache_service()
+        svc.cache_response = AsyncMock(side_effect=ConnectionError("down"))
+        result = MagicMock()
+        result.errors = None
+        result.data = {"user": {"id": "1"}}
+        ctx = _make_context(result=result)
+        ext = _make_ext(svc, ctx, background_writes=True)
+
+        await ext._cache_response()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert "Background cache write failed" in caplog.text
+
     async def test_result_without_data_attr_uses_result_itself(self):
         svc = _make_cache_service()
         result = MagicMock(spec=[])  # no attributes at all
@@ -407,6 +516,19 @@ class TestCacheResponse:
 
 
 class TestHandleMutationInvalidation:
+    async def test_short_query_not_cached(self):
+        config = CacheConfig(min_query_length=100)
+        svc = _make_cache_service(config=config)
+        result = MagicMock()
+        result.data = {"me": {"id": "1"}}
+        result.errors = None
+        ctx = _make_context(query="{ me { id } }", result=result)
+        ext = _make_ext(svc, ctx)
+
+        await ext._cache_response()
+
+        svc.cache_response.assert_not_called()
+
     async def test_no_result_returns_early(self):
         svc = _make_cache_service()
         ctx = _make_context(result=None)
@@ -507,6 +629,37 @@ class TestExtractTagsFromResponse:
         assert "User:1" in tags
         assert "User:2" in tags
 
+    def test_list_items_tagged_by_own_typename(self):
+        ext = self._make_ext()
+        data = {
+            "deletePosts": [
+                {"__typename": "Post", "id": "1"},
+                {"__typename": "Post", "id": "2"},
+            ]
+        }
+        tags = ext._extract_tags_from_response(data)
+        assert tags.count("Post") == 1
+        assert "Post:1" in tags
+        assert "Post:2" in tags
+
+    def test_duplicate_tags_removed(self):
+        ext = self._make_ext()
+        data = {
+            "a": {"__typename": "User", "id": "1"},
+            "b": {"__typename": "User", "id": "1"},
+        }
+        tags = ext._extract_tags_from_response(data)
+        assert sorted(tags) == ["User", "User:1"]
+
+    def test_deeply_nested_response_does_not_recurse(self):
+        ext = self._make_ext()
+        data: dict = {"__typename": "Leaf", "id": "0"}
+        for _ in range(5000):
+            data = {"child": data}
+
+        tags = ext._extract_tags_from_response(data)
+        assert tags == ["Leaf", "Leaf:0"]
+
     def test_empty_dict_returns_empty(self):
         ext = self._make_ext()
         assert ext._extract_tags_from_response({}) == []
@@ -517,6 +670,19 @@ class TestExtractTagsFromResponse:
         assert ext._extract_tags_from_response(42) == []
         assert ext._extract_tags_from_response(None) == []
 
+    def test_scalar_and_null_list_items_are_skipped(self):
+        ext = self._make_ext()
+        data = {
+            "updateUser": {
+                "__typename": "User",
+                "id": 1,
+                "roles": ["admin", "x"],
+                "friends": [None, {"__typename": "User", "id": 2}],
+            }
+        }
+        tags = ext._extract_tags_from_response(data)
+        assert tags == ["User", "User:1", "User:2"]
+
     def test_no_typename_in_value(self):
         ext = self._make_ext()
         tags = ext._extract_tags_from_response(
@@ -1,5 +1,11 @@
 """Tests for cache control entities and services."""
 
+import dataclasses
+import sys
+from typing import Any
+
+import pytest
+
 from cacheql.core.entities.cache_control import (
     CacheHint,
     CacheScope,
@@ -21,6 +27,14 @@ class TestCacheScope:
         assert CacheScope.PUBLIC.value == "PUBLIC"
         assert CacheScope.PRIVATE.value == "PRIVATE"
 
+    def test_from_str(self) -> None:
+        """Test parsing scope names case-insensitively."""
+        assert CacheScope.from_str("private") is CacheScope.PRIVATE
+        assert CacheScope.from_str("PUBLIC") is CacheScope.PUBLIC
+
+        with pytest.raises(ValueError, match="'SHARED' is not a valid CacheScope"):
+            CacheScope.from_str("shared")
+
 
 class TestCacheHint:
     """Tests for CacheHint entity."""
@@ -67,6 +81,15 @@ class TestCacheHint:
         merged = hint1.merge_with(hint2)
         assert merged.max_age == 300
 
+    def test_merge_is_shared_and_immutable(self) -> None:
+        """Test that equal merges return the same frozen instance."""
+        first = CacheHint(max_age=300).merge_with(CacheHint(max_age=60))
+        second = CacheHint(max_age=300).merge_with(CacheHint(max_age=60))
+        assert first is second
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.max_age = 10  # type: ignore[misc]
+
     def test_restrict(self) -> None:
         """Test restrict method."""
         hint = CacheHint(max_age=300, scope=CacheScope.PUBLIC)
@@ -112,6 +135,11 @@ class TestFieldCacheHint:
         )
         assert hint.source == "schema"
 
+    def test_uses_slots(self) -> None:
+        """Test that per-field hints carry no instance __dict__."""
+        hint = FieldCacheHint(path=("field",), hint=CacheHint())
+        assert not hasattr(hint, "__dict__")
+
 
 class TestResponseCachePolicy:
     """Tests for ResponseCachePolicy entity."""
@@ -135,6 +163,13 @@ class TestResponseCachePolicy:
         policy = ResponseCachePolicy(max_age=0, scope=CacheScope.PUBLIC)
         assert policy.to_http_header() == "no-store"
 
+    def test_to_http_header_is_reused(self) -> None:
+        """Test equal policies share one header string."""
+        first = ResponseCachePolicy(max_age=120, scope=CacheScope.PRIVATE)
+        second = ResponseCachePolicy(max_age=120, scope=CacheScope.PRIVATE)
+
+        assert first.to_http_header() is second.to_http_header()
+
     def test_from_hints_empty(self) -> None:
         """Test from_hints with empty list."""
         policy = ResponseCachePolicy.from_hints([])
@@ -187,6 +222,23 @@ class TestResponseCachePolicy:
         policy = ResponseCachePolicy.from_hints(hints)
         assert policy.scope == CacheScope.PRIVATE
 
+    def test_from_hints_stops_at_most_restrictive(self) -> None:
+        """Test that aggregation stops once the policy is no-store PRIVATE."""
+        hints = [
+            FieldCacheHint(
+                path=("me",),
+                hint=CacheHint(max_age=0, scope=CacheScope.PRIVATE),
+            ),
+            FieldCacheHint(
+                path=("users",),
+                hint=CacheHint(max_age=-1),
+            ),
+        ]
+        policy = ResponseCachePolicy.from_hints(hints)
+        assert policy.max_age == 0
+        assert policy.scope == CacheScope.PRIVATE
+        assert policy.field_hints is hints
+
     def test_from_hints_with_default_max_age(self) -> None:
         """Test from_hints with default_max_age."""
         hints = [
@@ -205,7 +257,8 @@ class TestCacheControlContext:
     def test_set_cache_hint(self) -> None:
         """Test setting cache hints dynamically."""
         context = CacheControlContext()
-        context._current_path = ["users", "profile"]
+        context.push_path("users")
+        context.push_path("profile")
 
         context.set_cache_hint(max_age=60, scope="PRIVATE")
 
@@ -229,6 +282,22 @@ class TestCacheControlContext:
         context.pop_path()
         assert context.current_path == ("query",)
 
+        context.pop_path()
+        context.pop_path()
+        assert context.current_path == ()
+
+    def test_hints_share_current_path(self) -> None:
+        """Test that resolver hints reuse the current path tuple."""
+        context = CacheControlContext()
+        context.push_path("users")
+        context.push_path("profile")
+
+        context.set_cache_hint(max_age=60)
+        context.set_cache_hint(scope="PRIVATE")
+
+        first, second = context.resolver_hints
+        assert first.path is second.path is context.current_path
+
 
 class TestCacheControlCalculator:
     """Tests for CacheControlCalculator."""
@@ -279,6 +348,74 @@ class TestCacheControlCalculator:
         assert policy.max_age == 60
         assert policy.scope == CacheScope.PRIVATE
 
+    def test_field_hints_resolved_by_parent_type(self) -> None:
+        """Test field, type-level and inherited hints match get_hint_for_field."""
+        directives = SchemaDirectives()
+        directives.type_hints["User"] = CacheHint(max_age=120)
+        directives.field_hints["Query.me"] = CacheHint(max_age=60)
+        directives.field_hints["User.email"] = CacheHint(
+            scope=CacheScope.PRIVATE, inherit_max_age=True
+        )
+        calculator = CacheControlCalculator(
+            default_max_age=300, schema_directives=directives
+        )
+
+        assert directives.field_hints_by_type() == {
+            "Query": {"me": directives.field_hints["Query.me"]},
+            "User": {"email": directives.field_hints["User.email"]},
+        }
+
+        data = {"me": {"__typename": "User", "name": "Bob", "email": "b@x"}}
+        hints: list[FieldCacheHint] = []
+        calculator._collect_hints_from_data(data, (), "Query", None, hints, {}, [], [])
+
+        resolved = {hint.path: hint.hint for hint in hints if hint.source == "schema"}
+        assert resolved[("me",)] == CacheHint(max_age=60)
+        assert resolved[("me", "name")] == directives.type_hints["User"]
+        assert resolved[("me", "email")] == CacheHint(
+            max_age=60, scope=CacheScope.PRIVATE
+        )
+
+    def test_calculate_policy_deeply_nested(self) -> None:
+        """Test that responses deeper than the recursion limit are walked."""
+        directives = SchemaDirectives()
+        directives.type_hints["Node"] = CacheHint(max_age=30)
+        calculator = CacheControlCalculator(
+            default_max_age=300, schema_directives=directives
+        )
+
+        data: dict[str, Any] = {"__typename": "Node", "id": "leaf"}
+        for _ in range(sys.getrecursionlimit() * 2):
+            data = {"child": [data]}
+
+        policy = calculator.calculate_policy(data)
+
+        assert policy.max_age == 30
+
+    def test_calculate_policy_without_field_hints(self) -> None:
+        """Test that skipping field hints yields the same max_age and scope."""
+        directives = SchemaDirectives()
+        directives.type_hints["User"] = CacheHint(max_age=120)
+        directives.field_hints["Query.me"] = CacheHint(
+            max_age=60, scope=CacheScope.PRIVATE
+        )
+        calculator = CacheControlCalculator(
+            default_max_age=300, schema_directives=directives
+        )
+        context = CacheControlContext()
+        context.resolver_hints.append(
+            FieldCacheHint(path=("me", "name"), hint=CacheHint(max_age=30))
+        )
+        data = {"me": {"__typename": "User", "name": "Bob"}, "stats": {}}
+
+        full = calculator.calculate_policy(data, context=context)
+        lean = calculator.calculate_policy(data, context=context, field_hints=False)
+
+        assert (full.max_age, full.scope) == (30, CacheScope.PRIVATE)
+        assert (lean.max_age, lean.scope) == (full.max_age, full.scope)
+        assert full.field_hints
+        assert lean.field_hints == []
+
     def test_calculate_from_hints_directly(self) -> None:
         """Test calculate_from_hints method."""
         calculator = CacheControlCalculator(default_max_age=300)
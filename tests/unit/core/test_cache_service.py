@@ -1,5 +1,6 @@
 """Tests for CacheService."""
 
+import asyncio
 from datetime import timedelta
 
 import pytest
@@ -69,6 +70,51 @@ class TestCacheService:
 
         assert cached is None
 
+    @pytest.mark.asyncio
+    async def test_get_cached_response_raw(self, cache_service: CacheService) -> None:
+        """Test the raw lookup returns serialized bytes and counts stats."""
+        query = "query GetUser { user { id } }"
+        response = {"data": {"user": {"id": "1"}}}
+        await cache_service.cache_response(
+            operation_name="GetUser", query=query, variables=None, response=response
+        )
+
+        raw = await cache_service.get_cached_response_raw(
+            operation_name="GetUser", query=query, variables=None
+        )
+        missing = await cache_service.get_cached_response_raw(
+            operation_name="Other", query=query, variables=None
+        )
+
+        assert raw == JsonSerializer().serialize(response)
+        assert missing is None
+        assert cache_service.stats == {"hits": 1, "misses": 1, "total": 2}
+
+    @pytest.mark.asyncio
+    async def test_prebuilt_key_reused_for_store_and_lookup(
+        self, cache_service: CacheService
+    ) -> None:
+        """Test a key from build_response_key matches the computed key."""
+        query = "query GetUser { user { id } }"
+        response = {"data": {"user": {"id": "1"}}}
+        key = cache_service.build_response_key("GetUser", query, None)
+
+        entry = await cache_service.cache_response(
+            operation_name="GetUser",
+            query=query,
+            variables=None,
+            response=response,
+            key=key,
+        )
+
+        assert entry.key == key
+        assert await cache_service.get_cached_response(
+            operation_name="GetUser", query=query, variables=None
+        ) == response
+        assert await cache_service.get_cached_response(
+            operation_name=None, query="", variables=None, key=key
+        ) == response
+
     @pytest.mark.asyncio
     async def test_different_variables_different_cache(
         self, cache_service: CacheService
@@ -279,3 +325,371 @@ class TestCacheService:
         )
 
         assert cached is None
+
+
+class TestBulkLookup:
+    """Tests for looking up several response keys at once."""
+
+    @pytest.mark.asyncio
+    async def test_get_cached_responses(self, cache_service: CacheService) -> None:
+        """Test results follow key order and count one hit or miss per key."""
+        response = {"data": {"users": []}}
+        await cache_service.cache_response(None, "{ users { id } }", None, response)
+        private_key = cache_service.build_response_key(
+            None, "{ users { id } }", None, {"session_id": "1"}
+        )
+        public_key = cache_service.build_response_key(None, "{ users { id } }", None)
+
+        results = await cache_service.get_cached_responses([private_key, public_key])
+
+        assert results == [None, response]
+        assert cache_service.stats == {"hits": 1, "misses": 1, "total": 2}
+
+    @pytest.mark.asyncio
+    async def test_get_cached_responses_raw_uses_one_backend_call(
+        self, cache_service: CacheService
+    ) -> None:
+        """Test every key is fetched in a single get_many call."""
+        calls: list[list[str]] = []
+        backend = cache_service._backend
+        original = backend.get_many
+
+        async def get_many(keys: list[str]) -> list[bytes | None]:
+            calls.append(keys)
+            return await original(keys)
+
+        backend.get_many = get_many  # type: ignore[method-assign]
+
+        results = await cache_service.get_cached_responses_raw(["a", "b"])
+
+        assert results == [None, None]
+        assert calls == [["a", "b"]]
+
+
+class TestNegativeCache:
+    """Tests for the Bloom filter negative cache."""
+
+    @pytest.fixture
+    def backend(self) -> InMemoryCacheBackend:
+        return InMemoryCacheBackend(maxsize=100)
+
+    @pytest.fixture
+    def service(self, backend: InMemoryCacheBackend) -> CacheService:
+        return CacheService(
+            backend=backend,
+            key_builder=DefaultKeyBuilder(),
+            serializer=JsonSerializer(),
+            config=CacheConfig(negative_cache_capacity=100),
+        )
+
+    @pytest.mark.asyncio
+    async def test_unwritten_key_skips_backend(
+        self, service: CacheService, backend: InMemoryCacheBackend
+    ) -> None:
+        """Test keys never cached by this service are misses without a get."""
+        key = service.build_response_key(None, "{ users { id } }", None)
+        # Written behind the service's back, so the filter has not seen it
+        await backend.set(key, b'{"data": {}}')
+
+        cached = await service.get_cached_response(
+            None, "{ users { id } }", None, key=key
+        )
+
+        assert cached is None
+        assert service.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_written_key_is_looked_up(self, service: CacheService) -> None:
+        """Test responses cached through the service are still hits."""
+        response = {"data": {"users": []}}
+        await service.cache_response(None, "{ users { id } }", None, response)
+
+        cached = await service.get_cached_response(None, "{ users { id } }", None)
+
+        assert cached == response
+        assert service.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_filter(
+        self, service: CacheService, backend: InMemoryCacheBackend
+    ) -> None:
+        """Test clear() forgets written keys along with the backend."""
+        await service.cache_response(None, "{ users { id } }", None, {"data": {}})
+        await service.clear()
+        key = service.build_response_key(None, "{ users { id } }", None)
+        await backend.set(key, b'{"data": {}}')
+
+        cached = await service.get_cached_response(None, "{ users { id } }", None)
+
+        assert cached is None
+
+
+class TestL1Cache:
+    """Tests for the in-process L1 response cache."""
+
+    @pytest.fixture
+    def backend(self) -> InMemoryCacheBackend:
+        return InMemoryCacheBackend(maxsize=100)
+
+    @pytest.fixture
+    def service(self, backend: InMemoryCacheBackend) -> CacheService:
+        return CacheService(
+            backend=backend,
+            key_builder=DefaultKeyBuilder(),
+            serializer=JsonSerializer(),
+            config=CacheConfig(l1_ttl=timedelta(seconds=30)),
+        )
+
+    @pytest.mark.asyncio
+    async def test_written_response_served_locally(
+        self, service: CacheService, backend: InMemoryCacheBackend
+    ) -> None:
+        """Test cached responses are read from L1 without the backend."""
+        response = {"data": {"users": []}}
+        await service.cache_response(None, "{ users { id } }", None, response)
+        await backend.clear()
+
+        cached = await service.get_cached_response(None, "{ users { id } }", None)
+
+        assert cached == response
+        assert service.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_backend_hit_populates_l1(
+        self, service: CacheService, backend: InMemoryCacheBackend
+    ) -> None:
+        """Test a backend hit is kept locally for the next lookup."""
+        key = service.build_response_key(None, "{ users { id } }", None)
+        await backend.set(key, b'{"data": {}}')
+
+        await service.get_cached_response_raw(None, "{ users { id } }", None)
+        await backend.clear()
+        cached = await service.get_cached_response_raw(None, "{ users { id } }", None)
+
+        assert cached == b'{"data": {}}'
+
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_l1(
+        self, service: CacheService, backend: InMemoryCacheBackend
+    ) -> None:
+        """Test invalidation drops local copies along with backend entries."""
+        await service.cache_response(
+            None, "{ users { id } }", None, {"data": {}}, tags=["User"]
+        )
+        await backend.clear()
+
+        await service.invalidate(["User"])
+        cached = await service.get_cached_response(None, "{ users { id } }", None)
+
+        assert cached is None
+
+    @pytest.mark.asyncio
+    async def test_read_during_invalidate_is_not_kept(
+        self, service: CacheService, backend: InMemoryCacheBackend
+    ) -> None:
+        """Test a read racing a slow backend delete does not refill L1."""
+        await service.cache_response(
+            "GetUser", "{ user { id } }", None, {"data": {}}, tags=["User"]
+        )
+        deleting = asyncio.Event()
+        original = backend.delete_patterns
+
+        async def slow_delete_patterns(patterns: list[str]) -> int:
+            deleting.set()
+            await asyncio.sleep(0.01)
+            return await original(patterns)
+
+        backend.delete_patterns = slow_delete_patterns  # type: ignore[method-assign]
+
+        invalidation = asyncio.ensure_future(service.invalidate(["User"]))
+        await deleting.wait()
+        # The backend still has the entry, so this read copies it into L1
+        assert await service.get_cached_response(
+            "GetUser", "{ user { id } }", None
+        ) == {"data": {}}
+        await invalidation
+
+        cached = await service.get_cached_response("GetUser", "{ user { id } }", None)
+
+        assert cached is None
+
+
+class TestBatchedLoad:
+    """Tests for coalesced raw-key lookups."""
+
+    @pytest.mark.asyncio
+    async def test_store_many_then_load(self, cache_service: CacheService) -> None:
+        """Test values stored in one batch are readable by raw key."""
+        await cache_service.store_many({"user:1": {"id": "1"}, "user:2": None})
+
+        results = await asyncio.gather(
+            cache_service.load("user:1"), cache_service.load("user:2")
+        )
+
+        assert [cache_service.serializer.deserialize(r) for r in results] == [
+            {"id": "1"},
+            None,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_use_one_get_many(
+        self, cache_service: CacheService
+    ) -> None:
+        """Test lookups in the same loop iteration share one backend call."""
+        backend = cache_service._backend
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+
+        calls: list[list[str]] = []
+        original = backend.get_many
+
+        async def tracking_get_many(keys: list[str]) -> list[bytes | None]:
+            calls.append(keys)
+            return await original(keys)
+
+        backend.get_many = tracking_get_many  # type: ignore[method-assign]
+
+        results = await asyncio.gather(
+            cache_service.load("a"),
+            cache_service.load("b"),
+            cache_service.load("a"),
+            cache_service.load("missing"),
+        )
+
+        assert results == [b"1", b"2", b"1", None]
+        assert calls == [["a", "b", "missing"]]
+
+    @pytest.mark.asyncio
+    async def test_sequential_loads_each_flush(
+        self, cache_service: CacheService
+    ) -> None:
+        """Test a later lookup starts a new batch."""
+        await cache_service._backend.set("a", b"1")
+
+        assert await cache_service.load("a") == b"1"
+        assert await cache_service.load("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_backend_error_propagates(
+        self, cache_service: CacheService
+    ) -> None:
+        """Test a failing batch raises in every waiting caller."""
+
+        async def failing_get_many(keys: list[str]) -> list[bytes | None]:
+            raise ConnectionError("backend down")
+
+        cache_service._backend.get_many = failing_get_many  # type: ignore[method-assign]
+
+        results = await asyncio.gather(
+            cache_service.load("a"),
+            cache_service.load("b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    def test_load_after_flush_cancelled_before_running(
+        self, cache_service: CacheService
+    ) -> None:
+        """Test a flush lost with its event loop does not stall later loads."""
+
+        async def start_load() -> None:
+            asyncio.create_task(cache_service.load("a"))
+            await asyncio.sleep(0)
+            # load() has queued its flush; cancel it unstarted, as loop
+            # shutdown does
+            assert cache_service._flush_task is not None
+            cache_service._flush_task.cancel()
+
+        async def load_again() -> bytes | None:
+            await cache_service._backend.set("b", b"1")
+            return await asyncio.wait_for(cache_service.load("b"), timeout=1)
+
+        asyncio.run(start_load())
+
+        assert asyncio.run(load_again()) == b"1"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_fails_waiting_loads(
+        self, cache_service: CacheService
+    ) -> None:
+        """Test cancelling an in-flight batch releases its callers."""
+        started = asyncio.Event()
+
+        async def hanging_get_many(keys: list[str]) -> list[bytes | None]:
+            started.set()
+            await asyncio.Event().wait()
+            return []
+
+        cache_service._backend.get_many = hanging_get_many  # type: ignore[method-assign]
+
+        load = asyncio.ensure_future(cache_service.load("a"))
+        await asyncio.sleep(0)
+        flush = cache_service._flush_task
+        assert flush is not None
+        await started.wait()
+        flush.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(load, timeout=1)
+
+
+class _SingleKeyBackend:
+    """Backend implementing only the original single-key methods."""
+
+    def __init__(self) -> None:
+        self._inner = InMemoryCacheBackend(maxsize=100)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._inner.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: timedelta | None = None) -> None:
+        await self._inner.set(key, value, ttl)
+
+    async def delete(self, key: str) -> bool:
+        return await self._inner.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        return await self._inner.exists(key)
+
+    async def clear(self) -> None:
+        await self._inner.clear()
+
+    async def delete_pattern(self, pattern: str) -> int:
+        return await self._inner.delete_pattern(pattern)
+
+
+class TestBackendWithoutBatchMethods:
+    """Tests for backends written before the batch methods existed."""
+
+    @pytest.fixture
+    def service(self) -> CacheService:
+        return CacheService(
+            backend=_SingleKeyBackend(),  # type: ignore[arg-type]
+            key_builder=DefaultKeyBuilder(),
+            serializer=JsonSerializer(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_lookup_and_invalidate(self, service: CacheService) -> None:
+        """Test tagged writes, bulk lookups and invalidation fall back."""
+        key = service.build_response_key("GetUser", "{ user { id } }", None)
+        await service.cache_response(
+            None, "", None, {"data": {}}, tags=["User", "User:1"], key=key
+        )
+
+        assert await service.get_cached_responses([key, "missing"]) == [
+            {"data": {}},
+            None,
+        ]
+        assert await service.invalidate(["User"]) > 0
+        assert await service.get_cached_responses([key]) == [None]
+
+    @pytest.mark.asyncio
+    async def test_store_many_and_load(self, service: CacheService) -> None:
+        """Test raw-key batches fall back to single-key calls."""
+        await service.store_many({"user:1": {"id": "1"}, "user:2": None})
+
+        results = await asyncio.gather(service.load("user:1"), service.load("user:2"))
+
+        assert results == [b'{"id":"1"}', b"null"]
@@ -60,6 +60,18 @@ class TestCacheEntry:
 
         assert entry.is_expired
 
+    def test_cache_entry_not_yet_expired(self) -> None:
+        """Test is_expired for an entry still within its TTL."""
+        recent_time = datetime.now(timezone.utc) - timedelta(minutes=4)
+        entry = CacheEntry(
+            key="test:key",
+            value="value",
+            created_at=recent_time,
+            ttl=timedelta(minutes=5),
+        )
+
+        assert not entry.is_expired
+
     def test_cache_entry_immutable(self) -> None:
         """Test that CacheEntry is immutable."""
         entry = CacheEntry.create(key="test", value="value")
@@ -105,6 +117,19 @@ class TestCacheKey:
 
         assert str(key) == "cacheql:GetUser:abc123:def456:ctx789"
 
+    def test_cache_key_str_is_reused(self) -> None:
+        """Test that the key string is built once and equality ignores it."""
+        key = CacheKey(
+            prefix="cacheql",
+            operation_name=None,
+            query_hash="abc123",
+            variables_hash="def456",
+        )
+
+        assert str(key) is str(key)
+        assert key == CacheKey("cacheql", None, "abc123", "def456")
+        assert "_str" not in repr(key)
+
 
 class TestCacheConfig:
     """Tests for CacheConfig entity."""
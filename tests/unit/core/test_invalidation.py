@@ -507,6 +507,96 @@ class TestInMemoryBackendPatternDelete:
         assert await backend.get("app:cache:post:1") is not None
         assert await backend.get("other:cache:user:1") is not None
 
+    async def test_delete_patterns_matches_any(self):
+        """Should delete keys matching any of several patterns."""
+        backend = InMemoryCacheBackend()
+
+        await backend.set("user:1", b"data1")
+        await backend.set("post:1", b"data2")
+        await backend.set("comment:1", b"data3")
+
+        count = await backend.delete_patterns(["user:*", "post:*"])
+
+        assert count == 2
+        assert await backend.get("user:1") is None
+        assert await backend.get("post:1") is None
+        assert await backend.get("comment:1") is not None
+
+    async def test_delete_patterns_overlapping(self):
+        """Should count keys matched by several patterns only once."""
+        backend = InMemoryCacheBackend()
+
+        await backend.set("user:1", b"data")
+
+        count = await backend.delete_patterns(["user:*", "*:1"])
+
+        assert count == 1
+
+    async def test_delete_patterns_empty_list(self):
+        """Should be a no-op for an empty pattern list."""
+        backend = InMemoryCacheBackend()
+        await backend.set("user:1", b"data")
+
+        count = await backend.delete_patterns([])
+
+        assert count == 0
+        assert len(backend) == 1
+
+
+class TestBatchedInvalidation:
+    """Tests for multi-tag invalidation batching."""
+
+    async def test_invalidate_uses_single_backend_batch(self):
+        """Should resolve all tags with one delete_patterns call."""
+        service, backend = create_cache_service()
+        calls: list[list[str]] = []
+        original = backend.delete_patterns
+
+        async def tracking_delete_patterns(patterns: list[str]) -> int:
+            calls.append(patterns)
+            return await original(patterns)
+
+        backend.delete_patterns = tracking_delete_patterns  # type: ignore[method-assign]
+
+        await service.invalidate(["User", "User:1", "Post"])
+
+        assert len(calls) == 1
+        assert sorted(calls[0]) == ["test:*Post*", "test:*User*"]
+
+    async def test_invalidate_dedupes_tags(self):
+        """Should send one pattern per distinct tag."""
+        service, backend = create_cache_service()
+        calls: list[list[str]] = []
+        original = backend.delete_patterns
+
+        async def tracking_delete_patterns(patterns: list[str]) -> int:
+            calls.append(patterns)
+            return await original(patterns)
+
+        backend.delete_patterns = tracking_delete_patterns  # type: ignore[method-assign]
+
+        await service.invalidate(["Post", "Post", "Comment"])
+
+        assert sorted(calls[0]) == ["test:*Comment*", "test:*Post*"]
+
+    async def test_subsumed_tag_mappings_still_invalidated(self):
+        """Tag mappings for a longer tag are removed via the shorter one."""
+        service, backend = create_cache_service()
+
+        await service.cache_response(
+            operation_name="GetUser",
+            query="query { user(id: 1) { id } }",
+            variables=None,
+            response={"data": {"user": {"id": "1"}}},
+            tags=["User:1"],
+        )
+        assert len(backend) == 2
+
+        await service.invalidate(["User", "User:1"])
+
+        # Only the response entry is left; its User:1 tag mapping is gone
+        assert len(backend) == 1
+
 
 class TestConcurrentInvalidation:
     """Tests for concurrent invalidation operations."""
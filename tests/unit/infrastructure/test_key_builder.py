@@ -146,3 +146,67 @@ class TestDefaultKeyBuilder:
         )
 
         assert "GetUser" not in key
+
+    def test_custom_hash_func(self) -> None:
+        """Test key components are hashed with the given function."""
+        key_builder = DefaultKeyBuilder(prefix="test", hash_func=lambda value: "h")
+
+        key = key_builder.build(
+            operation_name="GetUser",
+            query="query GetUser { user { id } }",
+            variables={"id": "1"},
+        )
+
+        assert key == "test:GetUser:q:h:v:h"
+
+    def test_query_hash_memoized(self) -> None:
+        """Test each distinct query is hashed once, with unchanged keys."""
+        hashed: list[object] = []
+
+        def hash_func(value: object) -> str:
+            hashed.append(value)
+            return "h"
+
+        key_builder = DefaultKeyBuilder(prefix="test", hash_func=hash_func)
+        query = "query GetUser { user { id } }"
+
+        key1 = key_builder.build("GetUser", query, None)
+        key2 = key_builder.build("GetUser", query, None, {"session_id": "1"})
+
+        assert key1 == "test:GetUser:q:h"
+        assert key2 == "test:GetUser:q:h:c:h"
+        assert hashed.count(query) == 1
+
+    def test_query_hash_cache_disabled(self) -> None:
+        """Test query_hash_cache_size=0 hashes the query on every build."""
+        hashed: list[object] = []
+
+        def hash_func(value: object) -> str:
+            hashed.append(value)
+            return "h"
+
+        key_builder = DefaultKeyBuilder(
+            prefix="test", hash_func=hash_func, query_hash_cache_size=0
+        )
+        query = "query GetUser { user { id } }"
+
+        key_builder.build(None, query, None)
+        key_builder.build(None, query, None)
+
+        assert hashed.count(query) == 2
+
+    def test_xxhash_func(self) -> None:
+        """Test building keys with the xxhash hash function."""
+        pytest.importorskip("xxhash")
+        from cacheql.utils import xxhash_value
+
+        key_builder = DefaultKeyBuilder(prefix="test", hash_func=xxhash_value)
+        query = "query GetUser { user { id } }"
+
+        key1 = key_builder.build(None, query, {"id": "1", "x": 2})
+        key2 = key_builder.build(None, query, {"x": 2, "id": "1"})
+        key3 = key_builder.build(None, query, {"id": "2", "x": 2})
+
+        assert key1 == key2
+        assert key1 != key3
+        assert len(key1.split(":q:")[1].split(":")[0]) == 32
@@ -28,6 +28,23 @@ class TestInMemoryCacheBackend:
         result = await backend.get("nonexistent")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_many(self, backend: InMemoryCacheBackend) -> None:
+        """Test getting several keys preserves order and reports misses."""
+        await backend.set("key1", b"value1")
+        await backend.set("key3", b"value3")
+
+        result = await backend.get_many(["key3", "key2", "key1"])
+
+        assert result == [b"value3", None, b"value1"]
+
+    @pytest.mark.asyncio
+    async def test_set_many(self, backend: InMemoryCacheBackend) -> None:
+        """Test storing several keys at once."""
+        await backend.set_many({"key1": b"value1", "key2": b"value2"})
+
+        assert await backend.get_many(["key1", "key2"]) == [b"value1", b"value2"]
+
     @pytest.mark.asyncio
     async def test_delete(self, backend: InMemoryCacheBackend) -> None:
         """Test deleting a key."""
@@ -85,6 +102,19 @@ class TestInMemoryCacheBackend:
         assert await backend.get("post:1") == b"hello"
         assert await backend.get("post:2") == b"world"
 
+    @pytest.mark.asyncio
+    async def test_delete_patterns(self, backend: InMemoryCacheBackend) -> None:
+        """Test deleting keys matching any of several patterns."""
+        await backend.set("user:1", b"alice")
+        await backend.set("user:2", b"bob")
+        await backend.set("post:1", b"hello")
+        await backend.set("comment:1", b"nice")
+
+        # Overlapping patterns delete each key once
+        deleted = await backend.delete_patterns(["user:*", "*:1", "post:?"])
+        assert deleted == 4
+        assert len(backend) == 0
+
     @pytest.mark.asyncio
     async def test_set_with_ttl(self, backend: InMemoryCacheBackend) -> None:
         """Test setting a key with custom TTL."""
@@ -0,0 +1,102 @@
+"""Tests for OrjsonSerializer."""
+
+import math
+from datetime import date, datetime
+
+import pytest
+
+pytest.importorskip("orjson")
+
+from cacheql.infrastructure.serializers.json import (  # noqa: E402
+    JsonSerializer,
+    SerializationError,
+)
+from cacheql.infrastructure.serializers.orjson import OrjsonSerializer  # noqa: E402
+
+
+class TestOrjsonSerializer:
+    """Tests for OrjsonSerializer."""
+
+    @pytest.fixture
+    def serializer(self) -> OrjsonSerializer:
+        """Create a serializer for testing."""
+        return OrjsonSerializer()
+
+    def test_serialize_returns_bytes(self, serializer: OrjsonSerializer) -> None:
+        """Test serializing a dictionary returns bytes."""
+        result = serializer.serialize({"name": "Alice", "age": 30})
+
+        assert isinstance(result, bytes)
+        assert b"Alice" in result
+
+    def test_roundtrip(self, serializer: OrjsonSerializer) -> None:
+        """Test serialization roundtrip."""
+        original = {
+            "data": {
+                "users": [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}],
+                "count": 2,
+                "ok": True,
+                "missing": None,
+            }
+        }
+
+        assert serializer.deserialize(serializer.serialize(original)) == original
+
+    def test_datetime_matches_json_serializer(
+        self, serializer: OrjsonSerializer
+    ) -> None:
+        """Test datetimes use the same markers as JsonSerializer."""
+        data = {"timestamp": datetime(2024, 1, 15, 10, 30, 0), "day": date(2024, 1, 15)}
+
+        result = serializer.deserialize(serializer.serialize(data))
+
+        assert result == JsonSerializer().deserialize(JsonSerializer().serialize(data))
+        assert "__datetime__" in result["timestamp"]
+        assert "__date__" in result["day"]
+
+    def test_reads_json_serializer_output(self, serializer: OrjsonSerializer) -> None:
+        """Test entries written by JsonSerializer can be read back."""
+        data = {"data": {"post": {"id": "1", "title": "Hello"}}}
+
+        assert serializer.deserialize(JsonSerializer().serialize(data)) == data
+
+    def test_reads_json_serializer_nan(self, serializer: OrjsonSerializer) -> None:
+        """Test NaN written by the stdlib JsonSerializer is still readable."""
+        legacy = JsonSerializer(use_orjson=False).serialize({"x": float("nan")})
+
+        result = serializer.deserialize(legacy)
+
+        assert math.isnan(result["x"])
+
+    def test_wide_integer_roundtrip(self, serializer: OrjsonSerializer) -> None:
+        """Test integers wider than 64 bits fall back to the stdlib."""
+        data = {"big": 2**70}
+
+        encoded = serializer.serialize(data)
+
+        assert serializer.deserialize(encoded) == data
+        assert JsonSerializer().deserialize(encoded) == data
+
+    def test_non_string_keys(self, serializer: OrjsonSerializer) -> None:
+        """Test non-string dict keys are stringified like stdlib json."""
+        assert serializer.deserialize(serializer.serialize({1: "a"})) == {"1": "a"}
+
+    def test_object_with_dict(self, serializer: OrjsonSerializer) -> None:
+        """Test objects are encoded through their __dict__."""
+
+        class Point:
+            def __init__(self) -> None:
+                self.x = 1
+                self.y = 2
+
+        assert serializer.deserialize(serializer.serialize(Point())) == {"x": 1, "y": 2}
+
+    def test_deserialize_invalid_json(self, serializer: OrjsonSerializer) -> None:
+        """Test deserializing invalid JSON raises error."""
+        with pytest.raises(SerializationError):
+            serializer.deserialize(b"not valid json")
+
+    def test_serialize_non_serializable(self, serializer: OrjsonSerializer) -> None:
+        """Test serializing unsupported objects raises error."""
+        with pytest.raises(SerializationError):
+            serializer.serialize({"value": object()})
@@ -122,3 +122,45 @@ class TestJsonSerializer:
         deserialized = serializer.deserialize(result)
 
         assert deserialized == data
+
+    def test_stdlib_output_when_orjson_disabled(self) -> None:
+        """Test use_orjson=False keeps the standard library encoder."""
+        serializer = JsonSerializer(use_orjson=False)
+
+        assert serializer.serialize({"name": "Alice"}) == b'{"name": "Alice"}'
+
+    def test_orjson_output_when_available(self) -> None:
+        """Test orjson is used for UTF-8 when installed."""
+        pytest.importorskip("orjson")
+        serializer = JsonSerializer()
+
+        assert serializer.serialize({"name": "Alice", 1: "a"}) == (
+            b'{"name":"Alice","1":"a"}'
+        )
+
+    def test_falls_back_for_values_orjson_rejects(
+        self, serializer: JsonSerializer
+    ) -> None:
+        """Test integers wider than 64 bits still serialize."""
+        data = {"big": 2**70}
+
+        assert serializer.deserialize(serializer.serialize(data)) == data
+
+    def test_reads_legacy_nan(self, serializer: JsonSerializer) -> None:
+        """Test entries written by the stdlib encoder with NaN are readable."""
+        result = serializer.deserialize(b'{"value": NaN}')
+
+        assert result["value"] != result["value"]
+
+    def test_orjson_writes_non_finite_floats_as_null(self) -> None:
+        """Test NaN and Infinity become null with orjson, NaN without."""
+        pytest.importorskip("orjson")
+        data = {"nan": float("nan"), "inf": float("inf")}
+
+        assert JsonSerializer().deserialize(JsonSerializer().serialize(data)) == {
+            "nan": None,
+            "inf": None,
+        }
+        assert JsonSerializer(use_orjson=False).serialize(data) == (
+            b'{"nan": NaN, "inf": Infinity}'
+        )
@@ -0,0 +1,112 @@
+"""Tests for ZstdSerializer."""
+
+import pytest
+
+pytest.importorskip("zstandard")
+
+from cacheql.infrastructure.serializers.json import (  # noqa: E402
+    JsonSerializer,
+    SerializationError,
+)
+from cacheql.infrastructure.serializers.zstd import ZstdSerializer  # noqa: E402
+
+
+def _users_response(count: int, offset: int = 0) -> dict:
+    return {
+        "data": {
+            "users": [
+                {"id": str(i), "name": f"User {i}", "email": f"user{i}@example.com"}
+                for i in range(offset, offset + count)
+            ]
+        }
+    }
+
+
+class TestZstdSerializer:
+    """Tests for ZstdSerializer."""
+
+    @pytest.fixture
+    def serializer(self) -> ZstdSerializer:
+        """Create a serializer for testing."""
+        return ZstdSerializer()
+
+    def test_small_payload_stored_raw(self, serializer: ZstdSerializer) -> None:
+        """Test payloads below min_size are not compressed."""
+        data = {"data": {"user": {"id": "1"}}}
+
+        result = serializer.serialize(data)
+
+        assert result == b"\x00" + JsonSerializer().serialize(data)
+        assert serializer.deserialize(result) == data
+
+    def test_large_payload_compressed(self, serializer: ZstdSerializer) -> None:
+        """Test large repetitive payloads are compressed and round-trip."""
+        data = _users_response(100)
+        raw = JsonSerializer().serialize(data)
+
+        result = serializer.serialize(data)
+
+        assert result[:1] == b"\x01"
+        assert len(result) < len(raw) / 3
+        assert serializer.deserialize(result) == data
+
+    def test_reads_uncompressed_legacy_entries(
+        self, serializer: ZstdSerializer
+    ) -> None:
+        """Test values written by a plain JSON serializer are still readable."""
+        data = _users_response(3)
+
+        assert serializer.deserialize(JsonSerializer().serialize(data)) == data
+
+    def test_dictionary_selected_by_root_field(self) -> None:
+        """Test a trained dictionary is used for its root field."""
+        samples = [_users_response(5, offset=i * 5) for i in range(200)]
+        dictionary = ZstdSerializer.train_dictionary(samples, dict_size=4096)
+
+        plain = ZstdSerializer(min_size=0)
+        with_dict = ZstdSerializer(min_size=0, dictionaries={"users": dictionary})
+        data = _users_response(2, offset=5000)
+
+        compressed = with_dict.serialize(data)
+
+        assert len(compressed) < len(plain.serialize(data))
+        assert with_dict.deserialize(compressed) == data
+        # Other root fields fall back to the dictionary-less compressor
+        other = {"data": {"posts": [{"id": "1"}]}}
+        assert with_dict.deserialize(with_dict.serialize(other)) == other
+
+    def test_dictionary_selected_for_bare_data(self) -> None:
+        """Test the dictionary also applies to Strawberry-cached data."""
+        samples = [_users_response(5, offset=i * 5) for i in range(200)]
+        dictionary = ZstdSerializer.train_dictionary(samples, dict_size=4096)
+
+        plain = ZstdSerializer(min_size=0)
+        with_dict = ZstdSerializer(min_size=0, dictionaries={"users": dictionary})
+        # The Strawberry extension caches result.data without the wrapper
+        data = _users_response(2, offset=5000)["data"]
+
+        compressed = with_dict.serialize(data)
+
+        assert len(compressed) < len(plain.serialize(data))
+        assert with_dict.deserialize(compressed) == data
+
+    def test_unknown_dictionary_raises(self) -> None:
+        """Test data compressed with a missing dictionary raises an error."""
+        samples = [_users_response(5, offset=i * 5) for i in range(200)]
+        dictionary = ZstdSerializer.train_dictionary(samples, dict_size=4096)
+        writer = ZstdSerializer(min_size=0, dictionaries={"users": dictionary})
+
+        with pytest.raises(SerializationError):
+            ZstdSerializer().deserialize(writer.serialize(_users_response(2)))
+
+    def test_corrupt_frame_raises(self, serializer: ZstdSerializer) -> None:
+        """Test a corrupt compressed frame raises SerializationError."""
+        with pytest.raises(SerializationError):
+            serializer.deserialize(b"\x01not a zstd frame")
+
+    def test_custom_inner_serializer(self) -> None:
+        """Test the wrapped serializer is used for encoding."""
+        serializer = ZstdSerializer(inner=JsonSerializer(encoding="utf-16"))
+        data = _users_response(50)
+
+        assert serializer.deserialize(serializer.serialize(data)) == data
@@ -89,7 +89,7 @@ class TestSetCacheHint:
     def test_set_hint_success(self) -> None:
         """Test setting cache hint successfully."""
         cache_control = CacheControlContext()
-        cache_control._current_path = ["users"]
+        cache_control.push_path("users")
 
         info = MagicMock()
         info.context = {CACHE_CONTROL_CONTEXT_KEY: cache_control}
@@ -118,7 +118,7 @@ class TestNoCacheHelper:
     def test_no_cache_sets_max_age_zero(self) -> None:
         """Test no_cache sets maxAge to 0."""
         cache_control = CacheControlContext()
-        cache_control._current_path = ["sensitive"]
+        cache_control.push_path("sensitive")
 
         info = MagicMock()
         info.context = {CACHE_CONTROL_CONTEXT_KEY: cache_control}
@@ -0,0 +1,95 @@
+"""Tests for cacheql.utils query helpers."""
+
+import pytest
+
+from cacheql.utils import BloomFilter, is_mutation_query
+from cacheql.utils.hashing import normalize_query
+
+
+class TestIsMutationQuery:
+    """Tests for is_mutation_query."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "mutation { deletePost(id: 1) }",
+            "  \n\tmutation DeletePost { deletePost(id: 1) }",
+            "MUTATION { deletePost(id: 1) }",
+            "Mutation{deletePost(id: 1)}",
+        ],
+    )
+    def test_detects_mutations(self, query: str) -> None:
+        assert is_mutation_query(query) is True
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "",
+            "{ users { id } }",
+            "query GetUsers { users { id } }",
+            "query { mutationLog { id } }",
+            "subscription { postAdded { id } }",
+        ],
+    )
+    def test_ignores_other_operations(self, query: str) -> None:
+        assert is_mutation_query(query) is False
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter."""
+
+    def test_added_keys_are_always_found(self) -> None:
+        bloom = BloomFilter(capacity=1000)
+        keys = [f"cacheql:q:{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate_near_target(self) -> None:
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"added:{i}")
+
+        false_positives = sum(f"other:{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_clear(self) -> None:
+        bloom = BloomFilter(capacity=10)
+        bloom.add("key")
+        bloom.clear()
+
+        assert "key" not in bloom
+
+    @pytest.mark.parametrize(
+        ("capacity", "error_rate"), [(0, 0.01), (10, 0.0), (10, 1.0)]
+    )
+    def test_rejects_invalid_arguments(
+        self, capacity: int, error_rate: float
+    ) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
+
+
+class TestNormalizeQuery:
+    """Tests for normalize_query."""
+
+    def test_formatting_variants_match(self) -> None:
+        compact = "query { user(id: 1) { id name } }"
+        formatted = """
+            # Fetch the user
+            query {
+              user(id: 1) {  # by id
+                id
+                name
+              }
+            }
+        """
+        assert normalize_query(formatted) == normalize_query(compact)
+
+    def test_hash_inside_strings_kept(self) -> None:
+        assert normalize_query('{ tag(name: "#python") }  # c') == (
+            '{ tag(name: "#python") }'
+        )
+        assert normalize_query('{ f(s: "a \\" # b") }') == '{ f(s: "a \\" # b") }'
+        assert normalize_query('{ f(s: """x # y""") }') == '{ f(s: """x # y""") }'